@@ -0,0 +1,57 @@
+"""add trace and observation counters
+
+Revision ID: 4b7e2d9a1c05
+Revises: c3388c3286e9
+Create Date: 2026-10-16 11:05:42.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2d9a1c05'
+down_revision: Union[str, None] = 'c3388c3286e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('traces', sa.Column('observation_count', sa.Integer(), server_default='0', nullable=False, comment='Number of observations in this trace'))
+    op.add_column('observations', sa.Column('child_count', sa.Integer(), server_default='0', nullable=False, comment='Number of child observations'))
+
+    # Backfill counters for existing rows
+    op.execute(
+        """
+        UPDATE traces
+        SET observation_count = counts.observation_count
+        FROM (
+            SELECT trace_id, count(*) AS observation_count
+            FROM observations
+            GROUP BY trace_id
+        ) AS counts
+        WHERE traces.id = counts.trace_id
+        """
+    )
+    op.execute(
+        """
+        UPDATE observations
+        SET child_count = counts.child_count
+        FROM (
+            SELECT parent_observation_id, count(*) AS child_count
+            FROM observations
+            WHERE parent_observation_id IS NOT NULL
+            GROUP BY parent_observation_id
+        ) AS counts
+        WHERE observations.id = counts.parent_observation_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('observations', 'child_count')
+    op.drop_column('traces', 'observation_count')
@@ -0,0 +1,56 @@
+"""include filter columns in trace and observation keyset indexes
+
+Revision ID: 7c2e5b8d1f64
+Revises: e5a0c8f2d413
+Create Date: 2026-10-16 14:08:23.517390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e5b8d1f64'
+down_revision: Union[str, None] = 'e5a0c8f2d413'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('traces_agent_started_id_idx', table_name='traces')
+    op.create_index(
+        'traces_agent_started_id_idx',
+        'traces',
+        ['agent_id', 'started_at', 'id'],
+        unique=False,
+        postgresql_include=['status'],
+    )
+    op.drop_index('observations_trace_started_id_idx', table_name='observations')
+    op.create_index(
+        'observations_trace_started_id_idx',
+        'observations',
+        ['trace_id', 'started_at', 'id'],
+        unique=False,
+        postgresql_include=['type'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('observations_trace_started_id_idx', table_name='observations')
+    op.create_index(
+        'observations_trace_started_id_idx',
+        'observations',
+        ['trace_id', 'started_at', 'id'],
+        unique=False,
+    )
+    op.drop_index('traces_agent_started_id_idx', table_name='traces')
+    op.create_index(
+        'traces_agent_started_id_idx',
+        'traces',
+        ['agent_id', 'started_at', 'id'],
+        unique=False,
+    )
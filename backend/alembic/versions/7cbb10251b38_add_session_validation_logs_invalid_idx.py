@@ -0,0 +1,38 @@
+"""add session validation logs invalid idx
+
+Revision ID: 7cbb10251b38
+Revises: d212f974c4b0
+Create Date: 2026-10-16 09:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7cbb10251b38'
+down_revision: Union[str, None] = 'd212f974c4b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'session_validation_logs_invalid_session_id_idx',
+        'session_validation_logs',
+        ['session_id'],
+        unique=False,
+        postgresql_where=sa.text("(log_data ->> 'should_proceed')::boolean IS FALSE"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'session_validation_logs_invalid_session_id_idx',
+        table_name='session_validation_logs',
+        postgresql_where=sa.text("(log_data ->> 'should_proceed')::boolean IS FALSE"),
+    )
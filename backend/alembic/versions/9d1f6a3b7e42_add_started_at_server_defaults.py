@@ -0,0 +1,30 @@
+"""add started_at server defaults to traces and observations
+
+Revision ID: 9d1f6a3b7e42
+Revises: 4b7e2d9a1c05
+Create Date: 2026-10-16 11:24:08.903517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d1f6a3b7e42'
+down_revision: Union[str, None] = '4b7e2d9a1c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('traces', 'started_at', server_default=sa.text('now()'))
+    op.alter_column('observations', 'started_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('observations', 'started_at', server_default=None)
+    op.alter_column('traces', 'started_at', server_default=None)
@@ -0,0 +1,43 @@
+"""add session created_at composite indexes
+
+Revision ID: c3388c3286e9
+Revises: 7cbb10251b38
+Create Date: 2026-10-16 10:02:17.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3388c3286e9'
+down_revision: Union[str, None] = '7cbb10251b38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'sessions_agent_created_at_idx',
+        'sessions',
+        ['agent_id', 'created_at'],
+        unique=False,
+    )
+    op.create_index(
+        'session_validation_logs_session_created_at_idx',
+        'session_validation_logs',
+        ['session_id', 'created_at'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'session_validation_logs_session_created_at_idx',
+        table_name='session_validation_logs',
+    )
+    op.drop_index('sessions_agent_created_at_idx', table_name='sessions')
@@ -0,0 +1,54 @@
+"""add (started_at, id) keyset indexes for traces and observations
+
+Revision ID: e5a0c8f2d413
+Revises: 9d1f6a3b7e42
+Create Date: 2026-10-16 11:41:55.127604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a0c8f2d413'
+down_revision: Union[str, None] = '9d1f6a3b7e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'traces_agent_started_id_idx',
+        'traces',
+        ['agent_id', 'started_at', 'id'],
+        unique=False,
+    )
+    op.drop_index('traces_agent_started_idx', table_name='traces')
+    op.create_index(
+        'observations_trace_started_id_idx',
+        'observations',
+        ['trace_id', 'started_at', 'id'],
+        unique=False,
+    )
+    op.drop_index('observations_trace_started_idx', table_name='observations')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'observations_trace_started_idx',
+        'observations',
+        ['trace_id', 'started_at'],
+        unique=False,
+    )
+    op.drop_index('observations_trace_started_id_idx', table_name='observations')
+    op.create_index(
+        'traces_agent_started_idx',
+        'traces',
+        ['agent_id', 'started_at'],
+        unique=False,
+    )
+    op.drop_index('traces_agent_started_id_idx', table_name='traces')
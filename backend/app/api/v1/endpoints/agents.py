@@ -8,7 +8,7 @@ and API key management.
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import require_organization_member
@@ -327,6 +327,8 @@ async def list_agent_sessions(
 async def get_agent_session_detail(
     agent_id: UUID,
     session_id: UUID,
+    history_page: int = Query(1, ge=1),
+    history_page_size: int = Query(1000, ge=1, le=1000),
     current_user: dict = Depends(require_organization_member),
     db: AsyncSession = Depends(get_async_db),
 ) -> Any:
@@ -339,6 +341,8 @@ async def get_agent_session_detail(
     Args:
         agent_id: Agent UUID
         session_id: Session UUID
+        history_page: Validation history page number (1-indexed)
+        history_page_size: Validation history entries per page (max 1000)
         current_user: Current authenticated user (from JWT)
         db: Database session
 
@@ -371,4 +375,8 @@ async def get_agent_session_detail(
             detail="Session not found for this agent",
         )
 
-    return await session_service.get_session_detail_for_dashboard(session_id)
+    return await session_service.get_session_detail_for_dashboard(
+        session_id,
+        history_page=history_page,
+        history_page_size=history_page_size,
+    )
@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_agent_from_api_key
-from app.core.database import get_async_db
+from app.core.database import get_async_db, get_async_db_transaction
 from app.schemas.safety import (
     AlignmentRequest,
     AlignmentResponse,
@@ -53,7 +53,7 @@ def _extract_tool_name(recipient_name: str) -> str:
 async def register_tools(
     request: ToolRegistrationRequest,
     agent: dict = Depends(get_current_agent_from_api_key),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_db_transaction, scope="function"),
 ) -> Any:
     """
     Register AI agent tool definitions.
@@ -149,7 +149,7 @@ async def register_tools(
 async def alignment_session(
     request: AlignmentRequest,
     agent: dict = Depends(get_current_agent_from_api_key),
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_async_db_transaction, scope="function"),
 ):
     """Align a session
 
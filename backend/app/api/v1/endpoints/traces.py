@@ -16,6 +16,7 @@ from app.core.auth import get_current_user_or_agent
 from app.core.database import get_async_db
 from app.repositories.project_member_repository import ProjectMemberRepository
 from app.schemas.trace import (
+    ObservationBatchCreate,
     ObservationCreate,
     ObservationResponse,
     ObservationTreeResponse,
@@ -34,7 +35,7 @@ async def verify_trace_access(
     trace_id: UUID,
     current_auth: dict,
     db: AsyncSession,
-) -> None:
+) -> dict[str, Any]:
     """
     Verify that user/agent has access to a trace.
 
@@ -43,29 +44,35 @@ async def verify_trace_access(
         current_auth: Current authenticated user or agent
         db: Database session
 
+    Returns:
+        Trace data, so callers need not load the trace again
+
     Raises:
-        HTTPException: 403 if no access
+        HTTPException: 404 if not found, 403 if no access
     """
     trace_service = TraceService(db)
-    trace = await trace_service.get_trace(trace_id)
 
     if current_auth["type"] == "user":
-        # User must be project member
-        user_id = UUID(current_auth["id"])
-        member_repo = ProjectMemberRepository(db)
-        is_member = await member_repo.is_member(UUID(trace["project_id"]), user_id)
+        # User must be project member; checked in the same query as the trace
+        trace, is_member = await trace_service.get_trace_with_membership(
+            trace_id, UUID(current_auth["id"])
+        )
         if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="User must be project member to access trace",
             )
-    elif current_auth["type"] == "agent":
+        return trace
+
+    trace = await trace_service.get_trace(trace_id)
+    if current_auth["type"] == "agent":
         # Agent must own the trace
-        if current_auth["agent_id"] != trace["agent_id"]:
+        if current_auth["agent_id"] != str(trace["agent_id"]):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Agent can only access its own traces",
             )
+    return trace
 
 
 @router.get("/agents/{agent_id}/traces", response_model=TraceListResponse)
@@ -78,6 +85,8 @@ async def list_traces(
     ),
     start_date: datetime | None = None,
     end_date: datetime | None = None,
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Also count matching traces"),
     current_auth: dict = Depends(get_current_user_or_agent),
     db: AsyncSession = Depends(get_async_db),
 ) -> Any:
@@ -91,6 +100,8 @@ async def list_traces(
         status: Filter by status
         start_date: Filter traces started after this date
         end_date: Filter traces started before this date
+        cursor: Keyset pagination cursor (replaces page when given)
+        include_total: Whether to return total (cached briefly)
         current_auth: Current authenticated user or agent
         db: Database session
 
@@ -100,20 +111,22 @@ async def list_traces(
     Note:
         - JWT users must be project member
         - API key must belong to the agent
+        - Prefer cursor over deep page numbers for long trace histories
     """
     trace_service = TraceService(db)
 
     # Authorization
     if current_auth["type"] == "user":
-        # User must be project member
-        from app.services.agent_service import AgentService
-
-        agent_service = AgentService(db)
-        agent = await agent_service.get_agent(agent_id)
-
-        user_id = UUID(current_auth["id"])
+        # User must be member of the agent's project
         member_repo = ProjectMemberRepository(db)
-        is_member = await member_repo.is_member(UUID(agent["project_id"]), user_id)
+        is_member = await member_repo.is_agent_project_member(
+            agent_id, UUID(current_auth["id"])
+        )
+        if is_member is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Agent not found",
+            )
         if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -134,6 +147,8 @@ async def list_traces(
         status=status,
         start_date=start_date,
         end_date=end_date,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -177,15 +192,16 @@ async def create_trace(
                 detail="Agent can only create traces for itself",
             )
     elif current_auth["type"] == "user":
-        # User must be project member
-        from app.services.agent_service import AgentService
-
-        agent_service = AgentService(db)
-        agent = await agent_service.get_agent(agent_id)
-
-        user_id = UUID(current_auth["id"])
+        # User must be member of the agent's project
         member_repo = ProjectMemberRepository(db)
-        is_member = await member_repo.is_member(UUID(agent["project_id"]), user_id)
+        is_member = await member_repo.is_agent_project_member(
+            agent_id, UUID(current_auth["id"])
+        )
+        if is_member is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Agent not found",
+            )
         if not is_member:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -220,10 +236,7 @@ async def get_trace(
     Raises:
         HTTPException: 404 if not found, 403 if no access
     """
-    await verify_trace_access(trace_id, current_auth, db)
-
-    trace_service = TraceService(db)
-    return await trace_service.get_trace(trace_id)
+    return await verify_trace_access(trace_id, current_auth, db)
 
 
 @router.patch("/{trace_id}", response_model=TraceResponse)
@@ -273,6 +286,8 @@ async def list_observations(
     type: str | None = Query(
         None, pattern="^(llm|tool|retriever|agent|embedding|reranker|custom)$"
     ),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Also count matching observations"),
     current_auth: dict = Depends(get_current_user_or_agent),
     db: AsyncSession = Depends(get_async_db),
 ) -> Any:
@@ -284,6 +299,8 @@ async def list_observations(
         page: Page number (1-indexed)
         page_size: Number of items per page (max 100)
         type: Filter by observation type
+        cursor: Keyset pagination cursor (replaces page when given)
+        include_total: Whether to return total (cached briefly)
         current_auth: Current authenticated user or agent
         db: Database session
 
@@ -302,6 +319,8 @@ async def list_observations(
         page=page,
         page_size=page_size,
         observation_type=type,
+        cursor=cursor,
+        include_total=include_total,
     )
 
 
@@ -376,6 +395,45 @@ async def create_observation(
     )
 
 
+@router.post(
+    "/{trace_id}/observations/batch",
+    response_model=list[ObservationResponse],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_observations_batch(
+    trace_id: UUID,
+    batch_in: ObservationBatchCreate,
+    current_auth: dict = Depends(get_current_user_or_agent),
+    db: AsyncSession = Depends(get_async_db),
+) -> Any:
+    """
+    Create several observations of a trace in one request.
+
+    Args:
+        trace_id: Trace UUID
+        batch_in: Observations to create
+        current_auth: Current authenticated user or agent
+        db: Database session
+
+    Returns:
+        Created observations, in request order
+
+    Note:
+        - Inserted with a single statement and one commit
+        - A parent must already exist in the trace or come earlier in the batch
+    """
+    await verify_trace_access(trace_id, current_auth, db)
+
+    trace_service = TraceService(db)
+    return await trace_service.create_observations_bulk(
+        trace_id,
+        [
+            observation_in.model_dump(exclude={"trace_id"})
+            for observation_in in batch_in.observations
+        ],
+    )
+
+
 @router.get("/observations/{observation_id}", response_model=ObservationResponse)
 async def get_observation(
     observation_id: UUID,
@@ -400,7 +458,7 @@ async def get_observation(
     observation = await trace_service.get_observation(observation_id)
 
     # Verify access to parent trace
-    await verify_trace_access(UUID(observation["trace_id"]), current_auth, db)
+    await verify_trace_access(observation["trace_id"], current_auth, db)
 
     return observation
 
@@ -434,7 +492,7 @@ async def update_observation(
     observation = await trace_service.get_observation(observation_id)
 
     # Verify access to parent trace
-    await verify_trace_access(UUID(observation["trace_id"]), current_auth, db)
+    await verify_trace_access(observation["trace_id"], current_auth, db)
 
     return await trace_service.update_observation(
         observation_id=observation_id,
@@ -0,0 +1,150 @@
+"""
+In-process caching utilities.
+
+This module provides a small LRU cache with optional TTL expiry and a helper
+for building stable cache keys. Caches are per worker process and are meant
+for memoizing expensive, deterministic work (LLM calls, hot lookups).
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded LRU cache with optional per-entry time-to-live.
+
+    Attributes:
+        maxsize: Maximum number of entries kept (least recently used evicted)
+        ttl: Entry lifetime in seconds (None = no expiry)
+        hits: Number of successful lookups
+        misses: Number of lookups that found nothing (or an expired entry)
+
+    Example:
+        >>> cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+        >>> cache.set("a", 1)
+        >>> cache.get("a")
+        1
+    """
+
+    def __init__(self, maxsize: int, ttl: float | None = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Entry lifetime in seconds (None = no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+
+    def get(self, key: K, default: Any = None) -> V | Any:
+        """
+        Get a cached value, refreshing its LRU position.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: Any = None) -> V | Any:
+        """
+        Remove a key and return its value.
+
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing
+
+        Returns:
+            Removed value or default
+        """
+        entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: object) -> bool:
+        entry = self._data.get(key, _MISSING)  # type: ignore[arg-type]
+        if entry is _MISSING:
+            return False
+        expires_at = entry[0]
+        return expires_at is None or expires_at > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def make_cache_key(namespace: str, **parts: Any) -> str:
+    """
+    Build a stable hash key from a namespace and JSON-serializable parts.
+
+    Args:
+        namespace: Logical name of the cached operation
+        **parts: Inputs that determine the cached result
+
+    Returns:
+        Hex-encoded SHA-256 digest
+
+    Example:
+        >>> make_cache_key("extract_key_terms", instruction="hi", date="2025-01-15")
+        '3f0c...'
+    """
+    payload = json.dumps(
+        {"namespace": namespace, **parts},
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+__all__ = ["TTLCache", "make_cache_key"]
@@ -38,6 +38,13 @@ class Settings(BaseSettings):
     # Test database name
     TEST_POSTGRES_DB: str = "datagusto_test"
 
+    # Connection pool (per worker process). Keep
+    # workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below PostgreSQL max_connections.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    # Seconds before a pooled connection is replaced
+    DB_POOL_RECYCLE: int = 3600
+
     # =========================================================================
     # JWT Configuration
     # =========================================================================
@@ -1,12 +1,25 @@
 from collections.abc import AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.core.config import settings
+from app.core.serialization import dumps_json
 
 # Create async engine for application
-engine = create_async_engine(settings.async_database_url, echo=False)
+engine = create_async_engine(
+    settings.async_database_url,
+    echo=False,
+    json_serializer=dumps_json,
+    json_deserializer=orjson.loads,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # Replace connections dropped by the server or a proxy instead of
+    # failing the first request that checks one out
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
 AsyncSessionLocal = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
@@ -22,18 +35,19 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-# Keep sync version for backward compatibility during migration
-from sqlalchemy import create_engine  # noqa: E402
-from sqlalchemy.orm import sessionmaker  # noqa: E402
-
-sync_engine = create_engine(settings.sync_database_url)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
-
+async def get_async_db_transaction() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session wrapped in a request-scoped transaction.
 
-def get_db():
-    """Get synchronous database session (deprecated - use get_async_db instead)."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    Commits once after the endpoint returns and rolls back if it raises, so
+    services only flush and all writes of a request share a single commit.
+    Declare it with function scope so the commit happens before the response
+    is sent: ``Depends(get_async_db_transaction, scope="function")``.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
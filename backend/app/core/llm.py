@@ -1,4 +1,7 @@
+from functools import lru_cache
+
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import SystemMessage
 
 from app.core.config import settings
 
@@ -62,44 +65,13 @@ def create_llm_client(config_key: str | None = None) -> BaseChatModel:
     """
     try:
         config = get_llm_config()
-        provider = config["provider"]
-        model = config["model"]
-        api_key = config["api_key"]
-        endpoint = config["endpoint"]
-        max_tokens = settings.LLM_MAX_TOKENS
-
-        if provider == "openai":
-            from langchain_openai import ChatOpenAI
-
-            return ChatOpenAI(
-                model=model,
-                api_key=api_key,
-                temperature=0.0,  # Deterministic output
-                max_tokens=max_tokens,
-            )
-
-        elif provider == "anthropic":
-            from langchain_anthropic import ChatAnthropic
-
-            return ChatAnthropic(
-                model=model,
-                api_key=api_key,
-                temperature=0.0,
-                max_tokens=max_tokens,
-            )
-
-        elif provider == "ollama":
-            from langchain_ollama import ChatOllama
-
-            return ChatOllama(
-                model=model,
-                base_url=endpoint,
-                temperature=0.0,
-                num_predict=max_tokens,
-            )
-
-        else:
-            raise Exception(f"Unsupported provider: {provider}")
+        return _build_llm_client(
+            provider=config["provider"],
+            model=config["model"],
+            api_key=config["api_key"],
+            endpoint=config["endpoint"],
+            max_tokens=settings.LLM_MAX_TOKENS,
+        )
 
     except ImportError as e:
         raise Exception(
@@ -108,3 +80,121 @@ def create_llm_client(config_key: str | None = None) -> BaseChatModel:
         )
     except Exception as e:
         raise Exception(f"Failed to create LLM client: {str(e)}")
+
+
+def _build_llm_client(
+    provider: str, model: str, api_key: str, endpoint: str, max_tokens: int
+) -> BaseChatModel:
+    """Instantiate the LangChain chat model for the given provider settings."""
+    if provider == "openai":
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(
+            model=model,
+            api_key=api_key,
+            temperature=0.0,  # Deterministic output
+            max_tokens=max_tokens,
+        )
+
+    elif provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic(
+            model=model,
+            api_key=api_key,
+            temperature=0.0,
+            max_tokens=max_tokens,
+        )
+
+    elif provider == "ollama":
+        from langchain_ollama import ChatOllama
+
+        return ChatOllama(
+            model=model,
+            base_url=endpoint,
+            temperature=0.0,
+            num_predict=max_tokens,
+        )
+
+    else:
+        raise Exception(f"Unsupported provider: {provider}")
+
+
+def get_llm_config_key() -> tuple[str, str, str, str, int]:
+    """
+    Get a hashable snapshot of the current LLM configuration.
+
+    Used to key caches of clients and chains so they are rebuilt when the
+    configuration changes at runtime (e.g. settings patched in tests).
+
+    Returns:
+        Tuple of (provider, model, api_key, endpoint, max_tokens)
+    """
+    config = get_llm_config()
+    return (
+        config["provider"],
+        config["model"],
+        config["api_key"],
+        config["endpoint"],
+        settings.LLM_MAX_TOKENS,
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_cached_llm_client(
+    config_key: tuple[str, str, str, str, int],
+) -> BaseChatModel:
+    """Build a client once per configuration snapshot (config_key is the cache key)."""
+    return create_llm_client()
+
+
+def get_llm_client() -> BaseChatModel:
+    """
+    Get a shared LLM client for the current configuration.
+
+    Unlike create_llm_client, the client (and its underlying HTTP connection
+    pool) is built once per configuration and reused across calls.
+
+    Returns:
+        Configured chat model instance
+    """
+    return _get_cached_llm_client(get_llm_config_key())
+
+
+def build_system_message(
+    static_text: str, dynamic_text: str | None = None
+) -> SystemMessage:
+    """
+    Build a system message with a cacheable static prefix.
+
+    The static instructions are placed first and the per-call dynamic text
+    (e.g. today's date) last, so the prefix stays byte-identical across calls.
+    For Anthropic the static block is marked with ``cache_control`` so the
+    provider caches it explicitly; OpenAI caches stable prefixes automatically,
+    and other providers receive a plain string.
+
+    Args:
+        static_text: Instructions that never change between calls
+        dynamic_text: Optional per-call text appended after the static prefix
+
+    Returns:
+        SystemMessage ready to be placed at the start of a prompt
+
+    Example:
+        >>> message = build_system_message(STATIC_PROMPT, "Today's date is 2025-01-15.")
+    """
+    if get_llm_config()["provider"] == "anthropic":
+        content: list[dict] = [
+            {
+                "type": "text",
+                "text": static_text,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        if dynamic_text:
+            content.append({"type": "text", "text": dynamic_text})
+        return SystemMessage(content=content)
+
+    if dynamic_text:
+        return SystemMessage(content=f"{static_text}\n\n{dynamic_text}")
+    return SystemMessage(content=static_text)
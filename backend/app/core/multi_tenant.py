@@ -14,6 +14,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import decode_access_token
 
+# Built once at import. set_config(..., true) is the bindable form of SET LOCAL:
+# PostgreSQL does not accept parameters in SET, which asyncpg always sends.
+_SET_ORGANIZATION_CONTEXT_SQL = text(
+    "SELECT set_config('app.current_org_id', :org_id, true)"
+)
+
 
 async def set_organization_context(db: AsyncSession, organization_id: UUID) -> None:
     """
@@ -37,14 +43,14 @@ async def set_organization_context(db: AsyncSession, organization_id: UUID) -> N
         ...     users = await session.execute(select(User))
 
     Note:
-        - Uses SET LOCAL to ensure the setting is transaction-scoped
+        - Uses set_config(..., true), equivalent to SET LOCAL, so the setting
+          is transaction-scoped
         - RLS policies can reference this with current_setting('app.current_org_id')
         - The setting is automatically cleared at transaction end
     """
     try:
         await db.execute(
-            text("SET LOCAL app.current_org_id = :org_id"),
-            {"org_id": str(organization_id)},
+            _SET_ORGANIZATION_CONTEXT_SQL, {"org_id": str(organization_id)}
         )
     except Exception as e:
         raise HTTPException(
@@ -0,0 +1,63 @@
+"""
+Keyset pagination cursors.
+
+List endpoints ordered by (started_at, id) can continue from the last row of
+the previous page instead of skipping rows with OFFSET. The position is passed
+to clients as an opaque cursor string.
+
+Example:
+    >>> from datetime import UTC, datetime
+    >>> from uuid import UUID
+    >>> position = (
+    ...     datetime(2025, 9, 30, 12, 0, tzinfo=UTC),
+    ...     UUID("123e4567-e89b-12d3-a456-426614174000"),
+    ... )
+    >>> decode_cursor(encode_cursor(*position)) == position
+    True
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+Cursor = tuple[datetime, UUID]
+
+
+def encode_cursor(started_at: datetime, row_id: UUID) -> str:
+    """
+    Encode a row position as an opaque cursor.
+
+    Args:
+        started_at: started_at of the last row on the page
+        row_id: ID of the last row on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{started_at.isoformat()}|{row_id.hex}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (started_at, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        started_at, row_id = raw.split("|")
+        return datetime.fromisoformat(started_at), UUID(hex=row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+__all__ = ["Cursor", "decode_cursor", "encode_cursor"]
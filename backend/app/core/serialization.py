@@ -0,0 +1,32 @@
+"""
+JSON serialization helpers.
+
+orjson-backed replacements for the stdlib json functions, used for JSON/JSONB
+column values (engine json_serializer, COPY records).
+"""
+
+from typing import Any
+
+import orjson
+
+
+def dumps_json(value: Any) -> str:
+    """
+    Serialize a value to JSON text.
+
+    Non-string dict keys are stringified, as json.dumps does.
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        JSON text
+
+    Example:
+        >>> dumps_json({"should_proceed": False, 1: "a"})
+        '{"should_proceed":false,"1":"a"}'
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+__all__ = ["dumps_json"]
@@ -1,9 +1,24 @@
 import os
+from contextlib import asynccontextmanager
 
 from app.api.v1.router import api_router
 from app.core.multi_tenant import extract_organization_id
+from app.services.validation_log_batcher import validation_log_batcher
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan hook.
+
+    Flushes buffered background writes on shutdown so no logs are lost.
+    """
+    yield
+    await validation_log_batcher.shutdown()
+
 
 # Application configuration is loaded from settings
 app = FastAPI(
@@ -12,6 +27,9 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs" if os.environ.get("DEBUG") else None,
     redoc_url="/redoc" if os.environ.get("DEBUG") else None,
+    lifespan=lifespan,
+    # Render response bodies with orjson instead of the stdlib json module
+    default_response_class=ORJSONResponse,
 )
 
 # Set up CORS using configuration settings
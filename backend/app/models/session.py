@@ -114,6 +114,7 @@ class Session(BaseModel):
         Index("sessions_status_idx", "status"),
         Index("sessions_agent_status_idx", "agent_id", "status"),
         Index("sessions_created_at_idx", "created_at"),
+        Index("sessions_agent_created_at_idx", "agent_id", "created_at"),
     )
 
 
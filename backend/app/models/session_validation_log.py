@@ -6,7 +6,7 @@ history for session-generated guardrails. Used for displaying validation
 history in the frontend.
 """
 
-from sqlalchemy import Column, ForeignKey, Index, Text
+from sqlalchemy import Column, ForeignKey, Index, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
@@ -116,11 +116,22 @@ class SessionValidationLog(BaseModel):
         Index("session_validation_logs_project_id_idx", "project_id"),
         Index("session_validation_logs_organization_id_idx", "organization_id"),
         Index("session_validation_logs_created_at_idx", "created_at"),
+        Index(
+            "session_validation_logs_session_created_at_idx",
+            "session_id",
+            "created_at",
+        ),
         Index(
             "session_validation_logs_log_data_gin_idx",
             "log_data",
             postgresql_using="gin",
         ),
+        # Partial index: sessions that have a blocked (should_proceed=false) log
+        Index(
+            "session_validation_logs_invalid_session_id_idx",
+            "session_id",
+            postgresql_where=text("(log_data ->> 'should_proceed')::boolean IS FALSE"),
+        ),
     )
 
 
@@ -18,7 +18,9 @@ from sqlalchemy import (
     Column,
     ForeignKey,
     Index,
+    Integer,
     Text,
+    func,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
@@ -43,6 +45,7 @@ class Trace(BaseModel):
         started_at: When trace execution began (required)
         ended_at: When trace execution completed (NULL = still running)
         trace_metadata: JSONB containing inputs, outputs, tags, costs, errors (DB column: metadata)
+        observation_count: Number of observations (maintained on observation insert)
         created_at: Timestamp when trace was created (auto-managed)
         updated_at: Timestamp when trace was last updated (auto-managed)
 
@@ -79,6 +82,7 @@ class Trace(BaseModel):
         - metadata stores flexible execution data (JSONB)
         - GIN index on metadata enables fast JSONB queries
         - project_id and organization_id denormalized for query efficiency
+        - observation_count is a write-time counter so reads need no COUNT
     """
 
     __tablename__ = "traces"
@@ -111,6 +115,7 @@ class Trace(BaseModel):
     started_at = Column(
         TIMESTAMP(timezone=True),
         nullable=False,
+        server_default=func.now(),
         comment="When trace execution began",
     )
     ended_at = Column(
@@ -125,6 +130,13 @@ class Trace(BaseModel):
         default={},
         comment="JSONB containing inputs, outputs, tags, costs, errors",
     )
+    observation_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Number of observations in this trace",
+    )
 
     # Relationships
     agent = relationship("Agent", backref="traces")
@@ -148,7 +160,14 @@ class Trace(BaseModel):
         Index("traces_started_at_idx", "started_at"),
         Index("traces_ended_at_idx", "ended_at"),
         Index("traces_metadata_gin_idx", "metadata", postgresql_using="gin"),
-        Index("traces_agent_started_idx", "agent_id", "started_at"),
+        # status is carried in the index so filtered counts are index-only
+        Index(
+            "traces_agent_started_id_idx",
+            "agent_id",
+            "started_at",
+            "id",
+            postgresql_include=["status"],
+        ),
         Index("traces_project_started_idx", "project_id", "started_at"),
     )
 
@@ -171,6 +190,7 @@ class Observation(BaseModel):
         started_at: When observation began (required)
         ended_at: When observation completed (NULL = still running)
         observation_metadata: JSONB containing step-specific data (DB column: metadata)
+        child_count: Number of child observations (maintained on child insert)
         created_at: Timestamp when observation was created (auto-managed)
         updated_at: Timestamp when observation was last updated (auto-managed)
 
@@ -213,6 +233,7 @@ class Observation(BaseModel):
         - Self-referencing foreign key enables tree structure
         - CASCADE delete when parent observation is deleted
         - GIN index on metadata enables fast JSONB queries
+        - child_count is a write-time counter so reads need no COUNT
     """
 
     __tablename__ = "observations"
@@ -243,7 +264,10 @@ class Observation(BaseModel):
         comment="Execution status (pending, running, completed, failed, error)",
     )
     started_at = Column(
-        TIMESTAMP(timezone=True), nullable=False, comment="When observation began"
+        TIMESTAMP(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="When observation began",
     )
     ended_at = Column(
         TIMESTAMP(timezone=True),
@@ -257,6 +281,13 @@ class Observation(BaseModel):
         default={},
         comment="JSONB containing step-specific data (tokens, cost, latency)",
     )
+    child_count = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Number of child observations",
+    )
 
     # Relationships
     trace = relationship("Trace", back_populates="observations")
@@ -281,7 +312,14 @@ class Observation(BaseModel):
         Index("observations_started_at_idx", "started_at"),
         Index("observations_metadata_gin_idx", "metadata", postgresql_using="gin"),
         Index("observations_trace_parent_idx", "trace_id", "parent_observation_id"),
-        Index("observations_trace_started_idx", "trace_id", "started_at"),
+        # type is carried in the index so filtered counts are index-only
+        Index(
+            "observations_trace_started_id_idx",
+            "trace_id",
+            "started_at",
+            "id",
+            postgresql_include=["type"],
+        ),
     )
 
 
@@ -11,6 +11,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.core.cache import TTLCache
 from app.models.agent import (
     Agent,
     AgentActiveStatus,
@@ -18,6 +19,11 @@ from app.models.agent import (
 )
 from app.repositories.base_repository import BaseRepository
 
+# Agent UUID -> (project_id, organization_id). An agent never moves between
+# projects, so entries cannot go stale; inserts for a deleted agent fail on
+# their foreign key instead.
+_project_org_cache: TTLCache[UUID, tuple[UUID, UUID]] = TTLCache(maxsize=4_096)
+
 
 class AgentRepository(BaseRepository[Agent]):
     """Repository for agent database operations."""
@@ -51,6 +57,32 @@ class AgentRepository(BaseRepository[Agent]):
         result = await self.db.execute(stmt)
         return result.unique().scalar_one_or_none()
 
+    async def get_project_org(self, agent_id: UUID) -> tuple[UUID, UUID] | None:
+        """
+        Get the project and organization an agent belongs to.
+
+        Args:
+            agent_id: Agent UUID
+
+        Returns:
+            (project_id, organization_id), or None if the agent does not exist
+
+        Note:
+            Found agents are cached per process; missing agents are not.
+        """
+        project_org = _project_org_cache.get(agent_id)
+        if project_org is None:
+            stmt = select(Agent.project_id, Agent.organization_id).where(
+                Agent.id == agent_id
+            )
+            result = await self.db.execute(stmt)
+            row = result.first()
+            if not row:
+                return None
+            project_org = (row.project_id, row.organization_id)
+            _project_org_cache.set(agent_id, project_org)
+        return project_org
+
     async def get_by_project(
         self,
         project_id: UUID,
@@ -5,12 +5,15 @@ This repository handles operations for the Observation model, including
 CRUD operations, hierarchical queries, and archive management.
 """
 
-from uuid import UUID
+from itertools import groupby
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.trace import Observation, ObservationArchive
+from app.core.pagination import Cursor
+from app.models.trace import Observation, ObservationArchive, Trace
 from app.repositories.base_repository import BaseRepository
 
 
@@ -32,18 +35,27 @@ class ObservationRepository(BaseRepository[Observation]):
         page: int = 1,
         page_size: int = 20,
         observation_type: str | None = None,
-    ) -> tuple[list[Observation], int]:
+        cursor: Cursor | None = None,
+        include_total: bool = False,
+    ) -> tuple[list[Observation], int | None]:
         """
         Get observations by trace ID with pagination (flat list).
 
         Args:
             trace_id: Trace UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
             observation_type: Filter by observation type (llm, tool, retriever, etc.)
+            cursor: (started_at, id) of the last observation on the previous page
+            include_total: Whether to COUNT all observations matching the filters
 
         Returns:
-            Tuple of (observations list, total count)
+            Tuple of (observations list, total count or None if not requested)
+
+        Note:
+            - Ordered by started_at ASC, id ASC
+            - With a cursor the page is found by an index seek on
+              (trace_id, started_at, id) instead of OFFSET
         """
         # Base query
         stmt = select(Observation).where(Observation.trace_id == trace_id)
@@ -53,13 +65,21 @@ class ObservationRepository(BaseRepository[Observation]):
             stmt = stmt.where(Observation.type == observation_type)
 
         # Get total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            total_result = await self.db.execute(count_stmt)
+            total = total_result.scalar_one()
 
         # Apply pagination and ordering
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        stmt = stmt.order_by(Observation.started_at.asc())
+        if cursor:
+            stmt = stmt.where(
+                tuple_(Observation.started_at, Observation.id) > tuple_(*cursor)
+            )
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        stmt = stmt.limit(page_size)
+        stmt = stmt.order_by(Observation.started_at.asc(), Observation.id.asc())
 
         # Execute query
         result = await self.db.execute(stmt)
@@ -67,6 +87,144 @@ class ObservationRepository(BaseRepository[Observation]):
 
         return list(observations), total
 
+    async def update_returning(
+        self, observation_id: UUID, update_data: dict[str, Any]
+    ) -> Observation | None:
+        """
+        Update an observation and return the updated row.
+
+        Issues a single UPDATE ... RETURNING, so the existence check, the
+        update and the re-read share one round-trip.
+
+        Args:
+            observation_id: Observation UUID
+            update_data: Column values to update
+
+        Returns:
+            Updated observation, or None if not found
+        """
+        if not update_data:
+            return await self.get_by_id(observation_id)
+
+        stmt = (
+            update(Observation)
+            .where(Observation.id == observation_id)
+            .values(**update_data)
+            .returning(Observation)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def validate_create(
+        self, trace_id: UUID, parent_observation_id: UUID | None = None
+    ) -> tuple[bool, UUID | None]:
+        """
+        Check the trace and parent of a new observation in one query.
+
+        Args:
+            trace_id: Trace UUID the observation will belong to
+            parent_observation_id: Parent observation UUID (None for root)
+
+        Returns:
+            Tuple of (trace_exists, parent_trace_id). parent_trace_id is None
+            when no parent was given or the parent does not exist.
+        """
+        if parent_observation_id is None:
+            stmt = select(Trace.id).where(Trace.id == trace_id)
+            result = await self.db.execute(stmt)
+            return result.scalar_one_or_none() is not None, None
+
+        stmt = (
+            select(Trace.id, Observation.trace_id)
+            .select_from(Trace)
+            .outerjoin(Observation, Observation.id == parent_observation_id)
+            .where(Trace.id == trace_id)
+        )
+        result = await self.db.execute(stmt)
+        row = result.first()
+        if row is None:
+            return False, None
+        return True, row.trace_id
+
+    async def validate_bulk_create(
+        self, trace_id: UUID, parent_observation_ids: set[UUID]
+    ) -> tuple[bool, dict[UUID, UUID]]:
+        """
+        Check the trace and all parents of a batch of observations in one query.
+
+        Args:
+            trace_id: Trace UUID the observations will belong to
+            parent_observation_ids: Parent observation UUIDs used by the batch
+
+        Returns:
+            Tuple of (trace_exists, {parent_id: parent_trace_id}). Parents that
+            do not exist are missing from the mapping.
+        """
+        stmt = (
+            select(Trace.id, Observation.id, Observation.trace_id)
+            .select_from(Trace)
+            .outerjoin(Observation, Observation.id.in_(parent_observation_ids))
+            .where(Trace.id == trace_id)
+        )
+        result = await self.db.execute(stmt)
+        rows = result.all()
+        if not rows:
+            return False, {}
+        return True, {
+            parent_id: parent_trace_id
+            for _, parent_id, parent_trace_id in rows
+            if parent_id is not None
+        }
+
+    async def bulk_create(self, rows: list[dict[str, Any]]) -> list[Observation]:
+        """
+        Insert several observations with a single INSERT ... RETURNING.
+
+        Args:
+            rows: Observation data dictionaries
+
+        Returns:
+            Created observations, in the order of rows
+
+        Note:
+            Rows without an ID are assigned one up front so the returned rows
+            can be put back in input order. Consecutive rows with the same keys
+            share a statement and runs are inserted in order, so a row may
+            reference a parent that appears earlier in the list.
+        """
+        rows = [{"id": uuid4(), **row} for row in rows]
+        by_id: dict[UUID, Observation] = {}
+        for _, run in groupby(rows, key=frozenset):
+            result = await self.db.scalars(
+                insert(Observation).returning(Observation), list(run)
+            )
+            by_id.update((observation.id, observation) for observation in result)
+        return [by_id[row["id"]] for row in rows]
+
+    async def increment_child_count(
+        self, observation_id: UUID, amount: int = 1
+    ) -> None:
+        """
+        Add to an observation's child counter.
+
+        Called when child observations are inserted. updated_at is left
+        unchanged, since the parent itself was not modified.
+
+        Args:
+            observation_id: Parent observation UUID
+            amount: Number of children inserted
+        """
+        stmt = (
+            update(Observation)
+            .where(Observation.id == observation_id)
+            .values(
+                child_count=Observation.child_count + amount,
+                updated_at=Observation.updated_at,
+            )
+        )
+        await self.db.execute(stmt)
+
     async def get_tree_by_trace_id(self, trace_id: UUID) -> list[Observation]:
         """
         Get observations by trace ID as a hierarchical tree.
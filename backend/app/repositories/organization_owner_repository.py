@@ -44,6 +44,28 @@ class OrganizationOwnerRepository(BaseRepository[OrganizationOwner]):
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    async def list_owned_organization_ids(
+        self, user_id: UUID, organization_ids: list[UUID]
+    ) -> set[UUID]:
+        """
+        Get which of the given organizations a user owns.
+
+        Args:
+            user_id: User UUID
+            organization_ids: Organization UUIDs to check
+
+        Returns:
+            Set of organization IDs owned by the user
+        """
+        if not organization_ids:
+            return set()
+        stmt = select(OrganizationOwner.organization_id).where(
+            OrganizationOwner.user_id == user_id,
+            OrganizationOwner.organization_id.in_(organization_ids),
+        )
+        result = await self.db.execute(stmt)
+        return set(result.scalars())
+
     async def get_owner(self, organization_id: UUID) -> User | None:
         """
         Get the owner of an organization.
@@ -7,9 +7,10 @@ managing the N:M relationship between projects and users.
 
 from uuid import UUID
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import and_, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.agent import Agent
 from app.models.project import ProjectMember
 
 
@@ -93,6 +94,36 @@ class ProjectMemberRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    async def is_agent_project_member(
+        self, agent_id: UUID, user_id: UUID
+    ) -> bool | None:
+        """
+        Check if user is a member of the project an agent belongs to.
+
+        Resolves the agent's project and the membership in one query.
+
+        Args:
+            agent_id: Agent UUID
+            user_id: User UUID
+
+        Returns:
+            True if user is member, False if not, None if the agent does not exist
+        """
+        stmt = (
+            select(ProjectMember.user_id.is_not(None))
+            .select_from(Agent)
+            .outerjoin(
+                ProjectMember,
+                and_(
+                    ProjectMember.project_id == Agent.project_id,
+                    ProjectMember.user_id == user_id,
+                ),
+            )
+            .where(Agent.id == agent_id)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def add_member(self, project_id: UUID, user_id: UUID) -> ProjectMember:
         """
         Add user as project member.
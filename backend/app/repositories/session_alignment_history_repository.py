@@ -4,12 +4,14 @@ Session alignment history repository for database operations.
 This repository handles operations for the SessionAlignmentHistory model.
 """
 
-from uuid import UUID
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.session import SessionAlignmentHistory
+from app.models.session import Session, SessionAlignmentHistory
 from app.repositories.base_repository import BaseRepository
 
 
@@ -50,6 +52,28 @@ class SessionAlignmentHistoryRepository(BaseRepository[SessionAlignmentHistory])
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_latest_id_by_session(self, session_id: UUID) -> UUID | None:
+        """
+        Get the ID of the latest alignment record for a session.
+
+        Selects only the ID (no JSONB payload), so callers can check whether a
+        cached alignment result is still current with a cheap query.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Latest alignment history ID or None if not found
+        """
+        stmt = (
+            select(SessionAlignmentHistory.id)
+            .where(SessionAlignmentHistory.session_id == session_id)
+            .order_by(SessionAlignmentHistory.created_at.desc())
+            .limit(1)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_latest_by_session_and_agent(
         self, session_id: UUID, agent_id: UUID
     ) -> SessionAlignmentHistory | None:
@@ -75,6 +99,41 @@ class SessionAlignmentHistoryRepository(BaseRepository[SessionAlignmentHistory])
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def create_for_session(
+        self, session_id: UUID, data: dict[str, Any]
+    ) -> SessionAlignmentHistory | None:
+        """
+        Create an alignment record, copying agent_id from its session.
+
+        Issues a single INSERT ... SELECT ... FROM sessions RETURNING, so the
+        session lookup and the insert share one round-trip.
+
+        Args:
+            session_id: Session UUID
+            data: Column values (user_instruction, alignment_result, ...)
+
+        Returns:
+            Created alignment history record, or None if the session does
+            not exist
+        """
+        columns = SessionAlignmentHistory.__table__.c
+        values = {"id": uuid4(), **data}
+        select_stmt = select(
+            *(
+                literal(value, columns[name].type).label(name)
+                for name, value in values.items()
+            ),
+            Session.id,
+            Session.agent_id,
+        ).where(Session.id == session_id)
+        stmt = (
+            insert(SessionAlignmentHistory)
+            .from_select([*values, "session_id", "agent_id"], select_stmt)
+            .returning(SessionAlignmentHistory)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_by_session(
         self,
         session_id: UUID,
@@ -155,6 +214,32 @@ class SessionAlignmentHistoryRepository(BaseRepository[SessionAlignmentHistory])
 
         return list(history), total
 
+    async def list_user_instructions(
+        self, session_id: UUID
+    ) -> list[tuple[str | None, datetime | None]]:
+        """
+        List a session's user instructions in chronological order.
+
+        Only the instruction and timestamp are selected, so alignment_result
+        JSONB is not transferred.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            (user_instruction, created_at) tuples, oldest first
+        """
+        stmt = (
+            select(
+                SessionAlignmentHistory.user_instruction,
+                SessionAlignmentHistory.created_at,
+            )
+            .where(SessionAlignmentHistory.session_id == session_id)
+            .order_by(SessionAlignmentHistory.created_at.asc())
+        )
+        result = await self.db.execute(stmt)
+        return [tuple(row) for row in result.all()]
+
     async def count_by_session(self, session_id: UUID) -> int:
         """
         Count alignment records for a session.
@@ -171,5 +256,30 @@ class SessionAlignmentHistoryRepository(BaseRepository[SessionAlignmentHistory])
         result = await self.db.execute(stmt)
         return result.scalar_one()
 
+    async def count_by_sessions(self, session_ids: list[UUID]) -> dict[UUID, int]:
+        """
+        Count alignment records for several sessions in one query.
+
+        Args:
+            session_ids: Session UUIDs
+
+        Returns:
+            Mapping of session_id to count (sessions without records are omitted)
+
+        Example:
+            >>> counts = await repo.count_by_sessions([s.id for s in sessions])
+            >>> counts.get(session.id, 0)
+            3
+        """
+        if not session_ids:
+            return {}
+        stmt = (
+            select(SessionAlignmentHistory.session_id, func.count())
+            .where(SessionAlignmentHistory.session_id.in_(session_ids))
+            .group_by(SessionAlignmentHistory.session_id)
+        )
+        result = await self.db.execute(stmt)
+        return dict(result.all())
+
 
 __all__ = ["SessionAlignmentHistoryRepository"]
@@ -6,11 +6,12 @@ This repository handles operations for the Session model.
 
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Row, exists, func, select, true, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
-from app.models.session import Session
+from app.models.session import Session, SessionAlignmentHistory
+from app.models.session_validation_log import SessionValidationLog
 from app.repositories.base_repository import BaseRepository
 
 
@@ -26,6 +27,57 @@ class SessionRepository(BaseRepository[Session]):
         """
         super().__init__(db, Session)
 
+    async def _page_total(
+        self, rows: list[Row], page: int, filters: list[ColumnElement[bool]]
+    ) -> int:
+        """
+        Get the total row count for a page read with COUNT(*) OVER ().
+
+        The window total rides along on every returned row. Only a page past
+        the end (no rows to carry it) needs a separate COUNT query.
+
+        Args:
+            rows: Page rows, each with a ``total`` column
+            page: Page number (1-indexed)
+            filters: WHERE conditions of the page query
+
+        Returns:
+            Total number of sessions matching filters
+        """
+        if rows:
+            return rows[0].total
+        if page == 1:
+            return 0
+        count_stmt = select(func.count()).select_from(Session).where(*filters)
+        result = await self.db.execute(count_stmt)
+        return result.scalar_one()
+
+    async def _get_page(
+        self, filters: list[ColumnElement[bool]], page: int, page_size: int
+    ) -> tuple[list[Session], int]:
+        """
+        Get a page of sessions (newest first) and the total in one query.
+
+        Args:
+            filters: WHERE conditions
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+
+        Returns:
+            Tuple of (sessions list, total count)
+        """
+        stmt = (
+            select(Session, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(Session.created_at.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        result = await self.db.execute(stmt)
+        rows = list(result.all())
+        total = await self._page_total(rows, page, filters)
+        return [row.Session for row in rows], total
+
     async def get_by_id_with_latest_alignment(
         self, session_id: UUID
     ) -> Session | None:
@@ -71,27 +123,107 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Tuple of (sessions list, total count)
         """
-        # Base query
-        stmt = select(Session).where(Session.agent_id == agent_id)
+        filters: list[ColumnElement[bool]] = [Session.agent_id == agent_id]
+        if status is not None:
+            filters.append(Session.status == status)
+
+        return await self._get_page(filters, page, page_size)
+
+    async def get_dashboard_page(
+        self,
+        agent_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+        status: str | None = None,
+    ) -> tuple[list[Row], int]:
+        """
+        Get a page of sessions with their dashboard summary in one query.
+
+        Each row carries the session together with its latest alignment and
+        validation log count (LATERAL subqueries) and an EXISTS check for
+        blocked validations.
+
+        Args:
+            agent_id: Agent UUID
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+            status: Filter by status (None = no filter)
+
+        Returns:
+            Tuple of (rows, total count). Each row has:
+            - Session: Session model
+            - user_instruction: Latest alignment instruction (None if no alignment)
+            - alignment_result: Latest alignment result (None if no alignment)
+            - validation_count: Number of validation logs
+            - has_invalid_validations: Whether any log has should_proceed=false
+
+        Example:
+            >>> rows, total = await repo.get_dashboard_page(agent_id, page=1)
+            >>> for row in rows:
+            ...     print(row.Session.id, row.validation_count)
+        """
+        latest_alignment = (
+            select(
+                SessionAlignmentHistory.user_instruction,
+                SessionAlignmentHistory.alignment_result,
+            )
+            .where(SessionAlignmentHistory.session_id == Session.id)
+            .order_by(SessionAlignmentHistory.created_at.desc())
+            .limit(1)
+            .lateral("latest_alignment")
+        )
+        validation_count = (
+            select(func.count().label("validation_count"))
+            .where(SessionValidationLog.session_id == Session.id)
+            .lateral("validation_count")
+        )
+        # EXISTS stops at the first blocked log and is answered from the
+        # partial index session_validation_logs_invalid_session_id_idx
+        has_invalid_validations = (
+            exists()
+            .where(
+                SessionValidationLog.session_id == Session.id,
+                SessionValidationLog.log_data["should_proceed"].as_boolean().is_(False),
+            )
+            .label("has_invalid_validations")
+        )
 
-        # Apply status filter
+        # Base filter
+        filters: list[ColumnElement[bool]] = [Session.agent_id == agent_id]
         if status is not None:
-            stmt = stmt.where(Session.status == status)
+            filters.append(Session.status == status)
 
-        # Get total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
+        # Paginate (and count) in a subquery first, so the LATERAL
+        # subqueries only run for the sessions on this page
+        page_ids = (
+            select(Session.id, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(Session.created_at.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .subquery("page_ids")
+        )
 
-        # Apply pagination and ordering
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        stmt = stmt.order_by(Session.created_at.desc())
+        stmt = (
+            select(
+                Session,
+                page_ids.c.total,
+                latest_alignment.c.user_instruction,
+                latest_alignment.c.alignment_result,
+                validation_count.c.validation_count,
+                has_invalid_validations,
+            )
+            .join(page_ids, page_ids.c.id == Session.id)
+            .outerjoin(latest_alignment, true())
+            .outerjoin(validation_count, true())
+            .order_by(Session.created_at.desc())
+        )
 
         # Execute query
         result = await self.db.execute(stmt)
-        sessions = result.scalars().all()
-
-        return list(sessions), total
+        rows = list(result.all())
+        total = await self._page_total(rows, page, filters)
+        return rows, total
 
     async def get_by_project(
         self,
@@ -112,27 +244,11 @@ class SessionRepository(BaseRepository[Session]):
         Returns:
             Tuple of (sessions list, total count)
         """
-        # Base query
-        stmt = select(Session).where(Session.project_id == project_id)
-
-        # Apply status filter
+        filters: list[ColumnElement[bool]] = [Session.project_id == project_id]
         if status is not None:
-            stmt = stmt.where(Session.status == status)
-
-        # Get total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
+            filters.append(Session.status == status)
 
-        # Apply pagination and ordering
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        stmt = stmt.order_by(Session.created_at.desc())
-
-        # Execute query
-        result = await self.db.execute(stmt)
-        sessions = result.scalars().all()
-
-        return list(sessions), total
+        return await self._get_page(filters, page, page_size)
 
     async def get_active_by_agent(self, agent_id: UUID) -> list[Session]:
         """
@@ -180,6 +296,41 @@ class SessionRepository(BaseRepository[Session]):
         """
         return await self.update_status(session_id, "completed")
 
+    async def complete_session_with_history_count(
+        self, session_id: UUID
+    ) -> tuple[Session, int] | None:
+        """
+        Mark session as completed and count its alignment history.
+
+        Issues a single UPDATE ... RETURNING that also returns the alignment
+        history count, so no follow-up SELECT is needed.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Tuple of (updated session, alignment history count), or None if
+            not found
+        """
+        history_count = (
+            select(func.count())
+            .where(SessionAlignmentHistory.session_id == Session.id)
+            .correlate(Session)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(Session)
+            .where(Session.id == session_id)
+            .values(status="completed")
+            .returning(Session, history_count.label("alignment_history_count"))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return row.Session, row.alignment_history_count
+
     async def expire_session(self, session_id: UUID) -> Session | None:
         """
         Mark session as expired.
@@ -4,11 +4,15 @@ Session Validation Log repository for database operations.
 This repository handles CRUD operations for the SessionValidationLog model.
 """
 
+import uuid
+from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.serialization import dumps_json
 from app.models.session_validation_log import SessionValidationLog
 from app.repositories.base_repository import BaseRepository
 
@@ -66,6 +70,66 @@ class SessionValidationLogRepository(BaseRepository[SessionValidationLog]):
 
         return list(logs), total
 
+    async def list_history_by_session(
+        self,
+        session_id: UUID,
+        page: int = 1,
+        page_size: int = 20,
+    ) -> tuple[list[Row], int]:
+        """
+        List the dashboard view of a session's validation logs, newest first.
+
+        Only the log_data keys shown in the validation history are extracted,
+        in SQL, and the total comes from COUNT(*) OVER () on the same query.
+
+        Args:
+            session_id: Session UUID
+            page: Page number (1-indexed)
+            page_size: Number of items per page
+
+        Returns:
+            Tuple of (rows, total count). Each row has created_at, timing,
+            process_name, process_type, should_proceed, is_registered_tool,
+            request_context and evaluation_result (None when the key is
+            missing from log_data).
+
+        Example:
+            >>> rows, total = await repo.list_history_by_session(session_id)
+            >>> rows[0].process_name
+            'search'
+        """
+        log_data = SessionValidationLog.log_data
+        stmt = (
+            select(
+                SessionValidationLog.created_at,
+                log_data["timing"].astext.label("timing"),
+                log_data["process_name"].astext.label("process_name"),
+                log_data["process_type"].astext.label("process_type"),
+                log_data["should_proceed"].as_boolean().label("should_proceed"),
+                log_data["is_registered_tool"].as_boolean().label("is_registered_tool"),
+                log_data["request_context"].label("request_context"),
+                log_data["evaluation_result"].label("evaluation_result"),
+                func.count().over().label("total"),
+            )
+            .where(SessionValidationLog.session_id == session_id)
+            .order_by(SessionValidationLog.created_at.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )
+        result = await self.db.execute(stmt)
+        rows = list(result.all())
+
+        if rows:
+            total = rows[0].total
+        elif page == 1:
+            total = 0
+        else:
+            count_stmt = select(func.count()).where(
+                SessionValidationLog.session_id == session_id
+            )
+            total = (await self.db.execute(count_stmt)).scalar_one()
+        return rows, total
+
     async def list_by_agent(
         self,
         agent_id: UUID,
@@ -106,5 +170,69 @@ class SessionValidationLogRepository(BaseRepository[SessionValidationLog]):
 
         return list(logs), total
 
+    async def bulk_insert(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert many validation logs in a single executemany round trip.
+
+        Args:
+            rows: Column value dicts (created_at, session_id, agent_id,
+                project_id, organization_id, trace_id, log_data)
+
+        Example:
+            >>> await repo.bulk_insert([row1, row2, row3])
+        """
+        if not rows:
+            return
+        await self.db.execute(insert(SessionValidationLog), rows)
+
+    async def copy_insert(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert many validation logs with PostgreSQL COPY.
+
+        Streams the rows over the session's asyncpg connection (inside its
+        current transaction), skipping per-row INSERT parsing and planning.
+        Worth it for large batches; use bulk_insert for small ones.
+
+        Args:
+            rows: Column value dicts (created_at, session_id, agent_id,
+                project_id, organization_id, trace_id, log_data)
+
+        Example:
+            >>> await repo.copy_insert(rows)  # len(rows) in the hundreds
+        """
+        if not rows:
+            return
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        # id is generated client-side and created_at is taken from the row, so
+        # rows copied in one transaction keep distinct timestamps; updated_at
+        # uses its column default
+        await raw_connection.driver_connection.copy_records_to_table(
+            SessionValidationLog.__tablename__,
+            records=[
+                (
+                    uuid.uuid4(),
+                    row.get("created_at") or datetime.now(UTC),
+                    row["session_id"],
+                    row["agent_id"],
+                    row["project_id"],
+                    row["organization_id"],
+                    row.get("trace_id"),
+                    dumps_json(row["log_data"]),
+                )
+                for row in rows
+            ],
+            columns=[
+                "id",
+                "created_at",
+                "session_id",
+                "agent_id",
+                "project_id",
+                "organization_id",
+                "trace_id",
+                "log_data",
+            ],
+        )
+
 
 __all__ = ["SessionValidationLogRepository"]
@@ -5,11 +5,13 @@ This repository handles operations for ToolDefinition and ToolDefinitionRevision
 including revision creation, history tracking, and linked list traversal.
 """
 
+from datetime import datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models.tool_definition import ToolDefinition, ToolDefinitionRevision
 from app.repositories.base_repository import BaseRepository
@@ -125,6 +127,80 @@ class ToolDefinitionRevisionRepository(BaseRepository[ToolDefinitionRevision]):
         await self.db.flush()
         return revision
 
+    async def create_latest_revision(
+        self, tool_definition: ToolDefinition, tools_data: dict[str, Any]
+    ) -> tuple[UUID, datetime]:
+        """
+        Create a revision and make it the tool definition's latest, in one statement.
+
+        The INSERT runs in a CTE of the UPDATE that moves latest_revision_id,
+        so both writes take a single round trip. The new revision links to
+        the tool definition's current latest revision.
+
+        Args:
+            tool_definition: ToolDefinition to append the revision to
+            tools_data: JSONB containing tool definitions
+
+        Returns:
+            Tuple of (new revision ID, revision created_at)
+
+        Example:
+            >>> revision_id, created_at = await repo.create_latest_revision(
+            ...     tool_definition, {"tools": [...]}
+            ... )
+        """
+        revision_id = uuid4()
+        new_revision = (
+            insert(ToolDefinitionRevision.__table__)
+            .values(
+                id=revision_id,
+                agent_id=tool_definition.agent_id,
+                tools_data=tools_data,
+                previous_revision_id=tool_definition.latest_revision_id,
+            )
+            .returning(ToolDefinitionRevision.__table__.c.created_at)
+            .cte("new_revision")
+        )
+        stmt = (
+            update(ToolDefinition.__table__)
+            .where(ToolDefinition.__table__.c.id == tool_definition.id)
+            .values(latest_revision_id=revision_id)
+            .returning(select(new_revision.c.created_at).scalar_subquery())
+            .add_cte(new_revision)
+        )
+        result = await self.db.execute(stmt)
+        created_at = result.scalar_one()
+
+        # Keep the loaded entity in step without marking it dirty
+        set_committed_value(tool_definition, "latest_revision_id", revision_id)
+        return revision_id, created_at
+
+    async def get_latest_by_agent_id(
+        self, agent_id: UUID
+    ) -> ToolDefinitionRevision | None:
+        """
+        Get the agent's latest revision in one query.
+
+        Joins through tool_definitions.latest_revision_id instead of reading
+        the ToolDefinition first.
+
+        Args:
+            agent_id: Agent UUID
+
+        Returns:
+            Latest ToolDefinitionRevision, or None if no tools are registered
+        """
+        stmt = (
+            select(ToolDefinitionRevision)
+            .join(
+                ToolDefinition,
+                ToolDefinition.latest_revision_id == ToolDefinitionRevision.id,
+            )
+            .where(ToolDefinition.agent_id == agent_id)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
     async def get_by_agent_id(
         self, agent_id: UUID, limit: int = 10
     ) -> list[ToolDefinitionRevision]:
@@ -6,12 +6,16 @@ CRUD operations, filtering, and archive management.
 """
 
 from datetime import datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
-from app.models.trace import Trace, TraceArchive
+from app.core.pagination import Cursor
+from app.models.project import ProjectMember
+from app.models.trace import Observation, Trace, TraceArchive
 from app.repositories.base_repository import BaseRepository
 
 
@@ -35,20 +39,31 @@ class TraceRepository(BaseRepository[Trace]):
         status: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
-    ) -> tuple[list[Trace], int]:
+        cursor: Cursor | None = None,
+        include_total: bool = False,
+    ) -> tuple[list[Trace], int | None]:
         """
         Get traces by agent with pagination and filtering.
 
         Args:
             agent_id: Agent UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
             status: Filter by status (pending, running, completed, failed, error)
             start_date: Filter traces started after this date
             end_date: Filter traces started before this date
+            cursor: (started_at, id) of the last trace on the previous page
+            include_total: Whether to COUNT all traces matching the filters
 
         Returns:
-            Tuple of (traces list, total count)
+            Tuple of (traces list, total count or None if not requested)
+
+        Note:
+            - Ordered by started_at DESC, id DESC
+            - With a cursor the page is found by an index seek on
+              (agent_id, started_at, id) instead of OFFSET
+            - Relationships are not loaded; accessing one raises instead of
+              issuing a lazy query per trace
         """
         # Base query
         stmt = select(Trace).where(Trace.agent_id == agent_id)
@@ -62,13 +77,20 @@ class TraceRepository(BaseRepository[Trace]):
             stmt = stmt.where(Trace.started_at <= end_date)
 
         # Get total count
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar_one()
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            total_result = await self.db.execute(count_stmt)
+            total = total_result.scalar_one()
 
         # Apply pagination and ordering
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
-        stmt = stmt.order_by(Trace.started_at.desc())
+        if cursor:
+            stmt = stmt.where(tuple_(Trace.started_at, Trace.id) < tuple_(*cursor))
+        else:
+            stmt = stmt.offset((page - 1) * page_size)
+        stmt = stmt.limit(page_size)
+        stmt = stmt.order_by(Trace.started_at.desc(), Trace.id.desc())
+        stmt = stmt.options(raiseload("*"))
 
         # Execute query
         result = await self.db.execute(stmt)
@@ -76,6 +98,87 @@ class TraceRepository(BaseRepository[Trace]):
 
         return list(traces), total
 
+    async def get_with_membership(
+        self, trace_id: UUID, user_id: UUID
+    ) -> tuple[Trace, bool] | None:
+        """
+        Get a trace and whether a user is a member of its project.
+
+        Args:
+            trace_id: Trace UUID
+            user_id: User UUID
+
+        Returns:
+            Tuple of (trace, is_member), or None if the trace does not exist
+        """
+        stmt = (
+            select(Trace, ProjectMember.user_id.is_not(None))
+            .outerjoin(
+                ProjectMember,
+                and_(
+                    ProjectMember.project_id == Trace.project_id,
+                    ProjectMember.user_id == user_id,
+                ),
+            )
+            .where(Trace.id == trace_id)
+            .options(raiseload("*"))
+        )
+        result = await self.db.execute(stmt)
+        row = result.first()
+        return (row[0], row[1]) if row else None
+
+    async def update_returning(
+        self, trace_id: UUID, update_data: dict[str, Any]
+    ) -> Trace | None:
+        """
+        Update a trace and return the updated row.
+
+        Issues a single UPDATE ... RETURNING, so the existence check, the
+        update and the re-read share one round-trip.
+
+        Args:
+            trace_id: Trace UUID
+            update_data: Column values to update
+
+        Returns:
+            Updated trace, or None if not found
+        """
+        if not update_data:
+            return await self.get_by_id(trace_id)
+
+        stmt = (
+            update(Trace)
+            .where(Trace.id == trace_id)
+            .values(**update_data)
+            .returning(Trace)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def increment_observation_count(
+        self, trace_id: UUID, amount: int = 1
+    ) -> None:
+        """
+        Add to a trace's observation counter.
+
+        Called when observations are inserted. updated_at is left unchanged,
+        since the trace itself was not modified.
+
+        Args:
+            trace_id: Trace UUID
+            amount: Number of observations inserted
+        """
+        stmt = (
+            update(Trace)
+            .where(Trace.id == trace_id)
+            .values(
+                observation_count=Trace.observation_count + amount,
+                updated_at=Trace.updated_at,
+            )
+        )
+        await self.db.execute(stmt)
+
     async def get_observation_count(self, trace_id: UUID) -> int:
         """
         Count observations in a trace.
@@ -86,8 +189,6 @@ class TraceRepository(BaseRepository[Trace]):
         Returns:
             Number of observations
         """
-        from app.models.trace import Observation
-
         stmt = (
             select(func.count())
             .select_from(Observation)
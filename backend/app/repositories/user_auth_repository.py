@@ -6,8 +6,9 @@ This repository handles password-based authentication credentials.
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import exists, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.models.user import UserLoginPassword
 from app.repositories.base_repository import BaseRepository
@@ -125,6 +126,38 @@ class UserAuthRepository(BaseRepository[UserLoginPassword]):
         await self.db.flush()
         return auth
 
+    async def update_email_if_unique(self, user_id: UUID, new_email: str) -> bool:
+        """
+        Update user email unless another login already uses it.
+
+        Args:
+            user_id: User UUID
+            new_email: New email address
+
+        Returns:
+            True if updated, False if the email is already in use or the user
+            has no password authentication
+
+        Raises:
+            IntegrityError: If a concurrent request claimed the email first
+
+        Note:
+            The uniqueness check runs inside the UPDATE, so a successful change
+            takes one round trip.
+        """
+        other = aliased(UserLoginPassword)
+        stmt = (
+            update(UserLoginPassword)
+            .where(
+                UserLoginPassword.user_id == user_id,
+                ~exists().where(other.email == new_email),
+            )
+            .values(email=new_email)
+            .returning(UserLoginPassword.id)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
     async def delete_password_auth(self, user_id: UUID) -> bool:
         """
         Delete password authentication for user.
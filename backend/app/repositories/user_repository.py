@@ -10,7 +10,7 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload
 
 from app.models.organization import OrganizationMember
 from app.models.user import (
@@ -36,13 +36,17 @@ class UserRepository(BaseRepository[User]):
 
     async def get_by_id_with_relations(self, user_id: UUID) -> User | None:
         """
-        Get user by ID with all related data (profile, login, status).
+        Get user by ID with all related data (profile, login, status, archive).
 
         Args:
             user_id: User UUID
 
         Returns:
             User with related data or None if not found
+
+        Note:
+            Relationships other than the ones loaded here (e.g. project
+            memberships) raise on access instead of issuing a lazy query.
         """
         stmt = (
             select(User)
@@ -50,12 +54,42 @@ class UserRepository(BaseRepository[User]):
                 joinedload(User.profile),
                 joinedload(User.login_password),
                 joinedload(User.active_status),
+                joinedload(User.archive),
+                raiseload("*"),
             )
             .where(User.id == user_id)
         )
         result = await self.db.execute(stmt)
         return result.unique().scalar_one_or_none()
 
+    async def get_many_with_relations(self, user_ids: list[UUID]) -> list[User]:
+        """
+        Get several users with all related data in one query.
+
+        Args:
+            user_ids: User UUIDs
+
+        Returns:
+            Users with profile, login, status and archive loaded, in the order
+            of user_ids (missing users are skipped)
+        """
+        if not user_ids:
+            return []
+        stmt = (
+            select(User)
+            .options(
+                joinedload(User.profile),
+                joinedload(User.login_password),
+                joinedload(User.active_status),
+                joinedload(User.archive),
+                raiseload("*"),
+            )
+            .where(User.id.in_(user_ids))
+        )
+        result = await self.db.execute(stmt)
+        users = {user.id: user for user in result.unique().scalars()}
+        return [users[user_id] for user_id in user_ids if user_id in users]
+
     async def get_by_email(self, email: str) -> User | None:
         """
         Get user by email address (queries UserLoginPassword table).
@@ -89,6 +123,8 @@ class UserRepository(BaseRepository[User]):
                 joinedload(User.profile),
                 joinedload(User.login_password),
                 joinedload(User.active_status),
+                joinedload(User.archive),
+                raiseload("*"),
             )
             .where(UserLoginPassword.email == email)
         )
@@ -140,14 +176,17 @@ class UserRepository(BaseRepository[User]):
             offset: Number of users to skip
 
         Returns:
-            List of users
+            List of users with profile, login, status and archive loaded
         """
         stmt = (
             select(User)
             .join(OrganizationMember)
             .options(
                 joinedload(User.profile),
+                joinedload(User.login_password),
                 joinedload(User.active_status),
+                joinedload(User.archive),
+                raiseload("*"),
             )
             .where(OrganizationMember.organization_id == organization_id)
         )
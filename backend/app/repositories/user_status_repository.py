@@ -6,7 +6,7 @@ This repository handles user status (active, suspended, archived).
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import UserActiveStatus, UserArchive
@@ -138,5 +138,69 @@ class UserStatusRepository:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none() is not None
 
+    # State Transitions
+
+    async def archive_and_deactivate(
+        self, user_id: UUID, reason: str, archived_by: UUID
+    ) -> None:
+        """
+        Deactivate and archive a user in one statement.
+
+        Args:
+            user_id: User UUID to archive
+            reason: Reason for archiving
+            archived_by: UUID of user performing archiving
+
+        Raises:
+            IntegrityError: If user is already archived
+
+        Note:
+            The active status row is deleted in a CTE of the archive INSERT,
+            so both changes take one round trip.
+        """
+        deactivated = (
+            delete(UserActiveStatus)
+            .where(UserActiveStatus.user_id == user_id)
+            .cte("deactivated")
+        )
+        stmt = (
+            insert(UserArchive)
+            .values(user_id=user_id, reason=reason, archived_by=archived_by)
+            .add_cte(deactivated)
+        )
+        await self.db.execute(stmt)
+
+    async def unarchive_and_activate(self, user_id: UUID) -> bool:
+        """
+        Unarchive and reactivate a user in one statement.
+
+        Args:
+            user_id: User UUID
+
+        Returns:
+            True if the user was archived and is now active, False if the user
+            was not archived (nothing is changed)
+
+        Raises:
+            IntegrityError: If user is already active
+
+        Note:
+            The active status row is inserted from the archive row deleted in
+            a CTE, so it is only created when an archive existed.
+        """
+        unarchived = (
+            delete(UserArchive)
+            .where(UserArchive.user_id == user_id)
+            .returning(UserArchive.user_id)
+            .cte("unarchived")
+        )
+        stmt = (
+            insert(UserActiveStatus)
+            .from_select(["user_id"], select(unarchived.c.user_id))
+            .returning(UserActiveStatus.user_id)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
 
 __all__ = ["UserStatusRepository"]
@@ -75,8 +75,9 @@ class SessionResponse(BaseModel):
     created_by: UUID
     created_at: datetime
     updated_at: datetime
-    alignment_history_count: int = Field(
-        default=0, description="Number of alignment records (computed)"
+    alignment_history_count: int | None = Field(
+        default=0,
+        description="Number of alignment records (computed; None when not counted)",
     )
 
     model_config = ConfigDict(from_attributes=True)
@@ -221,8 +222,8 @@ class SessionListItemResponse(BaseModel):
     has_invalid_validations: bool = Field(
         default=False, description="Whether session has invalid validations"
     )
-    created_at: str = Field(..., description="Creation timestamp (ISO 8601)")
-    updated_at: str = Field(..., description="Last update timestamp (ISO 8601)")
+    created_at: datetime = Field(..., description="Creation timestamp (ISO 8601)")
+    updated_at: datetime = Field(..., description="Last update timestamp (ISO 8601)")
 
 
 class SessionDashboardListResponse(BaseModel):
@@ -347,7 +348,7 @@ class ToolInvocationRuleResponse(BaseModel):
 class ValidationHistoryEntryResponse(BaseModel):
     """Validation history entry response."""
 
-    timestamp: str = Field(..., description="Validation timestamp (ISO 8601)")
+    timestamp: datetime = Field(..., description="Validation timestamp (ISO 8601)")
     timing: str = Field(..., description="Timing of validation (on_start/on_end)")
     process_name: str = Field(..., description="Process name that was validated")
     process_type: str = Field(
@@ -370,7 +371,9 @@ class UserInstructionHistoryItem(BaseModel):
     """User instruction history item."""
 
     user_instruction: str = Field(..., description="User instruction text")
-    created_at: str = Field(..., description="Timestamp when instruction was recorded")
+    created_at: datetime = Field(
+        ..., description="Timestamp when instruction was recorded"
+    )
 
 
 class SessionDetailResponse(BaseModel):
@@ -389,14 +392,21 @@ class SessionDetailResponse(BaseModel):
     validation_history: list[ValidationHistoryEntryResponse] = Field(
         default_factory=list, description="Validation history entries"
     )
+    validation_history_total: int = Field(
+        default=0, description="Total number of validation history entries"
+    )
     user_instruction_history: list[UserInstructionHistoryItem] = Field(
         default_factory=list, description="History of user instructions in this session"
     )
     disallowed_tools: list[str] = Field(
         default_factory=list, description="Tools that are automatically blocked"
     )
-    created_at: str = Field(..., description="Session creation timestamp (ISO 8601)")
-    updated_at: str = Field(..., description="Session last update timestamp (ISO 8601)")
+    created_at: datetime = Field(
+        ..., description="Session creation timestamp (ISO 8601)"
+    )
+    updated_at: datetime = Field(
+        ..., description="Session last update timestamp (ISO 8601)"
+    )
 
 
 __all__ = [
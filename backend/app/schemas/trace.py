@@ -199,6 +199,43 @@ class ObservationCreate(ObservationBase):
     )
 
 
+class ObservationBatchItem(ObservationCreate):
+    """
+    Schema for one observation in a batch.
+
+    Note:
+        - id is optional; set it so later items of the same batch can use it
+          as their parent_observation_id
+    """
+
+    id: UUID | None = Field(
+        None, description="Client-assigned ID for parent references in the batch"
+    )
+
+
+class ObservationBatchCreate(BaseModel):
+    """
+    Schema for creating several observations of one trace at once.
+
+    Example:
+        >>> batch = ObservationBatchCreate(
+        ...     observations=[
+        ...         {"id": agent_id, "trace_id": trace_id, "type": "agent",
+        ...          "name": "Agent Execution"},
+        ...         {"trace_id": trace_id, "parent_observation_id": agent_id,
+        ...          "type": "llm", "name": "LLM Call"},
+        ...     ]
+        ... )
+
+    Note:
+        - A parent must already exist in the trace or come earlier in the batch
+    """
+
+    observations: list[ObservationBatchItem] = Field(
+        ..., min_length=1, max_length=100, description="Observations to create"
+    )
+
+
 class ObservationUpdate(BaseModel):
     """
     Schema for updating an existing observation.
@@ -315,15 +352,19 @@ class TraceListResponse(BaseModel):
 
     Attributes:
         items: List of traces
-        total: Total number of traces
+        total: Total number of traces (None unless requested)
         page: Current page number
         page_size: Number of items per page
+        next_cursor: Cursor for the next page (None on the last page)
     """
 
     items: list[TraceResponse]
-    total: int
+    total: int | None = None
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=100)
+    next_cursor: str | None = Field(
+        None, description="Pass as cursor to fetch the next page"
+    )
 
 
 class ObservationListResponse(BaseModel):
@@ -332,15 +373,19 @@ class ObservationListResponse(BaseModel):
 
     Attributes:
         items: List of observations
-        total: Total number of observations
+        total: Total number of observations (None unless requested)
         page: Current page number
         page_size: Number of items per page
+        next_cursor: Cursor for the next page (None on the last page)
     """
 
     items: list[ObservationResponse]
-    total: int
+    total: int | None = None
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=100)
+    next_cursor: str | None = Field(
+        None, description="Pass as cursor to fetch the next page"
+    )
 
 
 __all__ = [
@@ -350,6 +395,8 @@ __all__ = [
     "TraceResponse",
     "ObservationBase",
     "ObservationCreate",
+    "ObservationBatchItem",
+    "ObservationBatchCreate",
     "ObservationUpdate",
     "ObservationResponse",
     "ObservationTreeResponse",
@@ -0,0 +1,85 @@
+"""
+Compiled guardrail definitions for repeated evaluation.
+
+A guardrail definition is plain JSON. Evaluating it directly means walking
+the trigger dict and re-parsing every condition's field path (and regex) on
+each call. This module turns a definition into a CompiledGuardrail once, so
+hot evaluation paths only touch prepared data.
+
+Example:
+    >>> compiled = compile_guardrail(
+    ...     {
+    ...         "trigger": {
+    ...             "type": "on_start",
+    ...             "logic": "and",
+    ...             "conditions": [
+    ...                 {"field": "input.query", "operator": "contains", "value": "x"}
+    ...             ],
+    ...         },
+    ...         "actions": [{"type": "block", "priority": 1, "config": {}}],
+    ...     }
+    ... )
+    >>> compiled.logic
+    'and'
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from app.services.guardrail_evaluation.condition_evaluator import (
+    CompiledCondition,
+    Operator,
+    compile_condition,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledGuardrail:
+    """
+    Guardrail definition prepared for evaluation.
+
+    Attributes:
+        conditions: Compiled trigger conditions
+        logic: Condition logic ("and" or "or")
+        actions: Action configurations, in definition order
+        trigger_type: Trigger timing (on_start or on_end), if set
+        uses_llm_judge: Whether any condition calls the LLM judge
+    """
+
+    conditions: tuple[CompiledCondition, ...]
+    logic: str
+    actions: tuple[dict[str, Any], ...]
+    trigger_type: str | None
+    uses_llm_judge: bool
+
+    @property
+    def raw_conditions(self) -> list[dict[str, Any]]:
+        """Original condition dicts (used to describe matched conditions)."""
+        return [condition.raw for condition in self.conditions]
+
+
+def compile_guardrail(definition: dict[str, Any]) -> CompiledGuardrail:
+    """
+    Compile a guardrail definition.
+
+    Args:
+        definition: Guardrail definition with trigger and actions
+
+    Returns:
+        CompiledGuardrail
+    """
+    trigger = definition.get("trigger", {})
+    conditions = tuple(
+        compile_condition(condition) for condition in trigger.get("conditions", [])
+    )
+
+    return CompiledGuardrail(
+        conditions=conditions,
+        logic=trigger.get("logic", "and"),
+        actions=tuple(definition.get("actions", [])),
+        trigger_type=trigger.get("type"),
+        uses_llm_judge=any(c.operator == Operator.LLM_JUDGE for c in conditions),
+    )
+
+
+__all__ = ["CompiledGuardrail", "compile_guardrail"]
@@ -13,11 +13,18 @@ Supported operators:
 """
 
 import re
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
 from app.services.guardrail_evaluation.exceptions import ConditionEvaluationError
-from app.services.guardrail_evaluation.field_resolver import resolve_field_value
+from app.services.guardrail_evaluation.field_resolver import (
+    parse_field_path,
+    resolve_field_segments,
+    resolve_field_value,
+)
 
 
 class Operator(str, Enum):
@@ -83,13 +90,13 @@ def evaluate_equals(field_value: Any, target: Any) -> bool:
     return field_value == target
 
 
-def evaluate_regex(field_value: Any, pattern: str) -> bool:
+def evaluate_regex(field_value: Any, pattern: str | re.Pattern[str]) -> bool:
     """
     Check if field_value matches regex pattern.
 
     Args:
         field_value: Value to check (converted to string)
-        pattern: Regular expression pattern
+        pattern: Regular expression pattern (string or pre-compiled)
 
     Returns:
         True if pattern matches
@@ -99,7 +106,9 @@ def evaluate_regex(field_value: Any, pattern: str) -> bool:
     """
     try:
         field_str = str(field_value)
-        compiled_pattern = re.compile(pattern)
+        compiled_pattern = (
+            pattern if isinstance(pattern, re.Pattern) else re.compile(pattern)
+        )
         return compiled_pattern.search(field_str) is not None
     except re.error as e:
         raise ConditionEvaluationError(f"Invalid regex pattern '{pattern}': {str(e)}")
@@ -197,6 +206,79 @@ def evaluate_size_lte(field_value: Any, target: int) -> bool:
     return size <= target_num
 
 
+# Compiled conditions
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledCondition:
+    """
+    Condition with its field path and regex pattern prepared ahead of time.
+
+    Preparation never raises: an invalid path or pattern is left unprepared
+    so evaluation reports the same error it would for the raw condition.
+
+    Attributes:
+        field: Field path string
+        operator: Operator name
+        value: Target value
+        segments: Parsed field path (None if the path could not be parsed)
+        pattern: Compiled pattern for the regex operator (None otherwise)
+        raw: Original condition dict
+    """
+
+    field: Any
+    operator: Any
+    value: Any
+    segments: tuple[str | int, ...] | None
+    pattern: re.Pattern[str] | None
+    raw: dict[str, Any]
+
+
+def compile_condition(condition: dict[str, Any]) -> CompiledCondition:
+    """
+    Prepare a condition dict for repeated evaluation.
+
+    Args:
+        condition: Condition dict with 'field', 'operator', 'value' keys
+
+    Returns:
+        CompiledCondition
+
+    Example:
+        >>> compiled = compile_condition(
+        ...     {"field": "input.items[0]", "operator": "regex", "value": "^a"}
+        ... )
+        >>> compiled.segments
+        ('input', 'items', 0)
+    """
+    field_path = condition.get("field")
+    operator = condition.get("operator")
+    target_value = condition.get("value")
+
+    segments = None
+    if field_path:
+        try:
+            segments = tuple(parse_field_path(field_path))
+        except Exception:
+            pass
+
+    pattern = None
+    if operator == Operator.REGEX and isinstance(target_value, str):
+        try:
+            pattern = re.compile(target_value)
+        except re.error:
+            pass
+
+    return CompiledCondition(
+        field=field_path,
+        operator=operator,
+        value=target_value,
+        segments=segments,
+        pattern=pattern,
+        raw=condition,
+    )
+
+
 # Main evaluation functions
 
 
@@ -215,13 +297,16 @@ OPERATOR_MAP = {
 }
 
 
-def evaluate_condition(context: dict[str, Any], condition: dict[str, Any]) -> bool:
+def evaluate_condition(
+    context: dict[str, Any], condition: dict[str, Any] | CompiledCondition
+) -> bool:
     """
     Evaluate single condition against context.
 
     Args:
         context: Evaluation context data
-        condition: Condition dict with 'field', 'operator', 'value' keys
+        condition: Condition dict with 'field', 'operator', 'value' keys,
+            or a CompiledCondition
 
     Returns:
         True if condition matches, False otherwise
@@ -236,10 +321,13 @@ def evaluate_condition(context: dict[str, Any], condition: dict[str, Any]) -> bo
         >>> evaluate_condition(context, condition)
         True
     """
+    if not isinstance(condition, CompiledCondition):
+        condition = compile_condition(condition)
+
     try:
-        field_path = condition.get("field")
-        operator = condition.get("operator")
-        target_value = condition.get("value")
+        field_path = condition.field
+        operator = condition.operator
+        target_value = condition.value
 
         if not field_path:
             raise ConditionEvaluationError("Condition missing 'field'")
@@ -247,7 +335,12 @@ def evaluate_condition(context: dict[str, Any], condition: dict[str, Any]) -> bo
             raise ConditionEvaluationError("Condition missing 'operator'")
 
         # Resolve field value from context
-        field_value = resolve_field_value(context, field_path)
+        if condition.segments is not None:
+            field_value = resolve_field_segments(
+                context, field_path, condition.segments
+            )
+        else:
+            field_value = resolve_field_value(context, field_path)
 
         # Handle null/None values
         if field_value is None:
@@ -284,6 +377,8 @@ def evaluate_condition(context: dict[str, Any], condition: dict[str, Any]) -> bo
             raise ConditionEvaluationError(f"Unsupported operator: {operator}")
 
         # Evaluate condition
+        if condition.pattern is not None:
+            return evaluate_regex(field_value, condition.pattern)
         return eval_func(field_value, target_value)
 
     except ConditionEvaluationError:
@@ -295,14 +390,16 @@ def evaluate_condition(context: dict[str, Any], condition: dict[str, Any]) -> bo
 
 
 def evaluate_conditions(
-    context: dict[str, Any], conditions: list[dict[str, Any]], logic: str
+    context: dict[str, Any],
+    conditions: Sequence[dict[str, Any] | CompiledCondition],
+    logic: str,
 ) -> tuple[bool, list[int]]:
     """
     Evaluate multiple conditions with AND/OR logic.
 
     Args:
         context: Evaluation context data
-        conditions: List of condition dicts
+        conditions: List of condition dicts or CompiledConditions
         logic: "and" or "or"
 
     Returns:
@@ -330,34 +427,66 @@ def evaluate_conditions(
             f"Invalid logic '{logic}': must be 'and' or 'or'"
         )
 
-    matched_indices: list[int] = []
-    results: list[bool] = []
-
+    # Evaluate cheap conditions first. llm_judge conditions each cost an LLM
+    # round trip, so they are only dispatched when the cheap results do not
+    # already decide the outcome.
+    results: dict[int, bool] = {}
+    llm_indices: list[int] = []
+    conditions = [
+        c if isinstance(c, CompiledCondition) else compile_condition(c)
+        for c in conditions
+    ]
     for i, condition in enumerate(conditions):
-        try:
-            result = evaluate_condition(context, condition)
-            results.append(result)
-            if result:
-                matched_indices.append(i)
-        except Exception as e:
-            # If condition evaluation fails, treat as False
-            # Error will be logged by caller
-            results.append(False)
-            raise ConditionEvaluationError(
-                f"Failed to evaluate condition {i}: {str(e)}"
-            )
+        if condition.operator == Operator.LLM_JUDGE:
+            llm_indices.append(i)
+        else:
+            results[i] = _evaluate_indexed_condition(context, condition, i)
 
-    # Apply logic
     if logic == "and":
-        overall_result = all(results)
+        decided = not all(results.values())
     else:  # logic == "or"
-        overall_result = any(results)
+        decided = any(results.values())
+
+    if llm_indices and not decided:
+        if len(llm_indices) == 1:
+            i = llm_indices[0]
+            results[i] = _evaluate_indexed_condition(context, conditions[i], i)
+        else:
+            # Issue the remaining LLM judgements concurrently
+            with ThreadPoolExecutor(max_workers=len(llm_indices)) as executor:
+                llm_results = executor.map(
+                    lambda i: _evaluate_indexed_condition(context, conditions[i], i),
+                    llm_indices,
+                )
+                results.update(zip(llm_indices, llm_results, strict=True))
+
+    matched_indices = sorted(i for i, result in results.items() if result)
+
+    # Apply logic (skipped llm_judge conditions cannot change a decided result)
+    if logic == "and":
+        overall_result = not decided and all(results.values())
+    else:  # logic == "or"
+        overall_result = any(results.values())
 
     return overall_result, matched_indices
 
 
+def _evaluate_indexed_condition(
+    context: dict[str, Any], condition: CompiledCondition, index: int
+) -> bool:
+    """Evaluate one condition, tagging failures with its position."""
+    try:
+        return evaluate_condition(context, condition)
+    except Exception as e:
+        raise ConditionEvaluationError(
+            f"Failed to evaluate condition {index}: {str(e)}"
+        )
+
+
 __all__ = [
+    "CompiledCondition",
     "Operator",
+    "compile_condition",
     "evaluate_condition",
     "evaluate_conditions",
     "evaluate_contains",
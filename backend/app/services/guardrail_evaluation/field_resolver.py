@@ -25,6 +25,7 @@ Limitations:
 """
 
 import re
+from collections.abc import Sequence
 from typing import Any
 
 from app.services.guardrail_evaluation.exceptions import FieldPathResolutionError
@@ -118,7 +119,33 @@ def resolve_field_value(data: dict | list, path: str) -> Any:
         >>> resolve_field_value(data, "items[1].name")
         'bar'
     """
-    segments = parse_field_path(path)
+    return resolve_field_segments(data, path, parse_field_path(path))
+
+
+def resolve_field_segments(
+    data: dict | list, path: str, segments: Sequence[str | int]
+) -> Any:
+    """
+    Resolve field value from data using pre-parsed path segments.
+
+    Lets callers parse a field path once and resolve it many times.
+
+    Args:
+        data: Data structure to traverse (dict or list)
+        path: Original field path string (used in error messages)
+        segments: Segments returned by parse_field_path(path)
+
+    Returns:
+        Value at the specified path
+
+    Raises:
+        FieldPathResolutionError: If path cannot be resolved
+
+    Examples:
+        >>> segments = parse_field_path("input.query")
+        >>> resolve_field_segments({"input": {"query": "hi"}}, "input.query", segments)
+        'hi'
+    """
     current_value: Any = data
 
     for _, segment in enumerate(segments):
@@ -175,5 +202,6 @@ def resolve_field_value(data: dict | list, path: str) -> Any:
 
 __all__ = [
     "parse_field_path",
+    "resolve_field_segments",
     "resolve_field_value",
 ]
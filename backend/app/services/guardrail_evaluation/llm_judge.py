@@ -22,7 +22,7 @@ from typing import Any
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from app.core.llm import create_llm_client
+from app.core.llm import get_llm_client
 from app.services.guardrail_evaluation.exceptions import LLMJudgeError
 
 logger = logging.getLogger(__name__)
@@ -52,8 +52,8 @@ def evaluate_with_llm(field_value: Any, criteria: str, timeout: int = 30) -> boo
         True
     """
     try:
-        # Create LLM client
-        llm = create_llm_client()
+        # Get shared LLM client
+        llm = get_llm_client()
 
         # Convert field value to string
         field_str = str(field_value)
@@ -84,7 +84,7 @@ Answer (true/false):"""
         ]
 
         # Log the request
-        logger.info(
+        logger.debug(
             f"LLM judge request - Criteria: {criteria[:100]}..., "
             f"Content length: {len(field_str)}"
         )
@@ -96,7 +96,7 @@ Answer (true/false):"""
         # Extract response content
         response_text = response.content.strip().lower()
 
-        logger.info(f"LLM judge response: {response_text}")
+        logger.debug(f"LLM judge response: {response_text}")
 
         # Parse response
         if "true" in response_text:
@@ -120,6 +120,6 @@ Answer (true/false):"""
 
 __all__ = [
     "get_llm_config",
-    "create_llm_client",
+    "get_llm_client",
     "evaluate_with_llm",
 ]
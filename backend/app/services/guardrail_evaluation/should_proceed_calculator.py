@@ -16,6 +16,8 @@ Decision rules:
 import logging
 from typing import Any
 
+from app.schemas.guardrail_evaluation import TriggeredGuardrail
+
 logger = logging.getLogger(__name__)
 
 
@@ -71,7 +73,7 @@ def calculate_should_proceed(triggered_guardrails: list[dict[str, Any]]) -> bool
     has_block = any(action.get("action_type") == "block" for action in all_actions)
 
     if has_block:
-        logger.info("Block action detected, should_proceed=False")
+        logger.debug("Block action detected, should_proceed=False")
         return False
 
     # Check warn actions
@@ -118,13 +120,14 @@ def get_action_config_allow_proceed(action_config: dict[str, Any]) -> bool:
 
 
 def calculate_should_proceed_with_configs(
-    triggered_guardrails: list[dict[str, Any]],
+    triggered_guardrails: list[TriggeredGuardrail],
     guardrail_definitions: dict[str, dict[str, Any]],
 ) -> bool:
     """
     Calculate should_proceed with access to original action configurations.
 
     This is the complete implementation that checks warn.allow_proceed settings.
+    Results are read by attribute, so callers do not need to dump them first.
 
     Args:
         triggered_guardrails: List of triggered guardrail results
@@ -137,10 +140,10 @@ def calculate_should_proceed_with_configs(
     all_action_configs = []
 
     for guardrail in triggered_guardrails:
-        if not guardrail.get("triggered", False) or guardrail.get("error", False):
+        if not guardrail.triggered or guardrail.error:
             continue
 
-        guardrail_id = guardrail.get("guardrail_id")
+        guardrail_id = guardrail.guardrail_id
         if guardrail_id:
             # Convert UUID to string for dictionary lookup
             guardrail_id_str = str(guardrail_id)
@@ -156,7 +159,7 @@ def calculate_should_proceed_with_configs(
     has_block = any(action.get("type") == "block" for action in all_action_configs)
 
     if has_block:
-        logger.info("Block action detected, should_proceed=False")
+        logger.debug("Block action detected, should_proceed=False")
         return False
 
     # Check warn actions with allow_proceed
@@ -169,7 +172,7 @@ def calculate_should_proceed_with_configs(
         for warn_action in warn_actions:
             allow_proceed = get_action_config_allow_proceed(warn_action)
             if not allow_proceed:
-                logger.info(
+                logger.debug(
                     "Warn action with allow_proceed=False detected, should_proceed=False"
                 )
                 return False
@@ -115,7 +115,7 @@ class GuardrailEvaluationService:
             if trigger_type == timing:
                 filtered_guardrails.append(guardrail)
 
-        logger.info(
+        logger.debug(
             f"Found {len(filtered_guardrails)} active guardrails for agent {agent_id} "
             f"(timing={timing}, process_type={process_type})"
         )
@@ -154,7 +154,7 @@ class GuardrailEvaluationService:
         # Generate unique request ID
         request_id = f"req_{uuid.uuid4().hex[:12]}"
 
-        logger.info(
+        logger.debug(
             f"Starting evaluation {request_id} for agent {agent_id}, "
             f"process={request.process_name}, timing={request.timing.value}"
         )
@@ -179,7 +179,7 @@ class GuardrailEvaluationService:
 
         # Calculate should_proceed
         should_proceed = calculate_should_proceed_with_configs(
-            [tg.model_dump() for tg in triggered_guardrails_list], guardrail_definitions
+            triggered_guardrails_list, guardrail_definitions
         )
 
         # Calculate evaluation time
@@ -41,6 +41,10 @@ class PermissionService:
         self.owner_repo = OrganizationOwnerRepository(db)
         self.admin_repo = OrganizationAdminRepository(db)
         self.member_repo = OrganizationMemberRepository(db)
+        # Permission levels already resolved by this instance. Services are
+        # built per request, so this memoizes repeated checks within a request
+        # without serving stale grants across requests.
+        self._levels: dict[tuple[UUID, UUID], PermissionLevel] = {}
 
     async def get_user_permission_level(
         self, organization_id: UUID, user_id: UUID
@@ -50,6 +54,29 @@ class PermissionService:
 
         The hierarchy is: owner > admin > member > none
 
+        Args:
+            organization_id: Organization UUID
+            user_id: User UUID
+
+        Returns:
+            User's permission level
+
+        Note:
+            The result is remembered for the lifetime of this service instance.
+        """
+        key = (organization_id, user_id)
+        level = self._levels.get(key)
+        if level is None:
+            level = await self._resolve_permission_level(organization_id, user_id)
+            self._levels[key] = level
+        return level
+
+    async def _resolve_permission_level(
+        self, organization_id: UUID, user_id: UUID
+    ) -> PermissionLevel:
+        """
+        Look up a user's permission level in the database.
+
         Args:
             organization_id: Organization UUID
             user_id: User UUID
@@ -1,21 +1,28 @@
+import asyncio
 import json
 import logging
 import time
-from datetime import datetime
+from datetime import UTC, date, datetime
+from functools import lru_cache
 from typing import Any, Literal
 from uuid import UUID
 
-from langchain_core.prompts import ChatPromptTemplate
-from pydantic import BaseModel, ConfigDict, Field
+import orjson
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.llm import create_llm_client
+from app.core.cache import TTLCache, make_cache_key
+from app.core.config import settings
+from app.core.llm import (
+    build_system_message,
+    get_llm_client,
+    get_llm_config_key,
+)
 from app.repositories.session_alignment_history_repository import (
     SessionAlignmentHistoryRepository,
 )
-from app.repositories.session_validation_log_repository import (
-    SessionValidationLogRepository,
-)
 from app.schemas.guardrail import GuardrailDefinition
 from app.schemas.guardrail_evaluation import ActionResult, TriggeredGuardrail
 from app.schemas.safety import KeyTermsOutput
@@ -24,6 +31,10 @@ from app.services.guardrail_evaluation.action_executor import (
     execute_modify_action,
     execute_warn_action,
 )
+from app.services.guardrail_evaluation.compiled_guardrail import (
+    CompiledGuardrail,
+    compile_guardrail,
+)
 from app.services.guardrail_evaluation.condition_evaluator import evaluate_conditions
 from app.services.guardrail_evaluation.exceptions import (
     ConditionEvaluationError,
@@ -34,14 +45,71 @@ from app.services.guardrail_evaluation.should_proceed_calculator import (
 )
 from app.services.session_service import SessionService
 from app.services.tool_definition_service import ToolDefinitionService
+from app.services.validation_log_batcher import validation_log_batcher
 
 logger = logging.getLogger(__name__)
 
-KEYTERM_EXTRACTION_PROMPT = ChatPromptTemplate.from_messages(
-    [
-        (
-            "system",
-            """Extract all key terms from the user's instruction history that could affect an AI agent's planning and actions.
+# Exact-match cache for alignment LLM responses. All providers run at
+# temperature 0, so identical inputs on the same day yield the same output;
+# retried or replayed alignments are answered without an LLM round trip.
+_llm_response_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+    maxsize=10_000, ttl=24 * 60 * 60
+)
+
+# Serialized tools_data keyed by tool definition revision ID. Revisions are
+# never modified once created, so entries cannot go stale.
+_tools_json_cache: TTLCache[str, str] = TTLCache(maxsize=1_000)
+
+# Reuses one compiled pydantic-core serializer for validation log payloads
+# instead of dumping each TriggeredGuardrail model separately.
+_TRIGGERED_GUARDRAILS_ADAPTER = TypeAdapter(list[TriggeredGuardrail])
+
+
+def _serialize_tools_data(tools_data: dict[str, Any]) -> str:
+    """Serialize tools_data with sorted keys so equal data yields equal text."""
+    return orjson.dumps(tools_data, option=orjson.OPT_SORT_KEYS).decode()
+
+
+def _get_tools_json(tools_data: dict[str, Any], revision_id: str | None) -> str:
+    """
+    Get the prompt JSON for a tool definition revision, serializing it once.
+
+    Args:
+        tools_data: Tool definitions data from database
+        revision_id: Revision ID the data was read from (None = don't cache)
+
+    Returns:
+        JSON string of tools_data with sorted keys
+    """
+    if revision_id is None:
+        return _serialize_tools_data(tools_data)
+    tools_json = _tools_json_cache.get(revision_id)
+    if tools_json is None:
+        tools_json = _serialize_tools_data(tools_data)
+        _tools_json_cache.set(revision_id, tools_json)
+    return tools_json
+
+
+_today: date | None = None
+_today_iso = ""
+
+
+def _today_str() -> str:
+    """
+    Return today's date as YYYY-MM-DD, formatting it once per day.
+
+    Returns:
+        ISO formatted local date
+    """
+    global _today, _today_iso
+    current = date.today()
+    if current != _today:
+        _today_iso = current.isoformat()
+        _today = current
+    return _today_iso
+
+
+KEYTERM_EXTRACTION_SYSTEM_PROMPT = """Extract all key terms from the user's instruction history that could affect an AI agent's planning and actions.
 
 ## INPUTS:
 1. Latest User Instruction (required): The most recent instruction from the user
@@ -109,17 +177,21 @@ This extraction runs each time the user provides input. On subsequent runs:
 - Maintain all terms from previous iterations
 - Update user_provided_context only with explicit user information or clear relative time resolution
 - Preserve ambiguity when appropriate
-- Output valid JSON matching the schema
+- Output valid JSON matching the schema"""
 
-Today's date is {date}.""",
-        ),
+# Inputs are ordered from most to least stable across alignment turns (the
+# history only grows; the latest instruction always changes) so provider
+# prompt caches can match the longest possible prefix.
+KEYTERM_EXTRACTION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        MessagesPlaceholder("system_messages"),
         (
             "human",
-            """Latest User Instruction: {latest_user_instruction}
+            """Past Instructions History: {past_instructions_history}
 
-Past Instructions History: {past_instructions_history}
+Previous Extraction Output: {previous_extraction_output}
 
-Previous Extraction Output: {previous_extraction_output}""",
+Latest User Instruction: {latest_user_instruction}""",
         ),
     ]
 )
@@ -292,11 +364,7 @@ class LLMGeneratedGuardrails(BaseModel):
     )
 
 
-GUARDRAIL_GENERATION_PROMPT = ChatPromptTemplate.from_messages(
-    [
-        (
-            "system",
-            """Generate guardrails for AI agent tool invocations based on user instruction and context.
+GUARDRAIL_GENERATION_SYSTEM_PROMPT = """Generate guardrails for AI agent tool invocations based on user instruction and context.
 
 ## INPUTS:
 1. User Instruction: What the user wants to accomplish
@@ -351,31 +419,31 @@ When validating requires semantic understanding or cross-referencing with previo
 **For on_start (validate input parameters):**
 Use "field": "input" to validate the entire input object:
 ```json
-{{
-  "trigger": {{
+{
+  "trigger": {
     "type": "on_start",
-    "conditions": [{{
+    "conditions": [{
       "field": "input",
       "operator": "llm_judge",
       "value": "Verify that input.file_id was obtained from a previous get_user_files call and corresponds to spring semester grade files"
-    }}]
-  }}
-}}
+    }]
+  }
+}
 ```
 
 **For on_end (validate output data):**
 Use "field": "output" to validate the entire output object:
 ```json
-{{
-  "trigger": {{
+{
+  "trigger": {
     "type": "on_end",
-    "conditions": [{{
+    "conditions": [{
       "field": "output",
       "operator": "llm_judge",
       "value": "Verify that output.content contains spring semester grade data, not other semesters"
-    }}]
-  }}
-}}
+    }]
+  }
+}
 ```
 
 Use llm_judge for:
@@ -457,27 +525,120 @@ Category 2 tools (Allowed without guardrails) are implicitly all tools not in ei
 - Use llm_judge when validation requires understanding context or previous actions
 - Create guardrails that verify user INTENT alignment, not just data format
 - Set higher severity for operations that could access or modify wrong resources
-- Consider the entire user instruction context when defining validation criteria
+- Consider the entire user instruction context when defining validation criteria"""
 
-Today's date is {date}.""",
-        ),
+# Available tools change only with a new tool revision, so they lead the
+# message; per-turn inputs follow (see KEYTERM_EXTRACTION_PROMPT).
+GUARDRAIL_GENERATION_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        MessagesPlaceholder("system_messages"),
         (
             "human",
-            """User Instruction: {user_instruction}
+            """Available Tools:
+{available_tools}
+
+Previous Guardrails (from earlier alignment iterations):
+{previous_guardrails}
 
 Key Terms with Context:
 {key_terms}
 
-Available Tools:
-{available_tools}
-
-Previous Guardrails (from earlier alignment iterations):
-{previous_guardrails}""",
+User Instruction: {user_instruction}""",
         ),
     ]
 )
 
 
+@lru_cache(maxsize=4)
+def _keyterm_extraction_chain(config_key: tuple[Any, ...]) -> Runnable:
+    """Build the key-term extraction chain once per LLM configuration."""
+    structured_llm = get_llm_client().with_structured_output(KeyTermsOutput)
+    return KEYTERM_EXTRACTION_PROMPT | structured_llm
+
+
+@lru_cache(maxsize=4)
+def _guardrail_generation_chain(config_key: tuple[Any, ...]) -> Runnable:
+    """Build the guardrail generation chain once per LLM configuration."""
+    # Use strict, OpenAI-structured-output-compatible schema for parsing.
+    structured_llm = get_llm_client().with_structured_output(LLMGeneratedGuardrails)
+    return GUARDRAIL_GENERATION_PROMPT | structured_llm
+
+
+def _build_rule_index(
+    tool_invocation_rules: list[dict[str, Any]],
+) -> dict[str, dict[str, list[int]]]:
+    """
+    Index tool invocation rules by trigger timing and tool name.
+
+    Built once when an alignment result is stored so validation can look up
+    the applicable rules without re-scanning every rule on each call.
+
+    Args:
+        tool_invocation_rules: Serialized GeneratedGuardrail dicts
+
+    Returns:
+        Mapping of timing -> tool_name -> rule positions
+
+    Example:
+        >>> _build_rule_index(rules)
+        {'on_start': {'get_user_files': [0, 2]}, 'on_end': {'read_file': [1]}}
+    """
+    index: dict[str, dict[str, list[int]]] = {}
+    for i, rule in enumerate(tool_invocation_rules):
+        trigger_type = (
+            (rule.get("guardrail_definition") or {}).get("trigger", {}).get("type")
+        )
+        tool_name = rule.get("tool_name")
+        if trigger_type and tool_name:
+            index.setdefault(trigger_type, {}).setdefault(tool_name, []).append(i)
+    return index
+
+
+# Parsed session rules:
+# (tool_invocation_rules, compiled_rules, rule_index, disallowed_tools)
+_SessionRules = tuple[
+    list[dict[str, Any]],
+    list[CompiledGuardrail],
+    dict[str, dict[str, list[int]]],
+    frozenset[str],
+]
+
+# Parsed session rules keyed by alignment history ID
+_session_rules_cache: TTLCache[UUID, _SessionRules] = TTLCache(
+    maxsize=10_000, ttl=300
+)
+
+
+def _parse_session_rules(alignment_result: dict[str, Any]) -> _SessionRules:
+    """
+    Parse a stored alignment result into evaluation-ready session rules.
+
+    Every tool invocation rule is compiled here, once per alignment record,
+    rather than on each validation call.
+
+    Args:
+        alignment_result: Alignment result as stored in alignment history
+
+    Returns:
+        Tuple of (tool_invocation_rules, compiled_rules, rule_index,
+        disallowed_tools)
+    """
+    rules = alignment_result.get("tool_invocation_rules", [])
+    # Older alignment results were stored without the index
+    rule_index = alignment_result.get("tool_invocation_rule_index")
+    if rule_index is None:
+        rule_index = _build_rule_index(rules)
+    compiled_rules = [
+        compile_guardrail(rule.get("guardrail_definition") or {}) for rule in rules
+    ]
+    return (
+        rules,
+        compiled_rules,
+        rule_index,
+        frozenset(alignment_result.get("disallowed_tools", [])),
+    )
+
+
 class SafetyService:
     """Service for handling safety operations."""
 
@@ -491,7 +652,6 @@ class SafetyService:
         self.db = db
         self.session_service = SessionService(db)
         self.alignment_history_repo = SessionAlignmentHistoryRepository(db)
-        self.validation_log_repo = SessionValidationLogRepository(db)
 
     async def alignment_session(
         self,
@@ -552,16 +712,18 @@ class SafetyService:
                     "disallowed_tools": alignment_result.get("disallowed_tools", []),
                 }
 
-        # Extract key terms in the user instruction
-        key_terms_output = await self.extract_key_terms_in_user_instruction(
-            latest_user_instruction=user_instruction,
-            past_instructions_history=past_instructions_history,
-            previous_extraction_output=previous_extraction_output,
-        )
-
-        # Read the latest tool definitions from the database
+        # Extract key terms in the user instruction while reading the latest
+        # tool definitions. The LLM call does not touch the database, so the
+        # single DB query can overlap with it on the shared session.
         tool_service = ToolDefinitionService(self.db)
-        tools_data, revision_id = await tool_service.get_latest_revision(agent_uuid)
+        key_terms_output, (tools_data, revision_id) = await asyncio.gather(
+            self.extract_key_terms_in_user_instruction(
+                latest_user_instruction=user_instruction,
+                past_instructions_history=past_instructions_history,
+                previous_extraction_output=previous_extraction_output,
+            ),
+            tool_service.get_latest_revision(agent_uuid),
+        )
 
         # Generate guardrails (tool invocation rules)
         # Pass previous_guardrails for incremental updates in subsequent alignments
@@ -569,7 +731,7 @@ class SafetyService:
             generated_guardrails_result = await self.generate_guardrails(
                 user_instruction=user_instruction,
                 key_terms=key_terms_output,
-                tools_data=tools_data,
+                tools_data=_get_tools_json(tools_data, revision_id),
                 previous_guardrails=previous_guardrails,
             )
         else:
@@ -577,18 +739,20 @@ class SafetyService:
 
         # Store the result in the database
         # Build alignment result with key_terms, tool_invocation_rules, and disallowed_tools
+        tool_invocation_rules = [
+            rule.model_dump()
+            for rule in (
+                generated_guardrails_result.guardrails
+                if generated_guardrails_result
+                else []
+            )
+        ]
         alignment_result = {
             "key_terms": [term.model_dump() for term in key_terms_output.key_terms]
             if hasattr(key_terms_output, "key_terms")
             else [],
-            "tool_invocation_rules": [
-                rule.model_dump()
-                for rule in (
-                    generated_guardrails_result.guardrails
-                    if generated_guardrails_result
-                    else []
-                )
-            ],
+            "tool_invocation_rules": tool_invocation_rules,
+            "tool_invocation_rule_index": _build_rule_index(tool_invocation_rules),
             "disallowed_tools": (
                 generated_guardrails_result.disallowed_tools
                 if generated_guardrails_result
@@ -596,14 +760,20 @@ class SafetyService:
             ),
         }
 
-        # Save alignment history
-        await self.session_service.add_alignment_history(
+        # Save alignment history before responding: the new rules must be
+        # in force for the first validation call that follows
+        history = await self.session_service.add_alignment_history(
             session_id=UUID(session_id),
             user_instruction=user_instruction,
             past_instructions_history=past_instructions_history,
             previous_extraction_output=previous_extraction_output,
             alignment_result=alignment_result,
         )
+        # Warm this worker's rules cache so its first validation call does not
+        # have to compile them
+        _session_rules_cache.set(
+            UUID(history["id"]), _parse_session_rules(alignment_result)
+        )
 
         return session_id, key_terms_output, generated_guardrails_result
 
@@ -613,25 +783,42 @@ class SafetyService:
         past_instructions_history: str | None = None,
         previous_extraction_output: str | None = None,
     ) -> KeyTermsOutput:
-        llm = create_llm_client()
+        today = _today_str()
+        cache_key = make_cache_key(
+            "extract_key_terms",
+            provider=settings.LLM_PROVIDER,
+            model=settings.LLM_MODEL,
+            latest_user_instruction=latest_user_instruction,
+            past_instructions_history=past_instructions_history,
+            previous_extraction_output=previous_extraction_output,
+            date=today,
+        )
+        cached = _llm_response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Key term extraction served from cache")
+            return KeyTermsOutput.model_validate(cached)
 
-        structured_llm = llm.with_structured_output(KeyTermsOutput)
-        chain = KEYTERM_EXTRACTION_PROMPT | structured_llm
+        chain = _keyterm_extraction_chain(get_llm_config_key())
         result = await chain.ainvoke(
             {
+                "system_messages": [
+                    build_system_message(
+                        KEYTERM_EXTRACTION_SYSTEM_PROMPT, f"Today's date is {today}."
+                    )
+                ],
                 "latest_user_instruction": latest_user_instruction,
                 "past_instructions_history": past_instructions_history,
                 "previous_extraction_output": previous_extraction_output,
-                "date": datetime.now().strftime("%Y-%m-%d"),
             }
         )
+        _llm_response_cache.set(cache_key, result.model_dump())
         return result
 
     async def generate_guardrails(
         self,
         user_instruction: str,
         key_terms: KeyTermsOutput,
-        tools_data: dict[str, Any],
+        tools_data: dict[str, Any] | str,
         previous_guardrails: dict[str, Any] | None = None,
     ) -> GeneratedGuardrails:
         """
@@ -644,39 +831,64 @@ class SafetyService:
         Args:
             user_instruction: User's instruction text
             key_terms: Extracted key terms with context
-            tools_data: Tool definitions data from database
+            tools_data: Tool definitions data from database, or its
+                pre-serialized JSON string
             previous_guardrails: Previous alignment result containing
                 tool_invocation_rules and disallowed_tools (optional)
 
         Returns:
             GeneratedGuardrails containing guardrails and disallowed_tools
         """
-        llm = create_llm_client()
-
-        # Use strict, OpenAI-structured-output-compatible schema for parsing.
-        structured_llm = llm.with_structured_output(LLMGeneratedGuardrails)
-        chain = GUARDRAIL_GENERATION_PROMPT | structured_llm
-
         # Format previous guardrails for the prompt
         if previous_guardrails:
-            previous_guardrails_str = json.dumps(previous_guardrails, ensure_ascii=False)
+            previous_guardrails_str = orjson.dumps(previous_guardrails).decode()
         else:
             previous_guardrails_str = "None (this is the first alignment iteration)"
 
-        llm_result: LLMGeneratedGuardrails = await chain.ainvoke(
-            {
-                "user_instruction": user_instruction,
-                "key_terms": json.dumps(
-                    key_terms.model_dump()
-                    if hasattr(key_terms, "model_dump")
-                    else key_terms,
-                    ensure_ascii=False,
-                ),
-                "available_tools": json.dumps(tools_data, ensure_ascii=False),
-                "previous_guardrails": previous_guardrails_str,
-                "date": datetime.now().strftime("%Y-%m-%d"),
-            }
+        today = _today_str()
+        # orjson emits UTF-8 directly (equivalent to ensure_ascii=False)
+        key_terms_str = (
+            key_terms.model_dump_json()
+            if hasattr(key_terms, "model_dump_json")
+            else orjson.dumps(key_terms).decode()
+        )
+        available_tools_str = (
+            tools_data
+            if isinstance(tools_data, str)
+            else _serialize_tools_data(tools_data)
+        )
+
+        cache_key = make_cache_key(
+            "generate_guardrails",
+            provider=settings.LLM_PROVIDER,
+            model=settings.LLM_MODEL,
+            user_instruction=user_instruction,
+            key_terms=key_terms_str,
+            available_tools=available_tools_str,
+            previous_guardrails=previous_guardrails_str,
+            date=today,
         )
+        cached = _llm_response_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Guardrail generation served from cache")
+            llm_result = LLMGeneratedGuardrails.model_validate(cached)
+        else:
+            chain = _guardrail_generation_chain(get_llm_config_key())
+            llm_result = await chain.ainvoke(
+                {
+                    "system_messages": [
+                        build_system_message(
+                            GUARDRAIL_GENERATION_SYSTEM_PROMPT,
+                            f"Today's date is {today}.",
+                        )
+                    ],
+                    "user_instruction": user_instruction,
+                    "key_terms": key_terms_str,
+                    "available_tools": available_tools_str,
+                    "previous_guardrails": previous_guardrails_str,
+                }
+            )
+            _llm_response_cache.set(cache_key, llm_result.model_dump())
 
         # Convert to runtime schema (keeps existing API/storage shape)
         guardrails: list[GeneratedGuardrail] = []
@@ -787,7 +999,7 @@ class SafetyService:
         """
         start_time = time.time()
 
-        logger.info(
+        logger.debug(
             f"Starting session validation for session {session_id}, "
             f"process={process_name}, timing={timing}"
         )
@@ -797,18 +1009,9 @@ class SafetyService:
             session_id, timing, process_name
         )
 
-        # Determine if this tool is registered (from tool_definitions, not alignment result)
-        tool_service = ToolDefinitionService(self.db)
-        tools_data, _ = await tool_service.get_latest_revision(agent_id)
-        if tools_data and "tools" in tools_data:
-            registered_tools = {
-                tool.get("name") for tool in tools_data["tools"] if tool.get("name")
-            }
-        else:
-            registered_tools = set()
-        is_registered_tool = process_name in registered_tools
-
-        # Check disallowed_tools first (only for registered tools)
+        # Check disallowed_tools first (only for registered tools). This path
+        # reports is_registered_tool=True without consulting tool_definitions,
+        # so it is decided before the tool registry lookup below.
         if process_name in disallowed_tools:
             logger.warning(
                 f"Tool '{process_name}' is in disallowed_tools for session {session_id}"
@@ -857,18 +1060,29 @@ class SafetyService:
 
             return False, True, [blocked_guardrail], metadata
 
+        # Determine if this tool is registered (from tool_definitions, not alignment result)
+        tool_service = ToolDefinitionService(self.db)
+        tools_data, _ = await tool_service.get_latest_revision(agent_id)
+        if tools_data and "tools" in tools_data:
+            registered_tools = {
+                tool.get("name") for tool in tools_data["tools"] if tool.get("name")
+            }
+        else:
+            registered_tools = set()
+        is_registered_tool = process_name in registered_tools
+
         # No guardrails for this tool - proceed (could be registered or unregistered)
         if not guardrails:
             evaluation_time_ms = int((time.time() - start_time) * 1000)
             metadata = {"evaluated_guardrails_count": 0, "evaluation_time_ms": evaluation_time_ms}
 
             if is_registered_tool:
-                logger.info(
+                logger.debug(
                     f"No guardrails found for registered tool '{process_name}' "
                     f"in session {session_id} with timing={timing}"
                 )
             else:
-                logger.info(
+                logger.debug(
                     f"Unregistered tool '{process_name}' in session {session_id}"
                 )
 
@@ -890,29 +1104,33 @@ class SafetyService:
 
             return True, is_registered_tool, [], metadata
 
-        triggered_guardrails_list: list[TriggeredGuardrail] = []
-        guardrail_definitions: dict[str, dict[str, Any]] = {}
-
-        # Evaluate each guardrail
-        for idx, guardrail_data in enumerate(guardrails):
-            guardrail_definition = guardrail_data.get("guardrail_definition", {})
-            guardrail_name = guardrail_data.get("tool_name", f"guardrail_{idx}")
-            guardrail_id = f"session_guardrail_{idx}"
-
-            guardrail_definitions[guardrail_id] = guardrail_definition
+        guardrail_definitions: dict[str, dict[str, Any]] = {
+            f"session_guardrail_{idx}": guardrail_data.get("guardrail_definition", {})
+            for idx, (guardrail_data, _) in enumerate(guardrails)
+        }
 
-            triggered_result = await self._evaluate_single_guardrail(
-                guardrail_id=guardrail_id,
-                guardrail_name=guardrail_name,
-                guardrail_definition=guardrail_definition,
-                context=context,
+        # Evaluate all guardrails concurrently (results keep guardrail order)
+        triggered_guardrails_list: list[TriggeredGuardrail] = list(
+            await asyncio.gather(
+                *(
+                    self._evaluate_single_guardrail(
+                        guardrail_id=f"session_guardrail_{idx}",
+                        guardrail_name=guardrail_data.get(
+                            "tool_name", f"guardrail_{idx}"
+                        ),
+                        compiled_guardrail=compiled_guardrail,
+                        context=context,
+                    )
+                    for idx, (guardrail_data, compiled_guardrail) in enumerate(
+                        guardrails
+                    )
+                )
             )
-
-            triggered_guardrails_list.append(triggered_result)
+        )
 
         # Calculate should_proceed
         should_proceed = calculate_should_proceed_with_configs(
-            [tg.model_dump() for tg in triggered_guardrails_list], guardrail_definitions
+            triggered_guardrails_list, guardrail_definitions
         )
 
         # Calculate evaluation time
@@ -956,7 +1174,7 @@ class SafetyService:
 
     async def _get_guardrails_from_session(
         self, session_id: UUID, timing: str, process_name: str
-    ) -> tuple[list[dict[str, Any]], list[str]]:
+    ) -> tuple[list[tuple[dict[str, Any], CompiledGuardrail]], frozenset[str]]:
         """
         Get guardrails and disallowed_tools from session alignment history.
 
@@ -967,38 +1185,51 @@ class SafetyService:
 
         Returns:
             Tuple of (filtered_guardrails, disallowed_tools)
-            - filtered_guardrails: Guardrails matching timing AND tool_name
-            - disallowed_tools: List of disallowed tool names
+            - filtered_guardrails: (rule, compiled rule) pairs matching
+              timing AND tool_name
+            - disallowed_tools: Frozen set of disallowed tool names
 
         Example:
             >>> guardrails, disallowed = await service._get_guardrails_from_session(
             ...     session_id, "on_start", "get_user_files"
             ... )
         """
-        # Get latest alignment history for this session
-        alignment_history = await self.alignment_history_repo.get_latest_by_session(
-            session_id
+        # Resolve the current alignment record (ID only), then reuse its parsed
+        # rules from cache. Alignment records are immutable, so a cache entry
+        # keyed by record ID can never be stale, even across workers.
+        alignment_history_id = (
+            await self.alignment_history_repo.get_latest_id_by_session(session_id)
         )
 
-        if not alignment_history:
+        if not alignment_history_id:
             logger.warning(f"No alignment history found for session {session_id}")
-            return [], []
+            return [], frozenset()
 
-        # Extract guardrails and disallowed_tools from alignment_result
-        alignment_result = alignment_history.alignment_result or {}
-        tool_invocation_rules = alignment_result.get("tool_invocation_rules", [])
-        disallowed_tools = alignment_result.get("disallowed_tools", [])
+        session_rules = _session_rules_cache.get(alignment_history_id)
+        if session_rules is None:
+            alignment_history = await self.alignment_history_repo.get_by_id(
+                alignment_history_id
+            )
+            session_rules = _parse_session_rules(
+                (alignment_history.alignment_result if alignment_history else None)
+                or {}
+            )
+            _session_rules_cache.set(alignment_history_id, session_rules)
+
+        tool_invocation_rules, compiled_rules, rule_index, disallowed_tools = (
+            session_rules
+        )
 
-        # Filter by timing AND tool_name
-        filtered_guardrails = []
-        for rule in tool_invocation_rules:
-            tool_name = rule.get("tool_name")
-            guardrail_def = rule.get("guardrail_definition", {})
-            trigger = guardrail_def.get("trigger", {})
-            trigger_type = trigger.get("type")
+        # Fast path: sessions aligned without tool rules (the common case for
+        # chatty agents) need no per-tool index lookup
+        if not tool_invocation_rules:
+            return [], disallowed_tools
 
-            if trigger_type == timing and tool_name == process_name:
-                filtered_guardrails.append(rule)
+        # Select rules matching timing AND tool_name via the index
+        filtered_guardrails = [
+            (tool_invocation_rules[i], compiled_rules[i])
+            for i in rule_index.get(timing, {}).get(process_name, [])
+        ]
 
         logger.debug(
             f"Found {len(filtered_guardrails)} guardrails for session {session_id} "
@@ -1012,7 +1243,7 @@ class SafetyService:
         self,
         guardrail_id: str,
         guardrail_name: str,
-        guardrail_definition: dict[str, Any],
+        compiled_guardrail: CompiledGuardrail,
         context: dict[str, Any],
     ) -> TriggeredGuardrail:
         """
@@ -1021,7 +1252,7 @@ class SafetyService:
         Args:
             guardrail_id: Guardrail identifier
             guardrail_name: Guardrail name
-            guardrail_definition: Guardrail definition with trigger and actions
+            compiled_guardrail: Compiled guardrail definition
             context: Evaluation context
 
         Returns:
@@ -1029,20 +1260,29 @@ class SafetyService:
 
         Example:
             >>> result = await service._evaluate_single_guardrail(
-            ...     "gr_1", "check_semester", definition, context
+            ...     "gr_1", "check_semester", compile_guardrail(definition), context
             ... )
         """
         try:
-            trigger = guardrail_definition.get("trigger", {})
-            conditions = trigger.get("conditions", [])
-            logic = trigger.get("logic", "and")
-
-            # Evaluate conditions
-            triggered, matched_indices = evaluate_conditions(context, conditions, logic)
+            conditions = compiled_guardrail.conditions
+            logic = compiled_guardrail.logic
+
+            # Evaluate conditions. llm_judge makes a blocking LLM call, so run
+            # those in a worker thread to let concurrent evaluations overlap.
+            if compiled_guardrail.uses_llm_judge:
+                triggered, matched_indices = await asyncio.to_thread(
+                    evaluate_conditions, context, conditions, logic
+                )
+            else:
+                triggered, matched_indices = evaluate_conditions(
+                    context, conditions, logic
+                )
 
+            # Results are built from trusted internal values, so they are
+            # constructed without re-running Pydantic validation
             if not triggered:
                 # Not triggered
-                return TriggeredGuardrail(
+                return TriggeredGuardrail.model_construct(
                     guardrail_id=guardrail_id,
                     guardrail_name=guardrail_name,
                     triggered=False,
@@ -1052,16 +1292,18 @@ class SafetyService:
                 )
 
             # Execute actions
-            actions_config = guardrail_definition.get("actions", [])
             action_results: list[ActionResult] = []
 
-            for action_config in actions_config:
+            for action_config in compiled_guardrail.actions:
                 action_type = action_config.get("type")
 
                 try:
                     if action_type == "block":
                         result = execute_block_action(
-                            action_config, context, matched_indices, conditions
+                            action_config,
+                            context,
+                            matched_indices,
+                            compiled_guardrail.raw_conditions,
                         )
                     elif action_type == "warn":
                         result = execute_warn_action(action_config)
@@ -1071,13 +1313,13 @@ class SafetyService:
                         logger.warning(f"Unknown action type: {action_type}")
                         continue
 
-                    action_results.append(ActionResult(**result))
+                    action_results.append(ActionResult.model_construct(**result))
 
                 except Exception as e:
                     logger.error(f"Action execution error: {str(e)}")
                     # Continue with other actions
 
-            return TriggeredGuardrail(
+            return TriggeredGuardrail.model_construct(
                 guardrail_id=guardrail_id,
                 guardrail_name=guardrail_name,
                 triggered=True,
@@ -1089,7 +1331,7 @@ class SafetyService:
         except (FieldPathResolutionError, ConditionEvaluationError) as e:
             # Known evaluation errors
             logger.error(f"Guardrail evaluation error for {guardrail_name}: {str(e)}")
-            return TriggeredGuardrail(
+            return TriggeredGuardrail.model_construct(
                 guardrail_id=guardrail_id,
                 guardrail_name=guardrail_name,
                 triggered=False,
@@ -1104,7 +1346,7 @@ class SafetyService:
             logger.error(
                 f"Unexpected error evaluating guardrail {guardrail_name}: {str(e)}"
             )
-            return TriggeredGuardrail(
+            return TriggeredGuardrail.model_construct(
                 guardrail_id=guardrail_id,
                 guardrail_name=guardrail_name,
                 triggered=False,
@@ -1131,7 +1373,7 @@ class SafetyService:
         metadata: dict[str, Any],
     ) -> None:
         """
-        Save session validation log to database.
+        Queue session validation log for batched insertion.
 
         Args:
             session_id: Session UUID
@@ -1156,27 +1398,25 @@ class SafetyService:
             "is_registered_tool": is_registered_tool,
             "request_context": context,
             "evaluation_result": {
-                "triggered_guardrails": [
-                    tg.model_dump(mode="json") for tg in triggered_guardrails
-                ],
+                "triggered_guardrails": _TRIGGERED_GUARDRAILS_ADAPTER.dump_python(
+                    triggered_guardrails, mode="json"
+                ),
                 "metadata": metadata,
             },
         }
 
-        try:
-            await self.validation_log_repo.create(
-                {
-                    "session_id": session_id,
-                    "agent_id": agent_id,
-                    "project_id": project_id,
-                    "organization_id": organization_id,
-                    "trace_id": trace_id,
-                    "log_data": log_data,
-                }
-            )
-            await self.db.commit()
-            logger.debug(f"Saved validation log for session {session_id}")
-        except Exception as e:
-            logger.error(f"Failed to save validation log: {str(e)}", exc_info=True)
-            # Don't fail the request if logging fails
-            await self.db.rollback()
+        # Written in batches by a background task; never blocks the request.
+        # created_at is stamped here because a batch shares one transaction,
+        # and the server default would give every row in it the same now().
+        await validation_log_batcher.enqueue(
+            {
+                "created_at": datetime.now(UTC),
+                "session_id": session_id,
+                "agent_id": agent_id,
+                "project_id": project_id,
+                "organization_id": organization_id,
+                "trace_id": trace_id,
+                "log_data": log_data,
+            }
+        )
+        logger.debug(f"Queued validation log for session {session_id}")
@@ -3,15 +3,21 @@ Session service for managing session and alignment history operations.
 
 This service handles session-related operations including CRUD operations,
 alignment history management, and session lifecycle management.
+
+Write methods flush but do not commit: the caller owns the transaction
+(see get_async_db_transaction), so one request commits once.
 """
 
-from typing import Any
+from typing import Any, Generic, TypeVar
 from uuid import UUID
 
 from fastapi import HTTPException, status
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.models.session import Session, SessionAlignmentHistory
 from app.repositories.agent_repository import AgentRepository
 from app.repositories.session_alignment_history_repository import (
     SessionAlignmentHistoryRepository,
@@ -21,10 +27,119 @@ from app.repositories.session_validation_log_repository import (
     SessionValidationLogRepository,
 )
 
+R = TypeVar("R")
+
+# Alignment history data keyed by history ID. History rows are never updated,
+# so an entry stays valid in every worker; freshness comes from looking up the
+# session's latest history ID, which is a cheap index-only query.
+_alignment_history_cache: TTLCache[UUID, dict[str, Any]] = TTLCache(maxsize=1_000)
+
+
+class _AlignmentKeyTerm(BaseModel):
+    """Key term as stored in alignment_result["key_terms"]."""
+
+    term: str = ""
+    category: str = ""
+    user_provided_context: str | None = None
+    confidence: str = "LOW"
+
+
+class _AlignmentRule(BaseModel):
+    """Tool invocation rule as stored in alignment_result["tool_invocation_rules"]."""
+
+    tool_name: str = ""
+    condition: str = ""
+    parameters: dict[str, Any] = Field(default_factory=dict)
+    reasoning: str = ""
+    guardrail_definition: dict[str, Any] | None = None
+
+
+# Parse a whole stored list in one pydantic-core call
+_KEY_TERMS_ADAPTER = TypeAdapter(list[_AlignmentKeyTerm])
+_RULES_ADAPTER = TypeAdapter(list[_AlignmentRule])
+
+
+def _session_to_dict(
+    session: Session, alignment_history_count: int | None
+) -> dict[str, Any]:
+    """
+    Build the session response dictionary.
+
+    Args:
+        session: Session entity
+        alignment_history_count: Number of alignment history records (None
+            when not counted)
+
+    Returns:
+        Dictionary containing session data
+    """
+    return {
+        "id": str(session.id),
+        "agent_id": str(session.agent_id),
+        "project_id": str(session.project_id),
+        "organization_id": str(session.organization_id),
+        "status": session.status,
+        "created_at": session.created_at.isoformat() if session.created_at else None,
+        "updated_at": session.updated_at.isoformat() if session.updated_at else None,
+        "alignment_history_count": alignment_history_count,
+    }
+
+
+def _history_to_dict(history: SessionAlignmentHistory) -> dict[str, Any]:
+    """
+    Build the alignment history response dictionary.
+
+    Args:
+        history: Alignment history entity
+
+    Returns:
+        Dictionary containing alignment history data
+    """
+    return {
+        "id": str(history.id),
+        "session_id": str(history.session_id),
+        "agent_id": str(history.agent_id),
+        "user_instruction": history.user_instruction,
+        "past_instructions_history": history.past_instructions_history,
+        "previous_extraction_output": history.previous_extraction_output,
+        "alignment_result": history.alignment_result,
+        "created_at": history.created_at.isoformat() if history.created_at else None,
+        "updated_at": history.updated_at.isoformat() if history.updated_at else None,
+    }
+
+
+class _LazyRepo(Generic[R]):
+    """
+    Descriptor that builds a repository on first access and caches it.
+
+    The repository is stored in the instance __dict__, which takes
+    precedence over this (non-data) descriptor on later lookups.
+    """
+
+    def __init__(self, repo_class: type[R]):
+        self.repo_class = repo_class
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> R:
+        if obj is None:
+            return self  # type: ignore[return-value]
+        repo = self.repo_class(obj.db)  # type: ignore[call-arg]
+        obj.__dict__[self.name] = repo
+        return repo
+
 
 class SessionService:
     """Service for handling session and alignment history operations."""
 
+    # Created on first use, so a request only builds the repositories it needs
+    session_repo = _LazyRepo(SessionRepository)
+    history_repo = _LazyRepo(SessionAlignmentHistoryRepository)
+    agent_repo = _LazyRepo(AgentRepository)
+    validation_log_repo = _LazyRepo(SessionValidationLogRepository)
+
     def __init__(self, db: AsyncSession):
         """
         Initialize the session service.
@@ -33,10 +148,30 @@ class SessionService:
             db: Async database session
         """
         self.db = db
-        self.session_repo = SessionRepository(db)
-        self.history_repo = SessionAlignmentHistoryRepository(db)
-        self.agent_repo = AgentRepository(db)
-        self.validation_log_repo = SessionValidationLogRepository(db)
+
+    async def _get_latest_history_data(self, session_id: UUID) -> dict[str, Any] | None:
+        """
+        Get a session's latest alignment history data, cached by history ID.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            Alignment history data (see _history_to_dict) or None if the
+            session has no alignment history
+        """
+        history_id = await self.history_repo.get_latest_id_by_session(session_id)
+        if history_id is None:
+            return None
+
+        history_data = _alignment_history_cache.get(history_id)
+        if history_data is None:
+            history = await self.history_repo.get_by_id(history_id)
+            if not history:
+                return None
+            history_data = _history_to_dict(history)
+            _alignment_history_cache.set(history_id, history_data)
+        return history_data
 
     async def create_session(self, agent_id: UUID) -> dict[str, Any]:
         """
@@ -54,41 +189,37 @@ class SessionService:
             HTTPException: If creation fails or agent not found
         """
         try:
-            # Get agent to extract project_id and organization_id
-            agent = await self.agent_repo.get_by_id(agent_id)
-            if not agent:
+            ownership = await self.agent_repo.get_project_org(agent_id)
+            if ownership is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Agent not found",
                 )
+            project_id, organization_id = ownership
 
-            # Create session
+            # Timestamps come back from the INSERT via RETURNING, and a new
+            # session has no alignment history, so no re-read is needed
             session = await self.session_repo.create(
                 {
                     "agent_id": agent_id,
-                    "project_id": agent.project_id,
-                    "organization_id": agent.organization_id,
+                    "project_id": project_id,
+                    "organization_id": organization_id,
                     "status": "active",
                 }
             )
 
-            await self.db.commit()
-
-            return await self.get_session(session.id)
+            return _session_to_dict(session, alignment_history_count=0)
 
         except HTTPException:
-            await self.db.rollback()
             raise
 
         except IntegrityError as e:
-            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Session creation failed: {str(e)}",
             )
 
         except Exception as e:
-            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Unexpected error creating session: {str(e)}",
@@ -117,20 +248,7 @@ class SessionService:
         # Get alignment history count
         alignment_history_count = await self.history_repo.count_by_session(session.id)
 
-        return {
-            "id": str(session.id),
-            "agent_id": str(session.agent_id),
-            "project_id": str(session.project_id),
-            "organization_id": str(session.organization_id),
-            "status": session.status,
-            "created_at": session.created_at.isoformat()
-            if session.created_at
-            else None,
-            "updated_at": session.updated_at.isoformat()
-            if session.updated_at
-            else None,
-            "alignment_history_count": alignment_history_count,
-        }
+        return _session_to_dict(session, alignment_history_count)
 
     async def list_sessions(
         self,
@@ -138,6 +256,7 @@ class SessionService:
         page: int = 1,
         page_size: int = 20,
         status: str | None = None,
+        include_counts: bool = False,
     ) -> dict[str, Any]:
         """
         List sessions for an agent with pagination and filtering.
@@ -147,6 +266,8 @@ class SessionService:
             page: Page number (1-indexed)
             page_size: Number of items per page
             status: Filter by status
+            include_counts: Also count alignment history per session (one
+                extra query); otherwise alignment_history_count is None
 
         Returns:
             Dictionary with items, total, page, page_size
@@ -158,27 +279,21 @@ class SessionService:
             status=status,
         )
 
-        items = []
-        for session in sessions:
-            alignment_history_count = await self.history_repo.count_by_session(
-                session.id
+        history_counts: dict[UUID, int] | None = None
+        if include_counts:
+            history_counts = await self.history_repo.count_by_sessions(
+                [session.id for session in sessions]
             )
-            items.append(
-                {
-                    "id": str(session.id),
-                    "agent_id": str(session.agent_id),
-                    "project_id": str(session.project_id),
-                    "organization_id": str(session.organization_id),
-                    "status": session.status,
-                    "created_at": session.created_at.isoformat()
-                    if session.created_at
-                    else None,
-                    "updated_at": session.updated_at.isoformat()
-                    if session.updated_at
-                    else None,
-                    "alignment_history_count": alignment_history_count,
-                }
+
+        items = [
+            _session_to_dict(
+                session,
+                history_counts.get(session.id, 0)
+                if history_counts is not None
+                else None,
             )
+            for session in sessions
+        ]
 
         return {
             "items": items,
@@ -214,57 +329,36 @@ class SessionService:
             HTTPException: If creation fails or session not found
         """
         try:
-            # Get session to extract agent_id
-            session = await self.session_repo.get_by_id(session_id)
-            if not session:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Session not found",
-                )
-
-            # Create alignment history
-            history = await self.history_repo.create(
+            # agent_id is copied from the session inside the INSERT
+            history = await self.history_repo.create_for_session(
+                session_id,
                 {
-                    "session_id": session_id,
-                    "agent_id": session.agent_id,
                     "user_instruction": user_instruction,
                     "past_instructions_history": past_instructions_history,
                     "previous_extraction_output": previous_extraction_output,
                     "alignment_result": alignment_result,
-                }
+                },
             )
+            if not history:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Session not found",
+                )
 
-            await self.db.commit()
-
-            return {
-                "id": str(history.id),
-                "session_id": str(history.session_id),
-                "agent_id": str(history.agent_id),
-                "user_instruction": history.user_instruction,
-                "past_instructions_history": history.past_instructions_history,
-                "previous_extraction_output": history.previous_extraction_output,
-                "alignment_result": history.alignment_result,
-                "created_at": history.created_at.isoformat()
-                if history.created_at
-                else None,
-                "updated_at": history.updated_at.isoformat()
-                if history.updated_at
-                else None,
-            }
+            history_data = _history_to_dict(history)
+            _alignment_history_cache.set(history.id, history_data)
+            return history_data
 
         except HTTPException:
-            await self.db.rollback()
             raise
 
         except IntegrityError as e:
-            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Alignment history creation failed: {str(e)}",
             )
 
         except Exception as e:
-            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Unexpected error creating alignment history: {str(e)}",
@@ -291,26 +385,7 @@ class SessionService:
                 detail="Session not found",
             )
 
-        # Get latest alignment history
-        history = await self.history_repo.get_latest_by_session(session_id)
-        if not history:
-            return None
-
-        return {
-            "id": str(history.id),
-            "session_id": str(history.session_id),
-            "agent_id": str(history.agent_id),
-            "user_instruction": history.user_instruction,
-            "past_instructions_history": history.past_instructions_history,
-            "previous_extraction_output": history.previous_extraction_output,
-            "alignment_result": history.alignment_result,
-            "created_at": history.created_at.isoformat()
-            if history.created_at
-            else None,
-            "updated_at": history.updated_at.isoformat()
-            if history.updated_at
-            else None,
-        }
+        return await self._get_latest_history_data(session_id)
 
     async def complete_session(self, session_id: UUID) -> dict[str, Any]:
         """
@@ -326,23 +401,22 @@ class SessionService:
             HTTPException: If session not found or update fails
         """
         try:
-            session = await self.session_repo.complete_session(session_id)
-            if not session:
+            completed = await self.session_repo.complete_session_with_history_count(
+                session_id
+            )
+            if not completed:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="Session not found",
                 )
 
-            await self.db.commit()
-
-            return await self.get_session(session.id)
+            session, alignment_history_count = completed
+            return _session_to_dict(session, alignment_history_count)
 
         except HTTPException:
-            await self.db.rollback()
             raise
 
         except Exception as e:
-            await self.db.rollback()
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Unexpected error completing session: {str(e)}",
@@ -371,7 +445,8 @@ class SessionService:
         Returns:
             Dictionary with sessions list and total count
         """
-        sessions, total = await self.session_repo.get_by_agent(
+        # Sessions with their latest alignment and validation summary
+        rows, total = await self.session_repo.get_dashboard_page(
             agent_id=agent_id,
             page=page,
             page_size=page_size,
@@ -379,44 +454,22 @@ class SessionService:
         )
 
         items = []
-        for session in sessions:
-            # Get latest alignment history for user_instruction and counts
-            latest_alignment = await self.history_repo.get_latest_by_session(session.id)
-
-            # Get validation logs count and check for invalid validations
-            (
-                validation_logs,
-                validation_count,
-            ) = await self.validation_log_repo.list_by_session(
-                session.id, page=1, page_size=1000
-            )
+        for row in rows:
+            session = row.Session
 
-            # Calculate counts from alignment_result
-            user_instruction = ""
-            ambiguous_terms_count = 0
-            resolved_terms_count = 0
-            validation_rules_count = 0
-
-            if latest_alignment:
-                user_instruction = latest_alignment.user_instruction or ""
-                alignment_result = latest_alignment.alignment_result or {}
-                key_terms = alignment_result.get("key_terms", [])
-
-                # Ambiguous = no user_provided_context, Resolved = has user_provided_context
-                for term in key_terms:
-                    if term.get("user_provided_context"):
-                        resolved_terms_count += 1
-                    else:
-                        ambiguous_terms_count += 1
-
-                validation_rules_count = len(
-                    alignment_result.get("tool_invocation_rules", [])
-                )
+            # Calculate counts from the latest alignment_result
+            user_instruction = row.user_instruction or ""
+            alignment_result = row.alignment_result or {}
+            key_terms = alignment_result.get("key_terms", [])
 
-            # Check for invalid validations (should_proceed = False)
-            has_invalid_validations = any(
-                not (log.log_data or {}).get("should_proceed", True)
-                for log in validation_logs
+            # Ambiguous = no user_provided_context, Resolved = has user_provided_context
+            resolved_terms_count = sum(
+                1 for term in key_terms if term.get("user_provided_context")
+            )
+            ambiguous_terms_count = len(key_terms) - resolved_terms_count
+
+            validation_rules_count = len(
+                alignment_result.get("tool_invocation_rules", [])
             )
 
             items.append(
@@ -426,14 +479,10 @@ class SessionService:
                     "ambiguous_terms_count": ambiguous_terms_count,
                     "resolved_terms_count": resolved_terms_count,
                     "validation_rules_count": validation_rules_count,
-                    "validation_history_count": validation_count,
-                    "has_invalid_validations": has_invalid_validations,
-                    "created_at": session.created_at.isoformat()
-                    if session.created_at
-                    else "",
-                    "updated_at": session.updated_at.isoformat()
-                    if session.updated_at
-                    else "",
+                    "validation_history_count": row.validation_count,
+                    "has_invalid_validations": row.has_invalid_validations,
+                    "created_at": session.created_at,
+                    "updated_at": session.updated_at,
                 }
             )
 
@@ -445,6 +494,8 @@ class SessionService:
     async def get_session_detail_for_dashboard(
         self,
         session_id: UUID,
+        history_page: int = 1,
+        history_page_size: int = 1000,
     ) -> dict[str, Any]:
         """
         Get session detail for dashboard display.
@@ -453,10 +504,12 @@ class SessionService:
 
         Args:
             session_id: Session UUID
+            history_page: Validation history page number (1-indexed)
+            history_page_size: Validation history entries per page
 
         Returns:
             Dictionary with inference_result, validation_rules, validation_history,
-            user_instruction_history
+            validation_history_total, user_instruction_history
 
         Raises:
             HTTPException: If session not found
@@ -468,25 +521,19 @@ class SessionService:
                 detail="Session not found",
             )
 
-        # Get all alignment history for user_instruction_history
-        all_alignments, _ = await self.history_repo.get_by_session(
-            session_id, page=1, page_size=1000
-        )
-
-        # Build user_instruction_history (ordered by created_at ASC for chronological order)
-        user_instruction_history: list[dict[str, str]] = []
-        for alignment in reversed(all_alignments):  # reverse to get chronological order
-            user_instruction_history.append(
-                {
-                    "user_instruction": alignment.user_instruction or "",
-                    "created_at": alignment.created_at.isoformat()
-                    if alignment.created_at
-                    else "",
-                }
+        # Build user_instruction_history (oldest first, ordered in SQL)
+        user_instruction_history = [
+            {
+                "user_instruction": user_instruction or "",
+                "created_at": created_at,
+            }
+            for user_instruction, created_at in (
+                await self.history_repo.list_user_instructions(session_id)
             )
+        ]
 
         # Get latest alignment history
-        latest_alignment = await self.history_repo.get_latest_by_session(session_id)
+        latest_alignment = await self._get_latest_history_data(session_id)
 
         # Build inference_result
         inference_result: dict[str, Any] = {
@@ -499,77 +546,70 @@ class SessionService:
 
         if latest_alignment:
             inference_result["user_instruction"] = (
-                latest_alignment.user_instruction or ""
+                latest_alignment["user_instruction"] or ""
+            )
+            alignment_result = latest_alignment["alignment_result"] or {}
+            key_terms = _KEY_TERMS_ADAPTER.validate_python(
+                alignment_result.get("key_terms", [])
             )
-            alignment_result = latest_alignment.alignment_result or {}
-            key_terms = alignment_result.get("key_terms", [])
 
-            for term in key_terms:
-                if term.get("user_provided_context"):
-                    # Resolved term
-                    inference_result["resolved_terms"].append(
-                        {
-                            "term": term.get("term", ""),
-                            "category": term.get("category", ""),
-                            "resolved_value": term.get("user_provided_context", ""),
-                            "confidence": term.get("confidence", "LOW"),
-                        }
-                    )
-                else:
-                    # Ambiguous term
-                    inference_result["ambiguous_terms"].append(
-                        {
-                            "term": term.get("term", ""),
-                            "category": term.get("category", ""),
-                        }
-                    )
+            # Resolved terms have user_provided_context, ambiguous ones do not
+            inference_result["resolved_terms"] = [
+                {
+                    "term": term.term,
+                    "category": term.category,
+                    "resolved_value": term.user_provided_context,
+                    "confidence": term.confidence,
+                }
+                for term in key_terms
+                if term.user_provided_context
+            ]
+            inference_result["ambiguous_terms"] = [
+                {"term": term.term, "category": term.category}
+                for term in key_terms
+                if not term.user_provided_context
+            ]
 
             # Get validation rules from alignment_result
-            raw_rules = alignment_result.get("tool_invocation_rules", [])
-            for rule in raw_rules:
-                validation_rules.append(
-                    {
-                        "tool_name": rule.get("tool_name", ""),
-                        "condition": rule.get("condition", ""),
-                        "parameters": rule.get("parameters", {}),
-                        "reasoning": rule.get("reasoning", ""),
-                        "guardrail_definition": rule.get("guardrail_definition"),
-                    }
+            validation_rules = _RULES_ADAPTER.dump_python(
+                _RULES_ADAPTER.validate_python(
+                    alignment_result.get("tool_invocation_rules", [])
                 )
+            )
 
             # Get disallowed tools from alignment_result
             disallowed_tools = alignment_result.get("disallowed_tools", [])
 
-        # Build validation_history from validation logs
-        validation_logs, _ = await self.validation_log_repo.list_by_session(
-            session_id, page=1, page_size=1000
+        # Build validation_history from the projected validation logs
+        (
+            history_rows,
+            validation_history_total,
+        ) = await self.validation_log_repo.list_history_by_session(
+            session_id, page=history_page, page_size=history_page_size
         )
-
-        validation_history: list[dict[str, Any]] = []
-        for log in validation_logs:
-            log_data = log.log_data or {}
-
-            validation_history.append(
-                {
-                    "timestamp": log.created_at.isoformat() if log.created_at else "",
-                    "timing": log_data.get("timing", ""),
-                    "process_name": log_data.get("process_name", ""),
-                    "process_type": log_data.get("process_type", ""),
-                    "should_proceed": log_data.get("should_proceed", True),
-                    "is_registered_tool": log_data.get("is_registered_tool", True),
-                    "request_context": log_data.get("request_context", {}),
-                    "evaluation_result": log_data.get("evaluation_result", {}),
-                }
-            )
+        validation_history = [
+            {
+                "timestamp": row.created_at,
+                "timing": row.timing or "",
+                "process_name": row.process_name or "",
+                "process_type": row.process_type or "",
+                "should_proceed": row.should_proceed is not False,
+                "is_registered_tool": row.is_registered_tool is not False,
+                "request_context": row.request_context or {},
+                "evaluation_result": row.evaluation_result or {},
+            }
+            for row in history_rows
+        ]
 
         return {
             "inference_result": inference_result,
             "validation_rules": validation_rules,
             "validation_history": validation_history,
+            "validation_history_total": validation_history_total,
             "user_instruction_history": user_instruction_history,
             "disallowed_tools": disallowed_tools,
-            "created_at": session.created_at.isoformat() if session.created_at else "",
-            "updated_at": session.updated_at.isoformat() if session.updated_at else "",
+            "created_at": session.created_at,
+            "updated_at": session.updated_at,
         }
 
 
@@ -59,6 +59,10 @@ class ToolDefinitionService:
         Raises:
             Exception: If database operation fails
 
+        Note:
+            Changes are flushed, not committed; the caller commits them
+            (e.g. via get_async_db_transaction).
+
         Example:
             >>> request = ToolRegistrationRequest(
             ...     tools=[
@@ -86,42 +90,32 @@ class ToolDefinitionService:
             # Store tools as-is without validation
             tools_data = {"tools": request.tools}
 
-            new_revision = await self.revision_repo.create_revision(
-                agent_id=agent_id,
-                tools_data=tools_data,
-                previous_revision_id=previous_revision_id,
-            )
-
-            # Step 4: Update ToolDefinition to point to new revision
-            await self.tool_def_repo.update_latest_revision_id(
-                tool_definition_id=tool_definition.id, revision_id=new_revision.id
+            # Step 4: Insert the revision and point ToolDefinition at it
+            revision_id, created_at = await self.revision_repo.create_latest_revision(
+                tool_definition=tool_definition, tools_data=tools_data
             )
 
-            # Step 5: Commit transaction
-            await self.db.commit()
-
-            # Step 6: Build response
+            # Step 5: Build response (committed by the caller's transaction)
             response = ToolRegistrationResponse(
                 tool_definition_id=str(tool_definition.id),
-                revision_id=str(new_revision.id),
+                revision_id=str(revision_id),
                 agent_id=str(agent_id),
                 tools_count=len(request.tools),
                 previous_revision_id=str(previous_revision_id)
                 if previous_revision_id
                 else None,
-                created_at=new_revision.created_at.isoformat(),
+                created_at=created_at.isoformat(),
             )
 
             logger.info(
                 f"Registered {len(request.tools)} tools for agent {agent_id}, "
-                f"revision {new_revision.id}"
+                f"revision {revision_id}"
             )
 
             return response
 
         except Exception as e:
-            # Rollback on error
-            await self.db.rollback()
+            # The caller's transaction rolls back on error
             logger.error(
                 f"Failed to register tools for agent {agent_id}: {str(e)}",
                 exc_info=True,
@@ -146,13 +140,7 @@ class ToolDefinitionService:
             ...     print(f"Found {len(tools_data['tools'])} tools")
             ...     print(f"Revision: {revision_id}")
         """
-        tool_definition = await self.tool_def_repo.get_by_agent_id(agent_id)
-        if not tool_definition or not tool_definition.latest_revision_id:
-            return None, None
-
-        revision = await self.revision_repo.get_by_id(
-            tool_definition.latest_revision_id
-        )
+        revision = await self.revision_repo.get_latest_by_agent_id(agent_id)
         if not revision:
             return None, None
 
@@ -5,18 +5,150 @@ This service handles trace-related operations including CRUD operations,
 observation management, and hierarchical tree building.
 """
 
+from collections import Counter, defaultdict
 from datetime import datetime
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException
+from fastapi import status as http_status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache
+from app.core.pagination import Cursor, decode_cursor, encode_cursor
+from app.models.trace import Observation, Trace
 from app.repositories.agent_repository import AgentRepository
 from app.repositories.observation_repository import ObservationRepository
 from app.repositories.project_member_repository import ProjectMemberRepository
 from app.repositories.trace_repository import TraceRepository
 
+# List totals keyed by (listing, parent ID, *filters). Totals grow as traces
+# are ingested, so entries are only kept briefly; a total up to TOTAL_TTL
+# seconds old is accepted in exchange for not re-counting on every page.
+TOTAL_TTL = 30
+_list_total_cache: TTLCache[tuple[Any, ...], int] = TTLCache(
+    maxsize=1_024, ttl=TOTAL_TTL
+)
+
+
+def _duration_ms(started_at: datetime | None, ended_at: datetime | None) -> int | None:
+    """
+    Duration between two timestamps in milliseconds.
+
+    Mirrors the repositories' calculate_duration, using already loaded columns.
+
+    Args:
+        started_at: Start timestamp
+        ended_at: End timestamp (None while still running)
+
+    Returns:
+        Duration in milliseconds, None if not ended
+    """
+    if not started_at or not ended_at:
+        return None
+    duration_seconds = (ended_at - started_at).total_seconds()
+    return int(duration_seconds * 1000) if duration_seconds else None
+
+
+def _trace_to_dict(trace: Trace) -> dict[str, Any]:
+    """
+    Convert a trace row to its response dictionary.
+
+    UUIDs and timestamps are left as Python objects; they are serialized
+    once when the response is rendered.
+
+    Args:
+        trace: Trace row
+
+    Returns:
+        Dictionary containing trace data
+    """
+    return {
+        "id": trace.id,
+        "agent_id": trace.agent_id,
+        "project_id": trace.project_id,
+        "organization_id": trace.organization_id,
+        "status": trace.status,
+        "started_at": trace.started_at,
+        "ended_at": trace.ended_at,
+        "metadata": trace.trace_metadata,
+        "created_at": trace.created_at,
+        "updated_at": trace.updated_at,
+        "observation_count": trace.observation_count,
+        "duration_ms": _duration_ms(trace.started_at, trace.ended_at),
+    }
+
+
+def _observation_to_dict(observation: Observation) -> dict[str, Any]:
+    """
+    Convert an observation row to its response dictionary.
+
+    UUIDs and timestamps are left as Python objects; they are serialized
+    once when the response is rendered.
+
+    Args:
+        observation: Observation row
+
+    Returns:
+        Dictionary containing observation data
+    """
+    return {
+        "id": observation.id,
+        "trace_id": observation.trace_id,
+        "parent_observation_id": observation.parent_observation_id,
+        "type": observation.type,
+        "name": observation.name,
+        "status": observation.status,
+        "started_at": observation.started_at,
+        "ended_at": observation.ended_at,
+        "metadata": observation.observation_metadata,
+        "created_at": observation.created_at,
+        "updated_at": observation.updated_at,
+        "child_count": observation.child_count,
+        "duration_ms": _duration_ms(observation.started_at, observation.ended_at),
+    }
+
+
+def _parse_cursor(cursor: str | None) -> Cursor | None:
+    """
+    Decode a client-supplied pagination cursor.
+
+    Args:
+        cursor: Cursor string, or None for offset pagination
+
+    Returns:
+        Decoded (started_at, id) position, or None
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+def _next_cursor(rows: list[Trace] | list[Observation], page_size: int) -> str | None:
+    """
+    Cursor for the page after rows, or None if rows is the last page.
+
+    Args:
+        rows: Rows of the current page, in listing order
+        page_size: Requested page size
+
+    Returns:
+        Cursor string, or None
+    """
+    if len(rows) < page_size:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.started_at, last.id)
+
 
 class TraceService:
     """Service for handling trace and observation operations."""
@@ -50,31 +182,35 @@ class TraceService:
         trace = await self.trace_repo.get_by_id(trace_id)
         if not trace:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=http_status.HTTP_404_NOT_FOUND,
                 detail="Trace not found",
             )
+        return _trace_to_dict(trace)
 
-        # Get observation count
-        observation_count = await self.trace_repo.get_observation_count(trace.id)
+    async def get_trace_with_membership(
+        self, trace_id: UUID, user_id: UUID
+    ) -> tuple[dict[str, Any], bool]:
+        """
+        Get trace by ID together with the user's project membership.
 
-        # Calculate duration
-        duration_seconds = await self.trace_repo.calculate_duration(trace.id)
-        duration_ms = int(duration_seconds * 1000) if duration_seconds else None
+        Args:
+            trace_id: Trace UUID
+            user_id: User UUID
 
-        return {
-            "id": str(trace.id),
-            "agent_id": str(trace.agent_id),
-            "project_id": str(trace.project_id),
-            "organization_id": str(trace.organization_id),
-            "status": trace.status,
-            "started_at": trace.started_at.isoformat() if trace.started_at else None,
-            "ended_at": trace.ended_at.isoformat() if trace.ended_at else None,
-            "metadata": trace.trace_metadata,
-            "created_at": trace.created_at.isoformat() if trace.created_at else None,
-            "updated_at": trace.updated_at.isoformat() if trace.updated_at else None,
-            "observation_count": observation_count,
-            "duration_ms": duration_ms,
-        }
+        Returns:
+            Tuple of (trace data, whether the user is a project member)
+
+        Raises:
+            HTTPException: If trace not found
+        """
+        row = await self.trace_repo.get_with_membership(trace_id, user_id)
+        if row is None:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="Trace not found",
+            )
+        trace, is_member = row
+        return _trace_to_dict(trace), is_member
 
     async def list_traces(
         self,
@@ -84,21 +220,31 @@ class TraceService:
         status: str | None = None,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """
         List traces for an agent with pagination and filtering.
 
         Args:
             agent_id: Agent UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
             status: Filter by status
             start_date: Filter traces started after this date
             end_date: Filter traces started before this date
+            cursor: next_cursor from the previous page (keyset pagination)
+            include_total: Whether to return the number of matching traces
 
         Returns:
-            Dictionary with items, total, page, page_size
+            Dictionary with items, total, page, page_size, next_cursor
+            (total is None unless include_total is set)
+
+        Raises:
+            HTTPException: If cursor is malformed
         """
+        total_key = ("traces", agent_id, status, start_date, end_date)
+        cached_total = _list_total_cache.get(total_key) if include_total else None
         traces, total = await self.trace_repo.get_by_agent(
             agent_id=agent_id,
             page=page,
@@ -106,42 +252,22 @@ class TraceService:
             status=status,
             start_date=start_date,
             end_date=end_date,
+            cursor=_parse_cursor(cursor),
+            include_total=include_total and cached_total is None,
         )
+        if total is None:
+            total = cached_total
+        elif include_total:
+            _list_total_cache.set(total_key, total)
 
-        items = []
-        for trace in traces:
-            observation_count = await self.trace_repo.get_observation_count(trace.id)
-            duration_seconds = await self.trace_repo.calculate_duration(trace.id)
-            duration_ms = int(duration_seconds * 1000) if duration_seconds else None
-
-            items.append(
-                {
-                    "id": str(trace.id),
-                    "agent_id": str(trace.agent_id),
-                    "project_id": str(trace.project_id),
-                    "organization_id": str(trace.organization_id),
-                    "status": trace.status,
-                    "started_at": trace.started_at.isoformat()
-                    if trace.started_at
-                    else None,
-                    "ended_at": trace.ended_at.isoformat() if trace.ended_at else None,
-                    "metadata": trace.trace_metadata,
-                    "created_at": trace.created_at.isoformat()
-                    if trace.created_at
-                    else None,
-                    "updated_at": trace.updated_at.isoformat()
-                    if trace.updated_at
-                    else None,
-                    "observation_count": observation_count,
-                    "duration_ms": duration_ms,
-                }
-            )
+        items = [_trace_to_dict(trace) for trace in traces]
 
         return {
             "items": items,
             "total": total,
             "page": page,
             "page_size": page_size,
+            "next_cursor": _next_cursor(traces, page_size),
         }
 
     async def create_trace(
@@ -169,32 +295,35 @@ class TraceService:
             HTTPException: If agent not found
         """
         # Verify agent exists and get project/organization IDs
-        agent = await self.agent_repo.get_by_id(agent_id)
-        if not agent:
+        ownership = await self.agent_repo.get_project_org(agent_id)
+        if ownership is None:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=http_status.HTTP_404_NOT_FOUND,
                 detail="Agent not found",
             )
+        project_id, organization_id = ownership
 
         try:
             # Create trace
             trace_data = {
                 "agent_id": agent_id,
-                "project_id": agent.project_id,
-                "organization_id": agent.organization_id,
+                "project_id": project_id,
+                "organization_id": organization_id,
                 "status": status,
-                "started_at": started_at or datetime.utcnow(),
                 "trace_metadata": trace_metadata,
             }
+            # Without a client timestamp the database fills in now()
+            if started_at is not None:
+                trace_data["started_at"] = started_at
             trace = await self.trace_repo.create(trace_data)
 
             await self.db.commit()
-            return await self.get_trace(trace.id)
+            return _trace_to_dict(trace)
 
         except Exception as e:
             await self.db.rollback()
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=http_status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to create trace: {str(e)}",
             )
 
@@ -220,14 +349,6 @@ class TraceService:
         Raises:
             HTTPException: If trace not found
         """
-        # Verify trace exists
-        trace = await self.trace_repo.get_by_id(trace_id)
-        if not trace:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Trace not found",
-            )
-
         try:
             update_data = {}
             if status is not None:
@@ -237,15 +358,17 @@ class TraceService:
             if trace_metadata is not None:
                 update_data["trace_metadata"] = trace_metadata
 
-            updated_trace = await self.trace_repo.update(trace_id, update_data)
+            updated_trace = await self.trace_repo.update_returning(
+                trace_id, update_data
+            )
             if not updated_trace:
                 raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
+                    status_code=http_status.HTTP_404_NOT_FOUND,
                     detail="Trace not found",
                 )
 
             await self.db.commit()
-            return await self.get_trace(trace_id)
+            return _trace_to_dict(updated_trace)
 
         except HTTPException:
             await self.db.rollback()
@@ -253,7 +376,7 @@ class TraceService:
         except Exception as e:
             await self.db.rollback()
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=http_status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to update trace: {str(e)}",
             )
 
@@ -275,44 +398,10 @@ class TraceService:
         observation = await self.observation_repo.get_by_id(observation_id)
         if not observation:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=http_status.HTTP_404_NOT_FOUND,
                 detail="Observation not found",
             )
-
-        # Get child count
-        child_count = await self.observation_repo.get_child_count(observation.id)
-
-        # Calculate duration
-        duration_seconds = await self.observation_repo.calculate_duration(
-            observation.id
-        )
-        duration_ms = int(duration_seconds * 1000) if duration_seconds else None
-
-        return {
-            "id": str(observation.id),
-            "trace_id": str(observation.trace_id),
-            "parent_observation_id": str(observation.parent_observation_id)
-            if observation.parent_observation_id
-            else None,
-            "type": observation.type,
-            "name": observation.name,
-            "status": observation.status,
-            "started_at": observation.started_at.isoformat()
-            if observation.started_at
-            else None,
-            "ended_at": observation.ended_at.isoformat()
-            if observation.ended_at
-            else None,
-            "metadata": observation.observation_metadata,
-            "created_at": observation.created_at.isoformat()
-            if observation.created_at
-            else None,
-            "updated_at": observation.updated_at.isoformat()
-            if observation.updated_at
-            else None,
-            "child_count": child_count,
-            "duration_ms": duration_ms,
-        }
+        return _observation_to_dict(observation)
 
     async def list_observations(
         self,
@@ -320,67 +409,50 @@ class TraceService:
         page: int = 1,
         page_size: int = 20,
         observation_type: str | None = None,
+        cursor: str | None = None,
+        include_total: bool = False,
     ) -> dict[str, Any]:
         """
         List observations for a trace (flat list).
 
         Args:
             trace_id: Trace UUID
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when cursor is given
             page_size: Number of items per page
             observation_type: Filter by observation type
+            cursor: next_cursor from the previous page (keyset pagination)
+            include_total: Whether to return the number of matching observations
 
         Returns:
-            Dictionary with items, total, page, page_size
+            Dictionary with items, total, page, page_size, next_cursor
+            (total is None unless include_total is set)
+
+        Raises:
+            HTTPException: If cursor is malformed
         """
+        total_key = ("observations", trace_id, observation_type)
+        cached_total = _list_total_cache.get(total_key) if include_total else None
         observations, total = await self.observation_repo.get_by_trace_id(
             trace_id=trace_id,
             page=page,
             page_size=page_size,
             observation_type=observation_type,
+            cursor=_parse_cursor(cursor),
+            include_total=include_total and cached_total is None,
         )
+        if total is None:
+            total = cached_total
+        elif include_total:
+            _list_total_cache.set(total_key, total)
 
-        items = []
-        for observation in observations:
-            child_count = await self.observation_repo.get_child_count(observation.id)
-            duration_seconds = await self.observation_repo.calculate_duration(
-                observation.id
-            )
-            duration_ms = int(duration_seconds * 1000) if duration_seconds else None
-
-            items.append(
-                {
-                    "id": str(observation.id),
-                    "trace_id": str(observation.trace_id),
-                    "parent_observation_id": str(observation.parent_observation_id)
-                    if observation.parent_observation_id
-                    else None,
-                    "type": observation.type,
-                    "name": observation.name,
-                    "status": observation.status,
-                    "started_at": observation.started_at.isoformat()
-                    if observation.started_at
-                    else None,
-                    "ended_at": observation.ended_at.isoformat()
-                    if observation.ended_at
-                    else None,
-                    "metadata": observation.observation_metadata,
-                    "created_at": observation.created_at.isoformat()
-                    if observation.created_at
-                    else None,
-                    "updated_at": observation.updated_at.isoformat()
-                    if observation.updated_at
-                    else None,
-                    "child_count": child_count,
-                    "duration_ms": duration_ms,
-                }
-            )
+        items = [_observation_to_dict(observation) for observation in observations]
 
         return {
             "items": items,
             "total": total,
             "page": page,
             "page_size": page_size,
+            "next_cursor": _next_cursor(observations, page_size),
         }
 
     async def get_observation_tree(self, trace_id: UUID) -> list[dict[str, Any]]:
@@ -396,43 +468,18 @@ class TraceService:
         # Get all observations for the trace
         all_observations = await self.observation_repo.get_tree_by_trace_id(trace_id)
 
-        # Build lookup map
-        obs_map = {}
+        # Build the tree in one pass. Each node's children list is the shared
+        # list for its ID, so a child loaded before its parent still attaches;
+        # nodes whose parent is not in the trace are dropped.
+        children_by_parent: defaultdict[UUID | None, list[dict[str, Any]]] = (
+            defaultdict(list)
+        )
         for obs in all_observations:
-            child_count = await self.observation_repo.get_child_count(obs.id)
-            duration_seconds = await self.observation_repo.calculate_duration(obs.id)
-            duration_ms = int(duration_seconds * 1000) if duration_seconds else None
-
-            obs_map[str(obs.id)] = {
-                "id": str(obs.id),
-                "trace_id": str(obs.trace_id),
-                "parent_observation_id": str(obs.parent_observation_id)
-                if obs.parent_observation_id
-                else None,
-                "type": obs.type,
-                "name": obs.name,
-                "status": obs.status,
-                "started_at": obs.started_at.isoformat() if obs.started_at else None,
-                "ended_at": obs.ended_at.isoformat() if obs.ended_at else None,
-                "metadata": obs.observation_metadata,
-                "created_at": obs.created_at.isoformat() if obs.created_at else None,
-                "updated_at": obs.updated_at.isoformat() if obs.updated_at else None,
-                "child_count": child_count,
-                "duration_ms": duration_ms,
-                "children": [],
-            }
-
-        # Build tree structure
-        roots = []
-        for _, obs_data in obs_map.items():
-            parent_id = obs_data["parent_observation_id"]
-            if parent_id is None:
-                roots.append(obs_data)
-            else:
-                if parent_id in obs_map:
-                    obs_map[parent_id]["children"].append(obs_data)
+            node = _observation_to_dict(obs)
+            node["children"] = children_by_parent[obs.id]
+            children_by_parent[obs.parent_observation_id].append(node)
 
-        return roots
+        return children_by_parent[None]
 
     async def create_observation(
         self,
@@ -462,25 +509,25 @@ class TraceService:
         Raises:
             HTTPException: If trace not found or parent observation invalid
         """
-        # Verify trace exists
-        trace = await self.trace_repo.get_by_id(trace_id)
-        if not trace:
+        # Verify the trace and, if provided, the parent observation together
+        trace_exists, parent_trace_id = await self.observation_repo.validate_create(
+            trace_id, parent_observation_id
+        )
+        if not trace_exists:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
+                status_code=http_status.HTTP_404_NOT_FOUND,
                 detail="Trace not found",
             )
 
-        # Verify parent observation if provided
         if parent_observation_id:
-            parent = await self.observation_repo.get_by_id(parent_observation_id)
-            if not parent:
+            if parent_trace_id is None:
                 raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
+                    status_code=http_status.HTTP_404_NOT_FOUND,
                     detail="Parent observation not found",
                 )
-            if parent.trace_id != trace_id:
+            if parent_trace_id != trace_id:
                 raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
+                    status_code=http_status.HTTP_400_BAD_REQUEST,
                     detail="Parent observation must belong to the same trace",
                 )
 
@@ -492,13 +539,18 @@ class TraceService:
                 "type": observation_type,
                 "name": name,
                 "status": status,
-                "started_at": started_at or datetime.utcnow(),
                 "observation_metadata": observation_metadata,
             }
+            # Without a client timestamp the database fills in now()
+            if started_at is not None:
+                observation_data["started_at"] = started_at
             observation = await self.observation_repo.create(observation_data)
+            await self.trace_repo.increment_observation_count(trace_id)
+            if parent_observation_id:
+                await self.observation_repo.increment_child_count(parent_observation_id)
 
             await self.db.commit()
-            return await self.get_observation(observation.id)
+            return _observation_to_dict(observation)
 
         except HTTPException:
             await self.db.rollback()
@@ -506,10 +558,122 @@ class TraceService:
         except Exception as e:
             await self.db.rollback()
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=http_status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to create observation: {str(e)}",
             )
 
+    async def create_observations_bulk(
+        self, trace_id: UUID, observations: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Create several observations of one trace with a single INSERT.
+
+        A parent may be an existing observation of the trace or an earlier
+        item of the same batch that was given a client ID, so a whole tree can
+        be sent at once. Existing parents are checked with one query and the
+        counters are updated once per trace and parent, so a burst of spans
+        costs a fixed number of round-trips and one commit.
+
+        Args:
+            trace_id: Trace UUID
+            observations: Observation data with type, name, status,
+                observation_metadata and optional id, parent_observation_id
+                and started_at (the create_observation arguments)
+
+        Returns:
+            Created observation data, in input order
+
+        Raises:
+            HTTPException: If trace not found or a parent observation invalid
+        """
+        if not observations:
+            return []
+
+        client_ids = [data["id"] for data in observations if data.get("id")]
+        batch_ids = set(client_ids)
+        if len(batch_ids) != len(client_ids):
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail="Duplicate observation ID in batch",
+            )
+        seen_ids: set[UUID] = set()
+        for data in observations:
+            parent_observation_id = data.get("parent_observation_id")
+            if (
+                parent_observation_id in batch_ids
+                and parent_observation_id not in seen_ids
+            ):
+                raise HTTPException(
+                    status_code=http_status.HTTP_400_BAD_REQUEST,
+                    detail="Parent observation must come before its children",
+                )
+            if data.get("id"):
+                seen_ids.add(data["id"])
+
+        parent_counts = Counter(
+            data["parent_observation_id"]
+            for data in observations
+            if data.get("parent_observation_id")
+        )
+        existing_parents = set(parent_counts) - batch_ids
+        trace_exists, parent_traces = await self.observation_repo.validate_bulk_create(
+            trace_id, existing_parents
+        )
+        if not trace_exists:
+            raise HTTPException(
+                status_code=http_status.HTTP_404_NOT_FOUND,
+                detail="Trace not found",
+            )
+        for parent_observation_id in existing_parents:
+            parent_trace_id = parent_traces.get(parent_observation_id)
+            if parent_trace_id is None:
+                raise HTTPException(
+                    status_code=http_status.HTTP_404_NOT_FOUND,
+                    detail="Parent observation not found",
+                )
+            if parent_trace_id != trace_id:
+                raise HTTPException(
+                    status_code=http_status.HTTP_400_BAD_REQUEST,
+                    detail="Parent observation must belong to the same trace",
+                )
+
+        try:
+            rows = []
+            for data in observations:
+                observation_id = data.get("id") or uuid4()
+                row = {
+                    "id": observation_id,
+                    "trace_id": trace_id,
+                    "parent_observation_id": data.get("parent_observation_id"),
+                    "type": data["type"],
+                    "name": data["name"],
+                    "status": data.get("status", "pending"),
+                    "observation_metadata": data.get("observation_metadata", {}),
+                    # Children in the same batch are counted up front
+                    "child_count": parent_counts.get(observation_id, 0),
+                }
+                # Without a client timestamp the database fills in now()
+                if data.get("started_at") is not None:
+                    row["started_at"] = data["started_at"]
+                rows.append(row)
+
+            created = await self.observation_repo.bulk_create(rows)
+            await self.trace_repo.increment_observation_count(trace_id, len(rows))
+            for parent_observation_id in existing_parents:
+                await self.observation_repo.increment_child_count(
+                    parent_observation_id, parent_counts[parent_observation_id]
+                )
+
+            await self.db.commit()
+            return [_observation_to_dict(observation) for observation in created]
+
+        except Exception as e:
+            await self.db.rollback()
+            raise HTTPException(
+                status_code=http_status.HTTP_400_BAD_REQUEST,
+                detail=f"Failed to create observations: {str(e)}",
+            )
+
     async def update_observation(
         self,
         observation_id: UUID,
@@ -532,14 +696,6 @@ class TraceService:
         Raises:
             HTTPException: If observation not found
         """
-        # Verify observation exists
-        observation = await self.observation_repo.get_by_id(observation_id)
-        if not observation:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Observation not found",
-            )
-
         try:
             update_data = {}
             if status is not None:
@@ -549,17 +705,17 @@ class TraceService:
             if observation_metadata is not None:
                 update_data["observation_metadata"] = observation_metadata
 
-            updated_observation = await self.observation_repo.update(
+            updated_observation = await self.observation_repo.update_returning(
                 observation_id, update_data
             )
             if not updated_observation:
                 raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
+                    status_code=http_status.HTTP_404_NOT_FOUND,
                     detail="Observation not found",
                 )
 
             await self.db.commit()
-            return await self.get_observation(observation_id)
+            return _observation_to_dict(updated_observation)
 
         except HTTPException:
             await self.db.rollback()
@@ -567,6 +723,6 @@ class TraceService:
         except Exception as e:
             await self.db.rollback()
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=http_status.HTTP_400_BAD_REQUEST,
                 detail=f"Failed to update observation: {str(e)}",
             )
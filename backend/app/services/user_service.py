@@ -12,13 +12,39 @@ from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import get_password_hash, verify_password
+from app.models.user import User
 from app.repositories.organization_member_repository import OrganizationMemberRepository
+from app.repositories.organization_owner_repository import OrganizationOwnerRepository
 from app.repositories.user_auth_repository import UserAuthRepository
 from app.repositories.user_profile_repository import UserProfileRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.user_status_repository import UserStatusRepository
 
 
+def _user_to_dict(user: User, is_active: bool, is_archived: bool) -> dict[str, Any]:
+    """
+    Convert a user row with profile and login loaded to its response dictionary.
+
+    Args:
+        user: User with profile and login_password loaded
+        is_active: Whether the user is active
+        is_archived: Whether the user is archived
+
+    Returns:
+        Dictionary containing user data
+    """
+    return {
+        "id": str(user.id),
+        "email": user.login_password.email if user.login_password else None,
+        "name": user.profile.name if user.profile else None,
+        "bio": user.profile.bio if user.profile else None,
+        "avatar_url": user.profile.avatar_url if user.profile else None,
+        "is_active": is_active,
+        "is_archived": is_archived,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+    }
+
+
 class UserService:
     """Service for handling user operations."""
 
@@ -35,6 +61,7 @@ class UserService:
         self.auth_repo = UserAuthRepository(db)
         self.status_repo = UserStatusRepository(db)
         self.member_repo = OrganizationMemberRepository(db)
+        self.owner_repo = OrganizationOwnerRepository(db)
 
     async def get_user(self, user_id: UUID) -> dict[str, Any] | None:
         """
@@ -60,16 +87,11 @@ class UserService:
                 detail="User not found",
             )
 
-        return {
-            "id": str(user.id),
-            "email": user.login_password.email if user.login_password else None,
-            "name": user.profile.name if user.profile else None,
-            "bio": user.profile.bio if user.profile else None,
-            "avatar_url": user.profile.avatar_url if user.profile else None,
-            "is_active": await self.status_repo.is_active(user.id),
-            "is_archived": await self.status_repo.is_archived(user.id),
-            "created_at": user.created_at.isoformat() if user.created_at else None,
-        }
+        return _user_to_dict(
+            user,
+            is_active=user.active_status is not None,
+            is_archived=user.archive is not None,
+        )
 
     async def get_user_by_email(self, email: str) -> dict[str, Any] | None:
         """
@@ -85,7 +107,11 @@ class UserService:
         if not user:
             return None
 
-        return await self.get_user(user.id)
+        return _user_to_dict(
+            user,
+            is_active=user.active_status is not None,
+            is_archived=user.archive is not None,
+        )
 
     async def get_user_organizations(self, user_id: UUID) -> list[dict[str, Any]]:
         """
@@ -112,28 +138,20 @@ class UserService:
             user_id=user_id, limit=None
         )
 
-        result = []
-        for org in organizations:
-            # Check if user is owner
-            from app.repositories.organization_owner_repository import (
-                OrganizationOwnerRepository,
-            )
-
-            owner_repo = OrganizationOwnerRepository(self.db)
-            is_owner = await owner_repo.is_owner(
-                organization_id=org.id, user_id=user_id
-            )
-
-            result.append(
-                {
-                    "id": str(org.id),
-                    "name": org.name,
-                    "role": "owner" if is_owner else "member",
-                    "joined_at": None,  # TODO: Add joined_at from membership record
-                }
-            )
+        # Check ownership for all organizations in one query
+        owned_ids = await self.owner_repo.list_owned_organization_ids(
+            user_id, [org.id for org in organizations]
+        )
 
-        return result
+        return [
+            {
+                "id": str(org.id),
+                "name": org.name,
+                "role": "owner" if org.id in owned_ids else "member",
+                "joined_at": None,  # TODO: Add joined_at from membership record
+            }
+            for org in organizations
+        ]
 
     async def update_profile(
         self, user_id: UUID, profile_data: dict[str, Any]
@@ -151,23 +169,28 @@ class UserService:
         Raises:
             HTTPException: If user not found or update fails
         """
-        # Check if user exists
-        user = await self.user_repo.get_by_id(user_id)
-        if not user:
+        # Load user with profile and status for the response
+        users = await self.user_repo.get_many_with_relations([user_id])
+        if not users:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
+        user = users[0]
 
         # Update or create profile
-        profile = await self.profile_repo.get_by_user_id(user_id)
-        if profile:
-            await self.profile_repo.update_profile(user_id, profile_data)
+        if user.profile:
+            profile = await self.profile_repo.update_profile(user_id, profile_data)
         else:
-            await self.profile_repo.create_profile(user_id, profile_data)
+            profile = await self.profile_repo.create_profile(user_id, profile_data)
+        user.profile = profile
 
         await self.db.commit()
-        return await self.get_user(user_id)
+        return _user_to_dict(
+            user,
+            is_active=user.active_status is not None,
+            is_archived=user.archive is not None,
+        )
 
     async def change_password(
         self, user_id: UUID, old_password: str, new_password: str
@@ -221,16 +244,14 @@ class UserService:
         Raises:
             HTTPException: If email already exists or update fails
         """
-        # Check if new email already exists
-        if await self.auth_repo.email_exists(new_email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already in use",
-            )
-
-        # Update email
-        auth = await self.auth_repo.update_email(user_id, new_email)
-        if not auth:
+        # Update email only if no other login uses it
+        if not await self.auth_repo.update_email_if_unique(user_id, new_email):
+            # Nothing was updated: find out why
+            if await self.auth_repo.email_exists(new_email):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already in use",
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User authentication not found",
@@ -256,20 +277,17 @@ class UserService:
         Raises:
             HTTPException: If user not found or already archived
         """
-        user = await self.user_repo.get_by_id(user_id)
+        user = await self.user_repo.get_by_id_with_relations(user_id)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
 
-        # Deactivate user first
-        await self.status_repo.deactivate(user_id)
-
-        # Archive user
-        await self.status_repo.archive(user_id, reason, archived_by)
+        # Deactivate and archive user
+        await self.status_repo.archive_and_deactivate(user_id, reason, archived_by)
         await self.db.commit()
-        return await self.get_user(user_id)
+        return _user_to_dict(user, is_active=False, is_archived=True)
 
     async def unarchive_user(self, user_id: UUID) -> dict[str, Any]:
         """
@@ -284,20 +302,22 @@ class UserService:
         Raises:
             HTTPException: If user not found or not archived
         """
-        if not await self.status_repo.is_archived(user_id):
+        user = await self.user_repo.get_by_id_with_relations(user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
+            )
+
+        # Unarchive and reactivate user
+        if not await self.status_repo.unarchive_and_activate(user_id):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="User is not archived",
             )
 
-        # Unarchive user
-        await self.status_repo.unarchive(user_id)
-
-        # Reactivate user
-        await self.status_repo.activate(user_id)
-
         await self.db.commit()
-        return await self.get_user(user_id)
+        return _user_to_dict(user, is_active=True, is_archived=False)
 
     async def list_users_in_organization(
         self, organization_id: UUID, limit: int = 100, offset: int = 0
@@ -314,15 +334,17 @@ class UserService:
             List of user dictionaries
         """
         users = await self.user_repo.list_by_organization(
-            organization_id, limit, offset
+            organization_id, include_inactive=True, limit=limit, offset=offset
         )
-
-        result = []
-        for user in users:
-            user_data = await self.get_user(user.id)
-            result.append(user_data)
-
-        return result
+        # Relations and status rows are loaded with the users
+        return [
+            _user_to_dict(
+                user,
+                is_active=user.active_status is not None,
+                is_archived=user.archive is not None,
+            )
+            for user in users
+        ]
 
     async def search_users_by_name(
         self, name_pattern: str, limit: int = 100, offset: int = 0
@@ -339,10 +361,14 @@ class UserService:
             List of matching user dictionaries
         """
         profiles = await self.profile_repo.search_by_name(name_pattern, limit, offset)
-
-        result = []
-        for profile in profiles:
-            user_data = await self.get_user(profile.user_id)
-            result.append(user_data)
-
-        return result
+        users = await self.user_repo.get_many_with_relations(
+            [profile.user_id for profile in profiles]
+        )
+        return [
+            _user_to_dict(
+                user,
+                is_active=user.active_status is not None,
+                is_archived=user.archive is not None,
+            )
+            for user in users
+        ]
@@ -0,0 +1,152 @@
+"""
+Batched writer for session validation logs.
+
+Validation logs are written off the request critical path: callers enqueue
+rows and a background task inserts them in batches using its own database
+session, flushing when the batch is full or the flush interval elapses.
+The queue is bounded; when it is full, rows are written inline instead so
+memory stays bounded and no log is dropped.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.session_validation_log_repository import (
+    SessionValidationLogRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Validation logs have no dependent tables, so a single tier of rows is
+# buffered. Rows keep queueing while a batch is being written, so the next
+# batch is usually full by the time the previous commit returns.
+DEFAULT_BATCH_SIZE = 2000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.2
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+
+# Batches at least this large are written with COPY instead of INSERT
+COPY_THRESHOLD = 100
+
+# Queue sentinel asking the worker to flush and exit
+_STOP: Any = object()
+
+
+class ValidationLogBatcher:
+    """
+    Buffer validation log rows and insert them in batches.
+
+    Attributes:
+        batch_size: Maximum rows per INSERT
+        flush_interval: Maximum seconds a row waits before being flushed
+        max_queue_size: Maximum queued rows before writes fall back inline
+
+    Example:
+        >>> await validation_log_batcher.enqueue({"session_id": ..., "log_data": {...}})
+        >>> await validation_log_batcher.shutdown()  # flush remaining rows
+    """
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_size: Maximum rows per INSERT
+            flush_interval: Maximum seconds a row waits before being flushed
+            max_queue_size: Maximum queued rows before writes fall back inline
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def enqueue(self, row: dict[str, Any]) -> None:
+        """
+        Queue a validation log row for insertion.
+
+        Starts the background worker on first use. If the queue is full
+        (the database is falling behind), the row is written inline.
+
+        Args:
+            row: Column values for SessionValidationLog
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._worker = asyncio.create_task(self._run())
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning("Validation log queue is full, writing inline")
+            await self._flush([row])
+
+    async def shutdown(self) -> None:
+        """Flush any rows still queued and stop the worker."""
+        if self._worker is None or self._worker.done():
+            return
+        # Rows queued before the sentinel are flushed before the worker exits
+        await self._queue.put(_STOP)
+        await self._worker
+        self._worker = None
+
+    async def _run(self) -> None:
+        """Collect rows into batches and flush them until stopped."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                except TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+    async def _flush(self, rows: list[dict[str, Any]]) -> None:
+        """
+        Insert a batch of rows in its own session.
+
+        Failures are logged and the batch is dropped; validation logging must
+        never fail the request that produced it.
+        """
+        if not rows:
+            return
+        try:
+            async with AsyncSessionLocal() as db:
+                repo = SessionValidationLogRepository(db)
+                if len(rows) >= COPY_THRESHOLD:
+                    await repo.copy_insert(rows)
+                else:
+                    await repo.bulk_insert(rows)
+                await db.commit()
+            logger.debug(f"Flushed {len(rows)} validation logs")
+        except Exception as e:
+            logger.error(
+                f"Failed to flush {len(rows)} validation logs: {str(e)}",
+                exc_info=True,
+            )
+
+
+validation_log_batcher = ValidationLogBatcher()
+
+
+__all__ = ["ValidationLogBatcher", "validation_log_batcher"]
@@ -13,7 +13,7 @@ from fastapi import status
 from httpx import ASGITransport, AsyncClient
 
 from app.core.auth import get_current_agent_from_api_key
-from app.core.database import get_async_db
+from app.core.database import get_async_db, get_async_db_transaction
 from app.main import app
 from app.schemas.tool_definition import ToolRegistrationResponse
 
@@ -36,6 +36,7 @@ async def agent_authenticated_client(mock_db):
 
     app.dependency_overrides[get_current_agent_from_api_key] = override_get_agent
     app.dependency_overrides[get_async_db] = override_get_db
+    app.dependency_overrides[get_async_db_transaction] = override_get_db
 
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
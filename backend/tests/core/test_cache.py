@@ -0,0 +1,79 @@
+"""
+Tests for in-process caching utilities.
+"""
+
+from unittest.mock import patch
+
+from app.core.cache import TTLCache, make_cache_key
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned and counted as a hit."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_get_missing_returns_default(self):
+        """Test that a missing key returns the default and counts a miss."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10)
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", 42) == 42
+        assert cache.misses == 2
+
+    def test_evicts_least_recently_used(self):
+        """Test LRU eviction when maxsize is exceeded."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" becomes least recently used
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL elapses."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10, ttl=60)
+        with patch("app.core.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+        with patch("app.core.cache.time.monotonic", return_value=1059.0):
+            assert cache.get("a") == 1
+        with patch("app.core.cache.time.monotonic", return_value=1061.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_pop_removes_entry(self):
+        """Test that pop removes and returns the value."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=10)
+        cache.set("a", 1)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert "a" not in cache
+
+
+class TestMakeCacheKey:
+    """Tests for make_cache_key."""
+
+    def test_same_inputs_same_key(self):
+        """Test that key is independent of keyword order."""
+        key1 = make_cache_key("op", a="x", b=None)
+        key2 = make_cache_key("op", b=None, a="x")
+        assert key1 == key2
+
+    def test_different_namespace_different_key(self):
+        """Test that namespace is part of the key."""
+        assert make_cache_key("op1", a="x") != make_cache_key("op2", a="x")
+
+    def test_different_inputs_different_key(self):
+        """Test that any input change alters the key."""
+        assert make_cache_key("op", a="x") != make_cache_key("op", a="y")
@@ -0,0 +1,30 @@
+"""
+Tests for keyset pagination cursors.
+"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.core.pagination import decode_cursor, encode_cursor
+
+
+class TestCursor:
+    """Tests for encode_cursor and decode_cursor."""
+
+    def test_round_trips_position(self):
+        """Test a decoded cursor returns the encoded position."""
+        position = (datetime(2025, 9, 30, 12, 0, 0, 123456, tzinfo=UTC), uuid4())
+        assert decode_cursor(encode_cursor(*position)) == position
+
+    def test_cursor_is_url_safe(self):
+        """Test cursors can be passed as query parameters unescaped."""
+        cursor = encode_cursor(datetime(2025, 9, 30, tzinfo=UTC), uuid4())
+        assert cursor.replace("-", "").replace("_", "").isalnum()
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", "Zm9vfGJhcg"])
+    def test_rejects_malformed_cursor(self, cursor):
+        """Test malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
@@ -0,0 +1,26 @@
+"""
+Tests for JSON serialization helpers.
+"""
+
+import json
+from uuid import UUID
+
+from app.core.serialization import dumps_json
+
+
+class TestDumpsJson:
+    """Tests for dumps_json function."""
+
+    def test_round_trips_nested_values(self):
+        """Test output parses back to the original value."""
+        value = {"should_proceed": False, "items": [1, 2.5, None, "ä"], "n": {}}
+        assert json.loads(dumps_json(value)) == value
+
+    def test_stringifies_non_string_keys(self):
+        """Test non-string dict keys are stringified like json.dumps."""
+        assert json.loads(dumps_json({1: "a"})) == json.loads(json.dumps({1: "a"}))
+
+    def test_serializes_uuid(self):
+        """Test UUIDs are written as strings."""
+        value = UUID("12345678-1234-5678-1234-567812345678")
+        assert dumps_json([value]) == f'["{value}"]'
@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.agent import Agent, AgentActiveStatus, AgentAPIKey
+from app.repositories import agent_repository as agent_repository_module
 from app.repositories.agent_api_key_repository import AgentAPIKeyRepository
 from app.repositories.agent_repository import AgentRepository
 from tests.repositories.conftest import (
@@ -135,6 +136,44 @@ async def test_agent_get_by_id_not_found(
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_agent_get_project_org_is_cached(
+    test_db_session: AsyncSession,
+    agent_repository: AgentRepository,
+):
+    """
+    Test an agent's project and organization are cached once found.
+
+    Verifies:
+    - (project_id, organization_id) returned for an existing agent
+    - Found agents are cached, missing agents are not
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+    await test_db_session.flush()
+    missing_id = uuid4()
+
+    # Act
+    project_org = await agent_repository.get_project_org(agent.id)
+    missing = await agent_repository.get_project_org(missing_id)
+
+    # Assert
+    assert project_org == (project.id, org.id)
+    assert missing is None
+    assert agent_repository_module._project_org_cache.get(agent.id) == project_org
+    assert missing_id not in agent_repository_module._project_org_cache
+
+
 @pytest.mark.asyncio
 async def test_agent_is_active_and_activate(
     test_db_session: AsyncSession,
@@ -19,6 +19,7 @@ from tests.repositories.conftest import (
     build_project_data,
     build_project_member_data,
     build_project_owner_data,
+    seed_test_agent,
     seed_test_organization,
     seed_test_project,
     seed_test_user,
@@ -379,6 +380,53 @@ async def test_project_member_is_member(
     assert is_not_member is False
 
 
+@pytest.mark.asyncio
+async def test_project_member_is_agent_project_member(
+    test_db_session: AsyncSession,
+    project_member_repository: ProjectMemberRepository,
+):
+    """
+    Test checking membership through an agent's project.
+
+    Verifies:
+    - Returns True for a member of the agent's project
+    - Returns False for a non-member
+    - Returns None for an unknown agent
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    non_member_user = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+    member_data = build_project_member_data(project_id=project.id, user_id=user.id)
+    test_db_session.add(ProjectMember(**member_data))
+    await test_db_session.flush()
+
+    # Act & Assert
+    assert (
+        await project_member_repository.is_agent_project_member(agent.id, user.id)
+        is True
+    )
+    assert (
+        await project_member_repository.is_agent_project_member(
+            agent.id, non_member_user.id
+        )
+        is False
+    )
+    assert (
+        await project_member_repository.is_agent_project_member(uuid4(), user.id)
+        is None
+    )
+
+
 @pytest.mark.asyncio
 async def test_project_member_add_duplicate_fails(
     test_db_session: AsyncSession,
@@ -287,3 +287,97 @@ async def test_update_latest_revision_id(
     result = await test_db_session.execute(stmt)
     db_tool_def = result.scalar_one_or_none()
     assert db_tool_def.latest_revision_id == revision.id
+
+
+@pytest.mark.asyncio
+async def test_create_latest_revision(
+    test_db_session: AsyncSession,
+):
+    """
+    Test creating a revision and moving latest_revision_id in one statement.
+
+    Verifies:
+    - Revision is linked to the previous latest revision
+    - ToolDefinition points to the new revision (in memory and in database)
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+
+    tool_def_repo = ToolDefinitionRepository(test_db_session)
+    revision_repo = ToolDefinitionRevisionRepository(test_db_session)
+    tool_def = await tool_def_repo.get_or_create_by_agent(agent_id=agent.id)
+
+    # Act
+    first_id, _ = await revision_repo.create_latest_revision(
+        tool_definition=tool_def, tools_data={"tools": []}
+    )
+    second_id, created_at = await revision_repo.create_latest_revision(
+        tool_definition=tool_def, tools_data={"tools": [{"name": "search"}]}
+    )
+
+    # Assert
+    assert created_at is not None
+    assert tool_def.latest_revision_id == second_id
+
+    second = await revision_repo.get_by_id(second_id)
+    assert second.previous_revision_id == first_id
+    assert second.tools_data == {"tools": [{"name": "search"}]}
+
+    stmt = select(ToolDefinition.latest_revision_id).where(
+        ToolDefinition.id == tool_def.id
+    )
+    result = await test_db_session.execute(stmt)
+    assert result.scalar_one() == second_id
+
+
+@pytest.mark.asyncio
+async def test_get_latest_by_agent_id(
+    test_db_session: AsyncSession,
+):
+    """
+    Test getting the latest revision through the tool definition pointer.
+
+    Verifies:
+    - None before any revision is registered
+    - The revision latest_revision_id points to afterwards
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+
+    tool_def_repo = ToolDefinitionRepository(test_db_session)
+    revision_repo = ToolDefinitionRevisionRepository(test_db_session)
+    tool_def = await tool_def_repo.get_or_create_by_agent(agent_id=agent.id)
+
+    # Act & Assert
+    assert await revision_repo.get_latest_by_agent_id(agent.id) is None
+
+    await revision_repo.create_latest_revision(
+        tool_definition=tool_def, tools_data={"tools": []}
+    )
+    latest_id, _ = await revision_repo.create_latest_revision(
+        tool_definition=tool_def, tools_data={"tools": [{"name": "search"}]}
+    )
+
+    latest = await revision_repo.get_latest_by_agent_id(agent.id)
+    assert latest is not None
+    assert latest.id == latest_id
@@ -5,13 +5,14 @@ Tests verify database operations for Trace and Observation models using
 PostgreSQL test database with transaction rollback for isolation.
 """
 
-from datetime import UTC
+from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
 import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.project import ProjectMember
 from app.models.trace import Observation, Trace
 from app.repositories.observation_repository import ObservationRepository
 from app.repositories.trace_repository import TraceRepository
@@ -185,6 +186,52 @@ async def test_trace_calculate_duration(
     assert duration >= 4.0
 
 
+@pytest.mark.asyncio
+async def test_trace_update_returning(
+    test_db_session: AsyncSession,
+    trace_repository: TraceRepository,
+):
+    """
+    Test updating a trace returns the updated row.
+
+    Verifies:
+    - Updated columns are returned
+    - Stored observation count is returned with the row
+    - Unknown trace returns None
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+    trace = await seed_test_trace(
+        test_db_session,
+        agent_id=agent.id,
+        project_id=project.id,
+        organization_id=org.id,
+    )
+    await trace_repository.increment_observation_count(trace.id)
+
+    # Act
+    updated_trace = await trace_repository.update_returning(
+        trace.id, {"status": "failed"}
+    )
+    missing = await trace_repository.update_returning(uuid4(), {"status": "failed"})
+
+    # Assert
+    assert updated_trace is not None
+    assert updated_trace.status == "failed"
+    assert updated_trace.observation_count == 1
+    assert missing is None
+
+
 # ============================================================================
 # ObservationRepository Tests
 # ============================================================================
@@ -322,6 +369,220 @@ async def test_observation_get_tree_by_trace_id(
     assert "Child 2" in observation_names
 
 
+@pytest.mark.asyncio
+async def test_observation_increment_child_count(
+    test_db_session: AsyncSession,
+    observation_repository: ObservationRepository,
+):
+    """
+    Test incrementing an observation's child counter.
+
+    Verifies:
+    - child_count is increased by one per call
+    - updated_at is left unchanged
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+    trace = await seed_test_trace(
+        test_db_session,
+        agent_id=agent.id,
+        project_id=project.id,
+        organization_id=org.id,
+    )
+    root = await seed_test_observation(test_db_session, trace_id=trace.id)
+    await test_db_session.flush()
+    updated_at = root.updated_at
+
+    # Act
+    await observation_repository.increment_child_count(root.id)
+    await observation_repository.increment_child_count(root.id)
+    await test_db_session.refresh(root)
+
+    # Assert
+    assert root.child_count == 2
+    assert root.updated_at == updated_at
+
+
+@pytest.mark.asyncio
+async def test_trace_get_with_membership(
+    test_db_session: AsyncSession,
+    trace_repository: TraceRepository,
+):
+    """
+    Test loading a trace together with a user's project membership.
+
+    Verifies:
+    - Members and non-members both get the trace with the right flag
+    - An unknown trace returns None
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    outsider = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+    trace = await seed_test_trace(
+        test_db_session,
+        agent_id=agent.id,
+        project_id=project.id,
+        organization_id=org.id,
+    )
+    test_db_session.add(ProjectMember(project_id=project.id, user_id=user.id))
+    await test_db_session.flush()
+
+    # Act
+    member_row = await trace_repository.get_with_membership(trace.id, user.id)
+    outsider_row = await trace_repository.get_with_membership(trace.id, outsider.id)
+    missing = await trace_repository.get_with_membership(uuid4(), user.id)
+
+    # Assert
+    assert member_row == (trace, True)
+    assert outsider_row == (trace, False)
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_observation_validate_create(
+    test_db_session: AsyncSession,
+    observation_repository: ObservationRepository,
+):
+    """
+    Test checking a new observation's trace and parent in one query.
+
+    Verifies:
+    - An existing trace is reported with its parent's trace_id
+    - A missing parent yields None for parent_trace_id
+    - A missing trace is reported as not existing
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+    trace = await seed_test_trace(
+        test_db_session,
+        agent_id=agent.id,
+        project_id=project.id,
+        organization_id=org.id,
+    )
+    root = await seed_test_observation(test_db_session, trace_id=trace.id)
+    await test_db_session.flush()
+
+    # Act & Assert
+    assert await observation_repository.validate_create(trace.id) == (True, None)
+    assert await observation_repository.validate_create(trace.id, root.id) == (
+        True,
+        trace.id,
+    )
+    assert await observation_repository.validate_create(trace.id, uuid4()) == (
+        True,
+        None,
+    )
+    assert await observation_repository.validate_create(uuid4(), root.id) == (
+        False,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_observation_bulk_create(
+    test_db_session: AsyncSession,
+    observation_repository: ObservationRepository,
+):
+    """
+    Test inserting several observations with one statement.
+
+    Verifies:
+    - Rows are returned in input order with generated IDs
+    - A row may reference a parent inserted earlier in the same call
+    - Missing started_at is filled in by the database
+    - validate_bulk_create maps existing parents to their trace
+    """
+    # Arrange
+    org = await seed_test_organization(test_db_session)
+    user = await seed_test_user(test_db_session)
+    project = await seed_test_project(
+        test_db_session, organization_id=org.id, created_by=user.id
+    )
+    agent = await seed_test_agent(
+        test_db_session,
+        project_id=project.id,
+        organization_id=org.id,
+        created_by=user.id,
+    )
+    trace = await seed_test_trace(
+        test_db_session,
+        agent_id=agent.id,
+        project_id=project.id,
+        organization_id=org.id,
+    )
+    root = await seed_test_observation(test_db_session, trace_id=trace.id)
+    await test_db_session.flush()
+    started_at = datetime(2025, 1, 1, tzinfo=UTC)
+    first_id = uuid4()
+
+    # Act
+    created = await observation_repository.bulk_create(
+        [
+            {
+                "id": first_id,
+                "trace_id": trace.id,
+                "parent_observation_id": root.id,
+                "type": "llm",
+                "name": "first",
+                "status": "running",
+                "observation_metadata": {},
+            },
+            {
+                "trace_id": trace.id,
+                "parent_observation_id": first_id,
+                "type": "tool",
+                "name": "second",
+                "status": "running",
+                "observation_metadata": {},
+                "started_at": started_at,
+            },
+        ]
+    )
+    missing_parent = uuid4()
+    validation = await observation_repository.validate_bulk_create(
+        trace.id, {root.id, missing_parent}
+    )
+
+    # Assert
+    assert [obs.name for obs in created] == ["first", "second"]
+    assert created[0].id == first_id
+    assert created[1].id is not None
+    assert created[1].parent_observation_id == first_id
+    assert created[0].started_at is not None
+    assert created[1].started_at == started_at
+    assert validation == (True, {root.id: trace.id})
+
+
 @pytest.mark.asyncio
 async def test_observation_get_root_observations(
     test_db_session: AsyncSession,
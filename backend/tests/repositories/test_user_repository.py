@@ -8,6 +8,7 @@ with transaction rollback for isolation.
 from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.user_repository import UserRepository
@@ -110,6 +111,31 @@ async def test_get_user_with_relations_success(
 
     assert retrieved_user.active_status is not None
     assert retrieved_user.active_status.user_id == user.id
+    assert retrieved_user.archive is None
+
+
+@pytest.mark.asyncio
+async def test_get_user_with_relations_raises_on_lazy_load(
+    test_db_session: AsyncSession,
+    user_repository: UserRepository,
+):
+    """
+    Test relationships that were not eagerly loaded raise on access.
+
+    Verifies:
+    - Accessing an unloaded relationship raises instead of lazy loading
+    """
+    # Arrange
+    user = await seed_test_user(test_db_session, with_profile=True, with_auth=True)
+    await test_db_session.flush()
+    test_db_session.expunge_all()
+
+    # Act
+    retrieved_user = await user_repository.get_by_id_with_relations(user.id)
+
+    # Assert
+    with pytest.raises(InvalidRequestError):
+        _ = retrieved_user.project_memberships
 
 
 # ============================================================================
@@ -45,3 +45,41 @@ async def test_activate_user(
     assert active_status is not None
     assert active_status.user_id == user.id
     assert await user_status_repository.is_active(user.id) is True
+
+
+# ============================================================================
+# Test: archive_and_deactivate() / unarchive_and_activate() - Round trip
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_archive_and_unarchive_user(
+    test_db_session: AsyncSession,
+    user_status_repository: UserStatusRepository,
+):
+    """
+    Test archiving and restoring a user with the combined transitions.
+
+    Verifies:
+    - Archiving removes the active status and adds the archive record
+    - Unarchiving reverses both and reports success
+    - Unarchiving a user that is not archived changes nothing
+    """
+    # Arrange
+    user = await seed_test_user(test_db_session)
+    archiver = await seed_test_user(test_db_session)
+    await test_db_session.flush()
+
+    # Act
+    await user_status_repository.archive_and_deactivate(user.id, "Left", archiver.id)
+
+    # Assert
+    assert await user_status_repository.is_active(user.id) is False
+    assert await user_status_repository.is_archived(user.id) is True
+
+    assert await user_status_repository.unarchive_and_activate(user.id) is True
+    assert await user_status_repository.is_active(user.id) is True
+    assert await user_status_repository.is_archived(user.id) is False
+
+    assert await user_status_repository.unarchive_and_activate(user.id) is False
+    assert await user_status_repository.is_active(user.id) is True
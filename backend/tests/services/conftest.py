@@ -44,6 +44,7 @@ def mock_user_auth_repository():
     repo.get_password_auth = AsyncMock()
     repo.create_password_auth = AsyncMock()
     repo.update_password = AsyncMock()
+    repo.update_email_if_unique = AsyncMock()
     return repo
 
 
@@ -69,6 +70,8 @@ def mock_user_status_repository():
     repo.get_active_suspension = AsyncMock()
     repo.archive = AsyncMock()
     repo.unarchive = AsyncMock()
+    repo.archive_and_deactivate = AsyncMock()
+    repo.unarchive_and_activate = AsyncMock()
     return repo
 
 
@@ -108,6 +111,7 @@ def mock_organization_owner_repository():
     """Mock OrganizationOwnerRepository for service tests."""
     repo = AsyncMock()
     repo.is_owner = AsyncMock()
+    repo.list_owned_organization_ids = AsyncMock()
     repo.get_owner = AsyncMock()
     repo.create = AsyncMock()
     repo.set_owner = AsyncMock()
@@ -245,6 +249,7 @@ def user_service(
     mock_user_profile_repository,
     mock_user_status_repository,
     mock_organization_member_repository,
+    mock_organization_owner_repository,
 ):
     """
     UserService instance with mocked dependencies.
@@ -261,6 +266,7 @@ def user_service(
     service.profile_repo = mock_user_profile_repository
     service.status_repo = mock_user_status_repository
     service.member_repo = mock_organization_member_repository
+    service.owner_repo = mock_organization_owner_repository
     return service
 
 
@@ -441,6 +447,9 @@ def mock_trace_repository():
     repo = AsyncMock()
     repo.get_by_id = AsyncMock()
     repo.get_by_agent = AsyncMock()
+    repo.get_with_membership = AsyncMock()
+    repo.update_returning = AsyncMock()
+    repo.increment_observation_count = AsyncMock()
     repo.create = AsyncMock()
     repo.update = AsyncMock()
     repo.delete = AsyncMock()
@@ -455,6 +464,11 @@ def mock_observation_repository():
     repo = AsyncMock()
     repo.get_by_id = AsyncMock()
     repo.get_by_trace_id = AsyncMock()
+    repo.update_returning = AsyncMock()
+    repo.validate_create = AsyncMock()
+    repo.validate_bulk_create = AsyncMock()
+    repo.bulk_create = AsyncMock()
+    repo.increment_child_count = AsyncMock()
     repo.get_root_observations = AsyncMock()
     repo.get_tree_by_trace_id = AsyncMock()
     repo.create = AsyncMock()
@@ -0,0 +1,70 @@
+"""
+Tests for compiled guardrail definitions.
+"""
+
+import pytest
+
+from app.services.guardrail_evaluation.compiled_guardrail import compile_guardrail
+from app.services.guardrail_evaluation.condition_evaluator import evaluate_conditions
+from app.services.guardrail_evaluation.exceptions import ConditionEvaluationError
+
+CONTEXT = {"input": {"query": "hello world", "items": ["abc"], "count": 5}}
+
+
+def _definition(conditions, logic="and"):
+    return {
+        "trigger": {"type": "on_start", "logic": logic, "conditions": conditions},
+        "actions": [{"type": "block", "priority": 1, "config": {}}],
+    }
+
+
+class TestCompileGuardrail:
+    """Tests for compile_guardrail function."""
+
+    def test_prepares_paths_and_patterns(self):
+        """Test field paths are parsed and regex patterns compiled up front."""
+        compiled = compile_guardrail(
+            _definition(
+                [{"field": "input.items[0]", "operator": "regex", "value": "^a"}]
+            )
+        )
+
+        condition = compiled.conditions[0]
+        assert condition.segments == ("input", "items", 0)
+        assert condition.pattern is not None
+        assert compiled.trigger_type == "on_start"
+        assert compiled.uses_llm_judge is False
+
+    def test_matches_uncompiled_evaluation(self):
+        """Test compiled conditions evaluate like the raw condition dicts."""
+        conditions = [
+            {"field": "input.query", "operator": "regex", "value": "^hello"},
+            {"field": "input.items[0]", "operator": "contains", "value": "b"},
+            {"field": "input.count", "operator": "gt", "value": 10},
+        ]
+        compiled = compile_guardrail(_definition(conditions, logic="or"))
+
+        assert evaluate_conditions(
+            CONTEXT, compiled.conditions, compiled.logic
+        ) == evaluate_conditions(CONTEXT, conditions, "or")
+        assert compiled.raw_conditions == conditions
+
+    def test_invalid_regex_fails_at_evaluation(self):
+        """Test an invalid pattern compiles but reports an evaluation error."""
+        compiled = compile_guardrail(
+            _definition([{"field": "input.query", "operator": "regex", "value": "("}])
+        )
+
+        assert compiled.conditions[0].pattern is None
+        with pytest.raises(ConditionEvaluationError):
+            evaluate_conditions(CONTEXT, compiled.conditions, compiled.logic)
+
+    def test_detects_llm_judge(self):
+        """Test uses_llm_judge is set when any condition calls the LLM judge."""
+        compiled = compile_guardrail(
+            _definition(
+                [{"field": "input.query", "operator": "llm_judge", "value": "rude?"}]
+            )
+        )
+
+        assert compiled.uses_llm_judge is True
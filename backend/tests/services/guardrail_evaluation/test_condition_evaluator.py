@@ -0,0 +1,67 @@
+"""
+Tests for condition evaluation short-circuiting.
+"""
+
+from unittest.mock import patch
+
+from app.services.guardrail_evaluation.condition_evaluator import evaluate_conditions
+
+CONTEXT = {"input": {"query": "hello world", "count": 5}}
+
+LLM_CONDITION = {"field": "input.query", "operator": "llm_judge", "value": "Is it ok?"}
+
+
+class TestEvaluateConditions:
+    """Tests for evaluate_conditions."""
+
+    def test_and_logic_all_match(self):
+        """Test AND logic with all cheap conditions matching."""
+        conditions = [
+            {"field": "input.query", "operator": "contains", "value": "hello"},
+            {"field": "input.count", "operator": "gt", "value": 3},
+        ]
+        assert evaluate_conditions(CONTEXT, conditions, "and") == (True, [0, 1])
+
+    def test_and_logic_skips_llm_when_cheap_condition_fails(self):
+        """Test that llm_judge is not called when a cheap AND condition fails."""
+        conditions = [
+            LLM_CONDITION,
+            {"field": "input.count", "operator": "gt", "value": 10},
+        ]
+        with patch(
+            "app.services.guardrail_evaluation.llm_judge.evaluate_with_llm"
+        ) as mock_llm:
+            result = evaluate_conditions(CONTEXT, conditions, "and")
+
+        assert result == (False, [])
+        mock_llm.assert_not_called()
+
+    def test_or_logic_skips_llm_when_cheap_condition_matches(self):
+        """Test that llm_judge is not called when a cheap OR condition matches."""
+        conditions = [
+            LLM_CONDITION,
+            {"field": "input.query", "operator": "contains", "value": "world"},
+        ]
+        with patch(
+            "app.services.guardrail_evaluation.llm_judge.evaluate_with_llm"
+        ) as mock_llm:
+            result = evaluate_conditions(CONTEXT, conditions, "or")
+
+        assert result == (True, [1])
+        mock_llm.assert_not_called()
+
+    def test_llm_conditions_evaluated_when_undecided(self):
+        """Test that llm_judge conditions run when cheap ones do not decide."""
+        conditions = [
+            {"field": "input.query", "operator": "contains", "value": "hello"},
+            LLM_CONDITION,
+            LLM_CONDITION,
+        ]
+        with patch(
+            "app.services.guardrail_evaluation.llm_judge.evaluate_with_llm",
+            return_value=True,
+        ) as mock_llm:
+            result = evaluate_conditions(CONTEXT, conditions, "and")
+
+        assert result == (True, [0, 1, 2])
+        assert mock_llm.call_count == 2
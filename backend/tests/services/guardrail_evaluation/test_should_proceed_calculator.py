@@ -0,0 +1,48 @@
+"""
+Tests for should_proceed calculation.
+"""
+
+from app.schemas.guardrail_evaluation import TriggeredGuardrail
+from app.services.guardrail_evaluation.should_proceed_calculator import (
+    calculate_should_proceed_with_configs,
+)
+
+
+def _result(guardrail_id: str, triggered: bool = True, error: bool = False):
+    return TriggeredGuardrail(
+        guardrail_id=guardrail_id,
+        guardrail_name=guardrail_id,
+        triggered=triggered,
+        error=error,
+    )
+
+
+class TestCalculateShouldProceedWithConfigs:
+    """Tests for calculate_should_proceed_with_configs function."""
+
+    def test_block_action_stops_process(self):
+        """Test triggered block action returns False."""
+        definitions = {"g1": {"actions": [{"type": "block"}]}}
+        results = [_result("g1")]
+        assert calculate_should_proceed_with_configs(results, definitions) is False
+
+    def test_untriggered_guardrail_is_ignored(self):
+        """Test block action on an untriggered guardrail is ignored."""
+        definitions = {"g1": {"actions": [{"type": "block"}]}}
+        results = [_result("g1", triggered=False)]
+        assert calculate_should_proceed_with_configs(results, definitions) is True
+
+    def test_errored_guardrail_is_ignored(self):
+        """Test block action on an errored guardrail is ignored."""
+        definitions = {"g1": {"actions": [{"type": "block"}]}}
+        results = [_result("g1", error=True)]
+        assert calculate_should_proceed_with_configs(results, definitions) is True
+
+    def test_warn_respects_allow_proceed(self):
+        """Test warn actions follow their allow_proceed setting."""
+        allow = {
+            "g1": {"actions": [{"type": "warn", "config": {"allow_proceed": True}}]}
+        }
+        deny = {"g1": {"actions": [{"type": "warn", "config": {}}]}}
+        assert calculate_should_proceed_with_configs([_result("g1")], allow) is True
+        assert calculate_should_proceed_with_configs([_result("g1")], deny) is False
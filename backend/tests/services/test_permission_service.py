@@ -67,3 +67,31 @@ async def test_is_member_or_above_returns_false_for_non_member(
 
     # Assert
     assert result is False
+
+
+@pytest.mark.asyncio
+async def test_permission_level_is_resolved_once_per_instance(
+    permission_service,
+    mock_organization_member_repository,
+    mock_organization_owner_repository,
+    mock_organization_admin_repository,
+):
+    """Test repeated checks for the same user reuse the resolved level."""
+    # Arrange
+    org_id = uuid4()
+    user_id = uuid4()
+    mock_organization_owner_repository.is_owner.return_value = False
+    mock_organization_admin_repository.is_admin.return_value = False
+    mock_organization_member_repository.is_member.return_value = True
+
+    # Act
+    is_member = await permission_service.is_member_or_above(org_id, user_id)
+    is_admin = await permission_service.is_admin_or_owner(org_id, user_id)
+
+    # Assert
+    assert is_member is True
+    assert is_admin is False
+    mock_organization_owner_repository.is_owner.assert_called_once_with(org_id, user_id)
+    mock_organization_member_repository.is_member.assert_called_once_with(
+        org_id, user_id
+    )
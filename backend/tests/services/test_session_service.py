@@ -0,0 +1,292 @@
+"""
+Session service unit tests.
+
+Tests verify session creation using mocked repositories.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.services import session_service as session_service_module
+from app.services.session_service import SessionService
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty module-level caches."""
+    session_service_module._alignment_history_cache.clear()
+    yield
+    session_service_module._alignment_history_cache.clear()
+
+
+def _mock_agent():
+    agent = MagicMock()
+    agent.project_id = uuid4()
+    agent.organization_id = uuid4()
+    return agent
+
+
+def _created_session(data):
+    session = MagicMock()
+    session.id = uuid4()
+    session.agent_id = data["agent_id"]
+    session.project_id = data["project_id"]
+    session.organization_id = data["organization_id"]
+    session.status = data["status"]
+    session.created_at = datetime(2025, 11, 18, 16, 0, tzinfo=UTC)
+    session.updated_at = session.created_at
+    return session
+
+
+@pytest.mark.asyncio
+async def test_create_session_builds_response_from_insert():
+    """
+    Test create_session returns the new session without re-reading it.
+
+    Verifies:
+    - Ownership is copied from the agent
+    - alignment_history_count is 0
+    - No follow-up session or history query is issued
+    """
+    agent_id = uuid4()
+    agent = _mock_agent()
+    service = SessionService(AsyncMock())
+    service.agent_repo.get_project_org = AsyncMock(
+        return_value=(agent.project_id, agent.organization_id)
+    )
+    service.session_repo.create = AsyncMock(side_effect=_created_session)
+    service.session_repo.get_by_id = AsyncMock()
+    service.history_repo.count_by_session = AsyncMock()
+
+    result = await service.create_session(agent_id)
+
+    assert result["agent_id"] == str(agent_id)
+    assert result["project_id"] == str(agent.project_id)
+    assert result["organization_id"] == str(agent.organization_id)
+    assert result["status"] == "active"
+    assert result["created_at"] == "2025-11-18T16:00:00+00:00"
+    assert result["alignment_history_count"] == 0
+    service.session_repo.get_by_id.assert_not_called()
+    service.history_repo.count_by_session.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_session_agent_not_found():
+    """Test a missing agent raises 404."""
+    service = SessionService(AsyncMock())
+    service.agent_repo.get_project_org = AsyncMock(return_value=None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_session(uuid4())
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_session_detail_splits_key_terms_and_rules():
+    """Test stored key terms and rules are reshaped for the dashboard."""
+    session_id = uuid4()
+    service = SessionService(AsyncMock())
+    service.session_repo.get_by_id = AsyncMock(
+        return_value=_created_session(
+            {
+                "agent_id": uuid4(),
+                "project_id": uuid4(),
+                "organization_id": uuid4(),
+                "status": "active",
+            }
+        )
+    )
+    service.history_repo.list_user_instructions = AsyncMock(return_value=[])
+    latest = MagicMock()
+    latest.id = uuid4()
+    latest.session_id = session_id
+    latest.agent_id = uuid4()
+    latest.created_at = datetime(2025, 11, 18, 16, 0, tzinfo=UTC)
+    latest.updated_at = latest.created_at
+    latest.user_instruction = "Book a table for tomorrow"
+    latest.alignment_result = {
+        "key_terms": [
+            {"term": "tomorrow", "category": "time", "user_provided_context": "Fri"},
+            {"term": "table", "category": "object", "user_provided_context": None},
+        ],
+        "tool_invocation_rules": [{"tool_name": "book", "condition": "always"}],
+        "disallowed_tools": ["delete"],
+    }
+    service.history_repo.get_latest_id_by_session = AsyncMock(return_value=latest.id)
+    service.history_repo.get_by_id = AsyncMock(return_value=latest)
+    service.validation_log_repo.list_history_by_session = AsyncMock(
+        return_value=([], 0)
+    )
+
+    result = await service.get_session_detail_for_dashboard(session_id)
+
+    inference_result = result["inference_result"]
+    assert inference_result["resolved_terms"] == [
+        {
+            "term": "tomorrow",
+            "category": "time",
+            "resolved_value": "Fri",
+            "confidence": "LOW",
+        }
+    ]
+    assert inference_result["ambiguous_terms"] == [
+        {"term": "table", "category": "object"}
+    ]
+    assert result["validation_rules"] == [
+        {
+            "tool_name": "book",
+            "condition": "always",
+            "parameters": {},
+            "reasoning": "",
+            "guardrail_definition": None,
+        }
+    ]
+    assert result["disallowed_tools"] == ["delete"]
+
+
+@pytest.mark.asyncio
+async def test_complete_session_uses_returned_row():
+    """Test complete_session builds the response from the UPDATE result."""
+    session = _created_session(
+        {
+            "agent_id": uuid4(),
+            "project_id": uuid4(),
+            "organization_id": uuid4(),
+            "status": "completed",
+        }
+    )
+    service = SessionService(AsyncMock())
+    service.session_repo.complete_session_with_history_count = AsyncMock(
+        return_value=(session, 3)
+    )
+    service.session_repo.get_by_id = AsyncMock()
+
+    result = await service.complete_session(session.id)
+
+    assert result["status"] == "completed"
+    assert result["alignment_history_count"] == 3
+    service.session_repo.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_complete_session_not_found():
+    """Test completing a missing session raises 404."""
+    service = SessionService(AsyncMock())
+    service.session_repo.complete_session_with_history_count = AsyncMock(
+        return_value=None
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.complete_session(uuid4())
+
+    assert exc_info.value.status_code == 404
+
+
+def test_repositories_are_created_on_first_use():
+    """Test repositories are built lazily and then reused."""
+    db = AsyncMock()
+    service = SessionService(db)
+
+    assert "session_repo" not in vars(service)
+    session_repo = service.session_repo
+    assert session_repo is service.session_repo
+    assert session_repo.db is db
+    assert "validation_log_repo" not in vars(service)
+
+
+@pytest.mark.asyncio
+async def test_latest_alignment_is_cached_by_history_id():
+    """Test the latest alignment row is loaded once per history ID."""
+    session_id = uuid4()
+    history = MagicMock()
+    history.id = uuid4()
+    history.session_id = session_id
+    history.agent_id = uuid4()
+    history.user_instruction = "Summarize the report"
+    history.past_instructions_history = None
+    history.previous_extraction_output = None
+    history.alignment_result = {"key_terms": []}
+    history.created_at = datetime(2025, 11, 18, 16, 0, tzinfo=UTC)
+    history.updated_at = history.created_at
+    get_by_id = AsyncMock(return_value=history)
+
+    for _ in range(2):
+        service = SessionService(AsyncMock())
+        service.session_repo.get_by_id = AsyncMock(return_value=MagicMock())
+        service.history_repo.get_latest_id_by_session = AsyncMock(
+            return_value=history.id
+        )
+        service.history_repo.get_by_id = get_by_id
+        result = await service.get_latest_alignment(session_id)
+        assert result["id"] == str(history.id)
+        assert result["user_instruction"] == "Summarize the report"
+
+    get_by_id.assert_awaited_once_with(history.id)
+
+
+@pytest.mark.asyncio
+async def test_list_sessions_counts_only_on_request():
+    """Test alignment history is counted only when include_counts is set."""
+    agent_id = uuid4()
+    session = _created_session(
+        {
+            "agent_id": agent_id,
+            "project_id": uuid4(),
+            "organization_id": uuid4(),
+            "status": "active",
+        }
+    )
+    service = SessionService(AsyncMock())
+    service.session_repo.get_by_agent = AsyncMock(return_value=([session], 1))
+    service.history_repo.count_by_sessions = AsyncMock(return_value={session.id: 2})
+
+    result = await service.list_sessions(agent_id)
+    assert result["items"][0]["alignment_history_count"] is None
+    service.history_repo.count_by_sessions.assert_not_called()
+
+    result = await service.list_sessions(agent_id, include_counts=True)
+    assert result["items"][0]["alignment_history_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_add_alignment_history_inserts_without_session_lookup():
+    """Test alignment history is written with one INSERT and cached."""
+    session_id = uuid4()
+    history = MagicMock()
+    history.id = uuid4()
+    history.session_id = session_id
+    history.agent_id = uuid4()
+    history.user_instruction = "Find flights"
+    history.past_instructions_history = None
+    history.previous_extraction_output = None
+    history.alignment_result = {"key_terms": []}
+    history.created_at = datetime(2025, 11, 18, 16, 0, tzinfo=UTC)
+    history.updated_at = history.created_at
+    service = SessionService(AsyncMock())
+    service.session_repo.get_by_id = AsyncMock()
+    service.history_repo.create_for_session = AsyncMock(return_value=history)
+
+    result = await service.add_alignment_history(
+        session_id, "Find flights", {"key_terms": []}
+    )
+
+    assert result["agent_id"] == str(history.agent_id)
+    assert session_service_module._alignment_history_cache.get(history.id) == result
+    service.session_repo.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_add_alignment_history_session_not_found():
+    """Test a missing session raises 404 when the INSERT returns no row."""
+    service = SessionService(AsyncMock())
+    service.history_repo.create_for_session = AsyncMock(return_value=None)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.add_alignment_history(uuid4(), "Find flights", {})
+
+    assert exc_info.value.status_code == 404
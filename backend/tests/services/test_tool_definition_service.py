@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.schemas.tool_definition import ToolRegistrationRequest
 from app.services.tool_definition_service import ToolDefinitionService
@@ -26,7 +27,6 @@ async def test_register_tools_first_registration():
     """
     # Arrange
     agent_id = uuid4()
-    user_id = uuid4()
     tool_def_id = uuid4()
     revision_id = uuid4()
 
@@ -46,13 +46,12 @@ async def test_register_tools_first_registration():
     service.tool_def_repo.get_or_create_by_agent = AsyncMock(return_value=mock_tool_def)
 
     # Mock revision creation
-    mock_revision = MagicMock()
-    mock_revision.id = revision_id
-    mock_revision.created_at = MagicMock()
-    mock_revision.created_at.isoformat = MagicMock(return_value="2025-11-18T16:00:00Z")
+    created_at = MagicMock()
+    created_at.isoformat = MagicMock(return_value="2025-11-18T16:00:00Z")
 
-    service.revision_repo.create_revision = AsyncMock(return_value=mock_revision)
-    service.tool_def_repo.update_latest_revision_id = AsyncMock(return_value=mock_tool_def)
+    service.revision_repo.create_latest_revision = AsyncMock(
+        return_value=(revision_id, created_at)
+    )
 
     request = ToolRegistrationRequest(
         tools=[
@@ -66,9 +65,7 @@ async def test_register_tools_first_registration():
     )
 
     # Act
-    response = await service.register_tools(
-        agent_id=agent_id, created_by=user_id, request=request
-    )
+    response = await service.register_tools(agent_id=agent_id, request=request)
 
     # Assert
     assert response.agent_id == str(agent_id)
@@ -79,13 +76,13 @@ async def test_register_tools_first_registration():
 
     # Verify repository calls
     service.tool_def_repo.get_or_create_by_agent.assert_called_once_with(
-        agent_id=agent_id, created_by=user_id
+        agent_id=agent_id
     )
-    service.revision_repo.create_revision.assert_called_once()
-    service.tool_def_repo.update_latest_revision_id.assert_called_once_with(
-        tool_definition_id=tool_def_id, revision_id=revision_id
+    service.revision_repo.create_latest_revision.assert_called_once_with(
+        tool_definition=mock_tool_def, tools_data={"tools": request.tools}
     )
-    mock_db.commit.assert_called_once()
+    # The caller's transaction commits, not the service
+    mock_db.commit.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -99,7 +96,6 @@ async def test_register_tools_second_registration():
     """
     # Arrange
     agent_id = uuid4()
-    user_id = uuid4()
     tool_def_id = uuid4()
     previous_revision_id = uuid4()
     new_revision_id = uuid4()
@@ -118,13 +114,12 @@ async def test_register_tools_second_registration():
     service.tool_def_repo.get_or_create_by_agent = AsyncMock(return_value=mock_tool_def)
 
     # Mock new revision creation
-    mock_revision = MagicMock()
-    mock_revision.id = new_revision_id
-    mock_revision.created_at = MagicMock()
-    mock_revision.created_at.isoformat = MagicMock(return_value="2025-11-18T16:00:00Z")
+    created_at = MagicMock()
+    created_at.isoformat = MagicMock(return_value="2025-11-18T16:00:00Z")
 
-    service.revision_repo.create_revision = AsyncMock(return_value=mock_revision)
-    service.tool_def_repo.update_latest_revision_id = AsyncMock(return_value=mock_tool_def)
+    service.revision_repo.create_latest_revision = AsyncMock(
+        return_value=(new_revision_id, created_at)
+    )
 
     request = ToolRegistrationRequest(
         tools=[
@@ -134,36 +129,32 @@ async def test_register_tools_second_registration():
     )
 
     # Act
-    response = await service.register_tools(
-        agent_id=agent_id, created_by=user_id, request=request
-    )
+    response = await service.register_tools(agent_id=agent_id, request=request)
 
     # Assert
     assert response.tools_count == 2
     assert response.previous_revision_id == str(previous_revision_id)
     assert response.revision_id == str(new_revision_id)
 
-    # Verify revision created with correct previous_revision_id
-    call_kwargs = service.revision_repo.create_revision.call_args.kwargs
-    assert call_kwargs["previous_revision_id"] == previous_revision_id
-    assert call_kwargs["agent_id"] == agent_id
+    # Verify the revision is appended to the existing tool definition
+    call_kwargs = service.revision_repo.create_latest_revision.call_args.kwargs
+    assert call_kwargs["tool_definition"] is mock_tool_def
 
 
 @pytest.mark.asyncio
-async def test_register_tools_rollback_on_error():
+async def test_register_tools_propagates_error():
     """
-    Test that transaction rolls back on error.
+    Test that errors propagate to the caller's transaction.
 
     Verifies:
     - Exception is raised
-    - Database rollback is called
+    - Service neither commits nor rolls back (the caller owns the transaction)
     """
     # Arrange
     agent_id = uuid4()
-    user_id = uuid4()
 
     mock_db = AsyncMock()
-    mock_db.commit = AsyncMock(side_effect=Exception("Database error"))
+    mock_db.commit = AsyncMock()
     mock_db.rollback = AsyncMock()
 
     service = ToolDefinitionService(mock_db)
@@ -174,21 +165,18 @@ async def test_register_tools_rollback_on_error():
 
     service.tool_def_repo.get_or_create_by_agent = AsyncMock(return_value=mock_tool_def)
 
-    mock_revision = MagicMock()
-    mock_revision.id = uuid4()
-    mock_revision.created_at = MagicMock()
-    mock_revision.created_at.isoformat = MagicMock(return_value="2025-11-18T16:00:00Z")
-
-    service.revision_repo.create_revision = AsyncMock(return_value=mock_revision)
-    service.tool_def_repo.update_latest_revision_id = AsyncMock(return_value=mock_tool_def)
+    service.revision_repo.create_latest_revision = AsyncMock(
+        side_effect=SQLAlchemyError("Database error")
+    )
 
     request = ToolRegistrationRequest(tools=[{"name": "test"}])
 
     # Act & Assert
-    with pytest.raises(Exception):
-        await service.register_tools(
-            agent_id=agent_id, created_by=user_id, request=request
-        )
+    with pytest.raises(SQLAlchemyError, match="Database error"):
+        await service.register_tools(agent_id=agent_id, request=request)
+
+    service.revision_repo.create_latest_revision.assert_awaited_once()
 
-    # Verify rollback was called
-    mock_db.rollback.assert_called_once()
+    # Verify the transaction was left to the caller
+    mock_db.commit.assert_not_called()
+    mock_db.rollback.assert_not_called()
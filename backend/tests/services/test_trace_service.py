@@ -0,0 +1,515 @@
+"""
+Trace service unit tests.
+
+Tests verify trace and observation reads and writes using mocked repositories.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.schemas.trace import TraceResponse
+from app.services import trace_service as trace_service_module
+
+STARTED_AT = datetime(2025, 11, 18, 16, 0, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start every test with empty module-level caches."""
+    trace_service_module._list_total_cache.clear()
+    yield
+    trace_service_module._list_total_cache.clear()
+
+
+def _mock_trace(ended_at=None, observation_count=0):
+    trace = MagicMock()
+    trace.id = uuid4()
+    trace.agent_id = uuid4()
+    trace.project_id = uuid4()
+    trace.organization_id = uuid4()
+    trace.status = "completed"
+    trace.started_at = STARTED_AT
+    trace.ended_at = ended_at
+    trace.trace_metadata = {}
+    trace.observation_count = observation_count
+    trace.created_at = STARTED_AT
+    trace.updated_at = STARTED_AT
+    return trace
+
+
+def _mock_observation(ended_at=None, child_count=0):
+    observation = MagicMock()
+    observation.id = uuid4()
+    observation.trace_id = uuid4()
+    observation.parent_observation_id = None
+    observation.type = "llm"
+    observation.name = "call"
+    observation.status = "completed"
+    observation.started_at = STARTED_AT
+    observation.ended_at = ended_at
+    observation.observation_metadata = {}
+    observation.child_count = child_count
+    observation.created_at = STARTED_AT
+    observation.updated_at = STARTED_AT
+    return observation
+
+
+@pytest.mark.asyncio
+async def test_list_traces_reads_stored_counts(trace_service, mock_trace_repository):
+    """
+    Test list_traces builds items from one listing query.
+
+    Verifies:
+    - Observation counts come from the stored counter
+    - Duration is computed from the trace timestamps
+    - No per-trace count or duration query is issued
+    """
+    finished = _mock_trace(
+        ended_at=STARTED_AT + timedelta(seconds=1.5), observation_count=4
+    )
+    running = _mock_trace()
+    mock_trace_repository.get_by_agent.return_value = ([finished, running], 2)
+
+    result = await trace_service.list_traces(uuid4())
+
+    assert result["total"] == 2
+    assert [item["observation_count"] for item in result["items"]] == [4, 0]
+    assert [item["duration_ms"] for item in result["items"]] == [1500, None]
+    mock_trace_repository.get_observation_count.assert_not_called()
+    mock_trace_repository.calculate_duration.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_observations_reads_stored_counts(
+    trace_service, mock_observation_repository
+):
+    """Test list_observations takes child counts from the stored counter."""
+    observation = _mock_observation(
+        ended_at=STARTED_AT + timedelta(seconds=2), child_count=3
+    )
+    mock_observation_repository.get_by_trace_id.return_value = ([observation], 1)
+
+    result = await trace_service.list_observations(uuid4())
+
+    assert result["items"][0]["child_count"] == 3
+    assert result["items"][0]["duration_ms"] == 2000
+    mock_observation_repository.get_child_count.assert_not_called()
+    mock_observation_repository.calculate_duration.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_observation_tree_is_built_from_one_query(
+    trace_service, mock_observation_repository
+):
+    """Test the tree is built from the loaded rows without per-node queries."""
+    root = _mock_observation(ended_at=STARTED_AT + timedelta(seconds=1), child_count=2)
+    children = [_mock_observation(), _mock_observation()]
+    for child in children:
+        child.trace_id = root.trace_id
+        child.parent_observation_id = root.id
+    mock_observation_repository.get_tree_by_trace_id.return_value = [
+        root,
+        *children,
+    ]
+
+    tree = await trace_service.get_observation_tree(root.trace_id)
+
+    assert len(tree) == 1
+    assert tree[0]["child_count"] == 2
+    assert tree[0]["duration_ms"] == 1000
+    assert len(tree[0]["children"]) == 2
+    mock_observation_repository.get_child_count.assert_not_called()
+    mock_observation_repository.calculate_duration.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_observation_tree_attaches_children_loaded_first(
+    trace_service, mock_observation_repository
+):
+    """Test children ordered before their parent are nested and orphans dropped."""
+    root = _mock_observation()
+    child = _mock_observation()
+    child.parent_observation_id = root.id
+    grandchild = _mock_observation()
+    grandchild.parent_observation_id = child.id
+    orphan = _mock_observation()
+    orphan.parent_observation_id = uuid4()
+    mock_observation_repository.get_tree_by_trace_id.return_value = [
+        grandchild,
+        orphan,
+        child,
+        root,
+    ]
+
+    tree = await trace_service.get_observation_tree(root.trace_id)
+
+    assert [node["id"] for node in tree] == [root.id]
+    assert tree[0]["children"][0]["id"] == child.id
+    assert tree[0]["children"][0]["children"][0]["id"] == grandchild.id
+
+
+@pytest.mark.asyncio
+async def test_get_trace_reads_one_row(trace_service, mock_trace_repository):
+    """Test get_trace takes the observation count from the trace row."""
+    trace = _mock_trace(ended_at=STARTED_AT + timedelta(seconds=3), observation_count=5)
+    mock_trace_repository.get_by_id.return_value = trace
+
+    result = await trace_service.get_trace(trace.id)
+
+    assert result["observation_count"] == 5
+    assert result["duration_ms"] == 3000
+    mock_trace_repository.get_observation_count.assert_not_called()
+    mock_trace_repository.calculate_duration.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_trace_not_found(trace_service, mock_trace_repository):
+    """Test a missing trace raises 404."""
+    mock_trace_repository.get_by_id.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await trace_service.get_trace(uuid4())
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_trace_with_membership(trace_service, mock_trace_repository):
+    """Test the trace and membership flag come from one repository call."""
+    trace = _mock_trace()
+    user_id = uuid4()
+    mock_trace_repository.get_with_membership.return_value = (trace, False)
+
+    result, is_member = await trace_service.get_trace_with_membership(trace.id, user_id)
+
+    assert result["id"] == trace.id
+    assert is_member is False
+    mock_trace_repository.get_with_membership.assert_awaited_once_with(
+        trace.id, user_id
+    )
+    mock_trace_repository.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_trace_with_membership_not_found(
+    trace_service, mock_trace_repository
+):
+    """Test a missing trace raises 404."""
+    mock_trace_repository.get_with_membership.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await trace_service.get_trace_with_membership(uuid4(), uuid4())
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_create_trace_returns_inserted_row(
+    trace_service, mock_trace_repository, mock_agent_repository
+):
+    """Test create_trace builds the response without re-reading the trace."""
+    trace = _mock_trace()
+    mock_agent_repository.get_project_org.return_value = (uuid4(), uuid4())
+    mock_trace_repository.create.return_value = trace
+
+    result = await trace_service.create_trace(trace.agent_id, "running", {})
+
+    assert result["id"] == trace.id
+    assert result["observation_count"] == 0
+    mock_trace_repository.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_trace_copies_agent_ownership(
+    trace_service, mock_trace_repository, mock_agent_repository
+):
+    """Test the trace takes the agent's project and organization."""
+    agent_id = uuid4()
+    project_id, organization_id = uuid4(), uuid4()
+    mock_agent_repository.get_project_org.return_value = (project_id, organization_id)
+    mock_trace_repository.create.return_value = _mock_trace()
+
+    await trace_service.create_trace(agent_id, "running", {})
+
+    mock_agent_repository.get_project_org.assert_awaited_once_with(agent_id)
+    trace_data = mock_trace_repository.create.await_args.args[0]
+    assert trace_data["project_id"] == project_id
+    assert trace_data["organization_id"] == organization_id
+
+
+@pytest.mark.asyncio
+async def test_create_trace_agent_not_found(trace_service, mock_agent_repository):
+    """Test a missing agent raises 404."""
+    mock_agent_repository.get_project_org.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await trace_service.create_trace(uuid4(), "running", {})
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_update_trace_uses_returned_row(trace_service, mock_trace_repository):
+    """Test update_trace builds the response from the UPDATE result."""
+    trace = _mock_trace(ended_at=STARTED_AT + timedelta(seconds=1), observation_count=2)
+    mock_trace_repository.update_returning.return_value = trace
+
+    result = await trace_service.update_trace(trace.id, status="completed")
+
+    mock_trace_repository.update_returning.assert_awaited_once_with(
+        trace.id, {"status": "completed"}
+    )
+    assert result["observation_count"] == 2
+    assert result["duration_ms"] == 1000
+    mock_trace_repository.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_observation_increments_counters(
+    trace_service, mock_trace_repository, mock_observation_repository
+):
+    """Test creating a child observation bumps the trace and parent counters."""
+    trace_id = uuid4()
+    parent = _mock_observation()
+    parent.trace_id = trace_id
+    observation = _mock_observation()
+    mock_observation_repository.validate_create.return_value = (True, trace_id)
+    mock_observation_repository.create.return_value = observation
+
+    result = await trace_service.create_observation(
+        trace_id, "llm", "call", "running", {}, parent_observation_id=parent.id
+    )
+
+    assert result["child_count"] == 0
+    mock_trace_repository.increment_observation_count.assert_awaited_once_with(trace_id)
+    mock_observation_repository.increment_child_count.assert_awaited_once_with(
+        parent.id
+    )
+    mock_observation_repository.validate_create.assert_awaited_once_with(
+        trace_id, parent.id
+    )
+    mock_trace_repository.get_by_id.assert_not_called()
+    mock_observation_repository.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_observation_rejects_parent_from_other_trace(
+    trace_service, mock_observation_repository
+):
+    """Test a parent observation from another trace raises 400."""
+    mock_observation_repository.validate_create.return_value = (True, uuid4())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await trace_service.create_observation(
+            uuid4(), "llm", "call", "running", {}, parent_observation_id=uuid4()
+        )
+
+    assert exc_info.value.status_code == 400
+    mock_observation_repository.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_observations_bulk_inserts_once(
+    trace_service, mock_trace_repository, mock_observation_repository
+):
+    """Test a batch is validated and inserted once with aggregated counters."""
+    trace_id = uuid4()
+    parent_id = uuid4()
+    created = [_mock_observation(), _mock_observation(), _mock_observation()]
+    mock_observation_repository.validate_bulk_create.return_value = (
+        True,
+        {parent_id: trace_id},
+    )
+    mock_observation_repository.bulk_create.return_value = created
+
+    result = await trace_service.create_observations_bulk(
+        trace_id,
+        [
+            {"type": "llm", "name": "a", "parent_observation_id": parent_id},
+            {"type": "tool", "name": "b", "parent_observation_id": parent_id},
+            {"type": "agent", "name": "c", "started_at": STARTED_AT},
+        ],
+    )
+
+    assert [item["id"] for item in result] == [obs.id for obs in created]
+    mock_observation_repository.validate_bulk_create.assert_awaited_once_with(
+        trace_id, {parent_id}
+    )
+    rows = mock_observation_repository.bulk_create.await_args.args[0]
+    assert [row["status"] for row in rows] == ["pending"] * 3
+    assert "started_at" not in rows[0]
+    assert rows[2]["started_at"] == STARTED_AT
+    mock_trace_repository.increment_observation_count.assert_awaited_once_with(
+        trace_id, 3
+    )
+    mock_observation_repository.increment_child_count.assert_awaited_once_with(
+        parent_id, 2
+    )
+    mock_observation_repository.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_observations_bulk_resolves_parents_in_batch(
+    trace_service, mock_observation_repository
+):
+    """Test a parent earlier in the batch is counted without a DB lookup."""
+    trace_id = uuid4()
+    root_id = uuid4()
+    mock_observation_repository.validate_bulk_create.return_value = (True, {})
+    mock_observation_repository.bulk_create.return_value = [_mock_observation()] * 3
+
+    await trace_service.create_observations_bulk(
+        trace_id,
+        [
+            {"id": root_id, "type": "agent", "name": "root"},
+            {"type": "llm", "name": "a", "parent_observation_id": root_id},
+            {"type": "tool", "name": "b", "parent_observation_id": root_id},
+        ],
+    )
+
+    mock_observation_repository.validate_bulk_create.assert_awaited_once_with(
+        trace_id, set()
+    )
+    rows = mock_observation_repository.bulk_create.await_args.args[0]
+    assert rows[0]["id"] == root_id
+    assert [row["child_count"] for row in rows] == [2, 0, 0]
+    mock_observation_repository.increment_child_count.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_observations_bulk_rejects_child_before_parent(
+    trace_service, mock_observation_repository
+):
+    """Test a child listed before its in-batch parent raises 400."""
+    root_id = uuid4()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await trace_service.create_observations_bulk(
+            uuid4(),
+            [
+                {"type": "llm", "name": "a", "parent_observation_id": root_id},
+                {"id": root_id, "type": "agent", "name": "root"},
+            ],
+        )
+
+    assert exc_info.value.status_code == 400
+    mock_observation_repository.bulk_create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_observations_bulk_missing_parent(
+    trace_service, mock_observation_repository
+):
+    """Test a batch referencing an unknown parent raises 404 before inserting."""
+    mock_observation_repository.validate_bulk_create.return_value = (True, {})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await trace_service.create_observations_bulk(
+            uuid4(),
+            [{"type": "llm", "name": "a", "parent_observation_id": uuid4()}],
+        )
+
+    assert exc_info.value.status_code == 404
+    mock_observation_repository.bulk_create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_observation_not_found(trace_service, mock_observation_repository):
+    """Test updating a missing observation raises 404."""
+    mock_observation_repository.update_returning.return_value = None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await trace_service.update_observation(uuid4(), status="completed")
+
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_trace_timestamps_are_left_for_response_rendering(
+    trace_service, mock_trace_repository
+):
+    """Test timestamps are returned as datetimes and validate as TraceResponse."""
+    trace = _mock_trace()
+    mock_trace_repository.get_by_id.return_value = trace
+
+    result = await trace_service.get_trace(trace.id)
+
+    assert result["started_at"] is STARTED_AT
+    assert result["ended_at"] is None
+    assert TraceResponse.model_validate(result).started_at == STARTED_AT
+
+
+@pytest.mark.asyncio
+async def test_create_trace_leaves_started_at_to_database(
+    trace_service, mock_trace_repository, mock_agent_repository
+):
+    """Test started_at is only sent when the caller provides it."""
+    mock_agent_repository.get_project_org.return_value = (uuid4(), uuid4())
+    mock_trace_repository.create.return_value = _mock_trace()
+
+    await trace_service.create_trace(uuid4(), "running", {})
+    await trace_service.create_trace(uuid4(), "running", {}, started_at=STARTED_AT)
+
+    first, second = mock_trace_repository.create.await_args_list
+    assert "started_at" not in first.args[0]
+    assert second.args[0]["started_at"] == STARTED_AT
+
+
+@pytest.mark.asyncio
+async def test_list_traces_returns_next_cursor(trace_service, mock_trace_repository):
+    """Test a full page returns a cursor that resumes after its last trace."""
+    traces = [_mock_trace(), _mock_trace()]
+    mock_trace_repository.get_by_agent.return_value = (traces, 5)
+
+    first_page = await trace_service.list_traces(uuid4(), page_size=2)
+    await trace_service.list_traces(
+        uuid4(), page_size=2, cursor=first_page["next_cursor"]
+    )
+
+    cursor = mock_trace_repository.get_by_agent.await_args.kwargs["cursor"]
+    assert cursor == (traces[-1].started_at, traces[-1].id)
+
+
+@pytest.mark.asyncio
+async def test_list_traces_last_page_has_no_cursor(
+    trace_service, mock_trace_repository
+):
+    """Test a short page ends pagination."""
+    mock_trace_repository.get_by_agent.return_value = ([_mock_trace()], 1)
+
+    result = await trace_service.list_traces(uuid4(), page_size=2)
+
+    assert result["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_observations_rejects_malformed_cursor(trace_service):
+    """Test a malformed cursor raises 400."""
+    with pytest.raises(HTTPException) as exc_info:
+        await trace_service.list_observations(uuid4(), cursor="not a cursor")
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_traces_counts_only_on_request(trace_service, mock_trace_repository):
+    """Test total is None by default and counted once when requested."""
+    agent_id = uuid4()
+    mock_trace_repository.get_by_agent.return_value = ([_mock_trace()], None)
+
+    result = await trace_service.list_traces(agent_id)
+    assert result["total"] is None
+    assert not mock_trace_repository.get_by_agent.await_args.kwargs["include_total"]
+
+    mock_trace_repository.get_by_agent.return_value = ([_mock_trace()], 7)
+    result = await trace_service.list_traces(agent_id, include_total=True)
+    assert result["total"] == 7
+
+    mock_trace_repository.get_by_agent.return_value = ([_mock_trace()], None)
+    result = await trace_service.list_traces(agent_id, page=2, include_total=True)
+    assert result["total"] == 7
+    assert not mock_trace_repository.get_by_agent.await_args.kwargs["include_total"]
@@ -36,7 +36,7 @@ async def test_get_user_success(
 
     Verifies:
     - User data returned with all relations
-    - Status flags included (active, archived)
+    - Status flags read from the loaded status rows (active, archived)
     """
     # Arrange
     user_id = uuid4()
@@ -46,8 +46,9 @@ async def test_get_user_success(
     )
     org_data = OrganizationDataFactory.build(org_id=org_id)
 
-    # Mock user lookup
+    # Mock user lookup (active, not archived)
     mock_user = build_mock_user_model(user_data)
+    mock_user.archive = None
     mock_user_repository.get_by_id_with_relations.return_value = mock_user
 
     # Mock organization membership
@@ -56,10 +57,6 @@ async def test_get_user_success(
         mock_org
     ]
 
-    # Mock status checks
-    mock_user_status_repository.is_active.return_value = True
-    mock_user_status_repository.is_archived.return_value = False
-
     # Act
     result = await user_service.get_user(user_id)
 
@@ -73,8 +70,8 @@ async def test_get_user_success(
 
     # Verify repository calls
     mock_user_repository.get_by_id_with_relations.assert_called_once_with(user_id)
-    mock_user_status_repository.is_active.assert_called_once_with(user_id)
-    mock_user_status_repository.is_archived.assert_called_once_with(user_id)
+    mock_user_status_repository.is_active.assert_not_called()
+    mock_user_status_repository.is_archived.assert_not_called()
 
 
 # ============================================================================
@@ -125,7 +122,7 @@ async def test_update_profile_success(
 
     Verifies:
     - Profile updated with new data
-    - User data returned after update
+    - User data built from the loaded rows, without re-reading the user
     - Database transaction committed
     """
     # Arrange
@@ -141,20 +138,16 @@ async def test_update_profile_success(
         "avatar_url": "https://example.com/new-avatar.png",
     }
 
-    # Mock user existence
+    # Mock user existence (profile loaded with the user)
     mock_user = build_mock_user_model(user_data)
-    mock_user_repository.get_by_id.return_value = mock_user
+    mock_user.archive = None
+    mock_user_repository.get_many_with_relations.return_value = [mock_user]
 
-    # Mock profile exists
-    mock_profile = AsyncMock()
-    mock_user_profile_repository.get_by_user_id.return_value = mock_profile
-    mock_user_profile_repository.update_profile.return_value = AsyncMock()
-
-    # Mock get_user for return value
+    # Mock updated profile
     updated_user_data = user_data.copy()
     updated_user_data.update(profile_update)
-    mock_updated_user = build_mock_user_model(updated_user_data)
-    mock_user_repository.get_by_id_with_relations.return_value = mock_updated_user
+    mock_updated_profile = build_mock_user_model(updated_user_data).profile
+    mock_user_profile_repository.update_profile.return_value = mock_updated_profile
 
     mock_org = build_mock_organization_model(
         OrganizationDataFactory.build(org_id=org_id)
@@ -171,13 +164,16 @@ async def test_update_profile_success(
     # Assert
     assert result is not None
     assert result["name"] == "New Name"
+    assert result["is_active"] is True
+    assert result["is_archived"] is False
 
     # Verify repository calls
-    mock_user_repository.get_by_id.assert_called_once_with(user_id)
-    mock_user_profile_repository.get_by_user_id.assert_called_once_with(user_id)
+    mock_user_repository.get_many_with_relations.assert_called_once_with([user_id])
     mock_user_profile_repository.update_profile.assert_called_once_with(
         user_id, profile_update
     )
+    mock_user_repository.get_by_id_with_relations.assert_not_called()
+    mock_user_status_repository.is_active.assert_not_called()
     mock_db_session.commit.assert_called_once()
 
 
@@ -273,3 +269,254 @@ async def test_change_password_wrong_old_password(
 
     # Verify update not called
     mock_user_auth_repository.update_password.assert_not_called()
+
+
+# ============================================================================
+# Test: list_users_in_organization() - Relations loaded with the list
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_list_users_in_organization_single_query(
+    user_service, mock_user_repository, mock_user_status_repository
+):
+    """
+    Test listing organization users without per-user lookups.
+
+    Verifies:
+    - limit and offset are passed by keyword
+    - Status flags come from the loaded relations
+    - No per-user repository calls are made
+    """
+    # Arrange
+    org_id = uuid4()
+    active_user = build_mock_user_model(UserDataFactory.build(name="Active"))
+    active_user.archive = None
+    archived_user = build_mock_user_model(UserDataFactory.build(name="Archived"))
+    archived_user.active_status = None
+    mock_user_repository.list_by_organization.return_value = [
+        active_user,
+        archived_user,
+    ]
+
+    # Act
+    result = await user_service.list_users_in_organization(org_id, 10, 20)
+
+    # Assert
+    assert [user["name"] for user in result] == ["Active", "Archived"]
+    assert [user["is_active"] for user in result] == [True, False]
+    assert [user["is_archived"] for user in result] == [False, True]
+    mock_user_repository.list_by_organization.assert_awaited_once_with(
+        org_id, include_inactive=True, limit=10, offset=20
+    )
+    mock_user_repository.get_by_id_with_relations.assert_not_called()
+    mock_user_status_repository.is_active.assert_not_called()
+    mock_user_status_repository.is_archived.assert_not_called()
+
+
+# ============================================================================
+# Test: search_users_by_name() - Users loaded in one batch
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_search_users_by_name_loads_users_once(
+    user_service, mock_user_repository, mock_user_profile_repository
+):
+    """
+    Test searching users loads all matches with a single repository call.
+
+    Verifies:
+    - Matching profiles' users are fetched together, in profile order
+    - get_user is not called per match
+    """
+    # Arrange
+    users = [
+        build_mock_user_model(UserDataFactory.build(name=name))
+        for name in ("Alice", "Alicia")
+    ]
+    profiles = [AsyncMock(user_id=user.id) for user in users]
+    mock_user_profile_repository.search_by_name.return_value = profiles
+    mock_user_repository.get_many_with_relations.return_value = users
+
+    # Act
+    result = await user_service.search_users_by_name("Ali")
+
+    # Assert
+    assert [user["name"] for user in result] == ["Alice", "Alicia"]
+    mock_user_repository.get_many_with_relations.assert_awaited_once_with(
+        [user.id for user in users]
+    )
+    mock_user_repository.get_by_id_with_relations.assert_not_called()
+
+
+# ============================================================================
+# Test: get_user_organizations() - Ownership checked in one query
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_user_organizations_checks_ownership_once(
+    user_service,
+    mock_user_repository,
+    mock_organization_member_repository,
+    mock_organization_owner_repository,
+):
+    """
+    Test organization roles come from a single ownership lookup.
+
+    Verifies:
+    - Owned organizations get the owner role, others the member role
+    - Ownership is not checked per organization
+    """
+    # Arrange
+    user_id = uuid4()
+    owned, joined = (
+        build_mock_organization_model(OrganizationDataFactory.build(name=name))
+        for name in ("Owned Org", "Joined Org")
+    )
+    mock_user_repository.get_by_id.return_value = AsyncMock(id=user_id)
+    mock_organization_member_repository.list_organizations_for_user.return_value = [
+        owned,
+        joined,
+    ]
+    mock_organization_owner_repository.list_owned_organization_ids.return_value = {
+        owned.id
+    }
+
+    # Act
+    result = await user_service.get_user_organizations(user_id)
+
+    # Assert
+    assert [org["role"] for org in result] == ["owner", "member"]
+    list_owned = mock_organization_owner_repository.list_owned_organization_ids
+    list_owned.assert_awaited_once_with(user_id, [owned.id, joined.id])
+    mock_organization_owner_repository.is_owner.assert_not_called()
+
+
+# ============================================================================
+# Test: unarchive_user() - Not archived
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_unarchive_user_not_archived(
+    user_service, mock_user_status_repository, mock_db_session
+):
+    """
+    Test unarchiving a user that is not archived raises 400.
+
+    Verifies:
+    - The combined transition is attempted once
+    - Nothing is committed
+    """
+    # Arrange
+    user_id = uuid4()
+    mock_user_status_repository.unarchive_and_activate.return_value = False
+
+    # Act
+    with pytest.raises(HTTPException) as exc_info:
+        await user_service.unarchive_user(user_id)
+
+    # Assert
+    assert exc_info.value.status_code == 400
+    mock_user_status_repository.unarchive_and_activate.assert_awaited_once_with(user_id)
+    mock_db_session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unarchive_user_success(
+    user_service, mock_user_repository, mock_user_status_repository, mock_db_session
+):
+    """
+    Test unarchiving builds the response from the user loaded beforehand.
+
+    Verifies:
+    - The user is loaded once, before the transition
+    - The response reports the user as active and not archived
+    """
+    # Arrange
+    user_data = UserDataFactory.build(name="Restored User")
+    mock_user_repository.get_by_id_with_relations.return_value = build_mock_user_model(
+        user_data
+    )
+    mock_user_status_repository.unarchive_and_activate.return_value = True
+
+    # Act
+    result = await user_service.unarchive_user(user_data["id"])
+
+    # Assert
+    assert result["name"] == "Restored User"
+    assert result["is_active"] is True
+    assert result["is_archived"] is False
+    mock_user_repository.get_by_id_with_relations.assert_awaited_once_with(
+        user_data["id"]
+    )
+    mock_db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unarchive_user_not_found(
+    user_service, mock_user_repository, mock_user_status_repository
+):
+    """Test unarchiving a missing user raises 404 without changing status."""
+    # Arrange
+    mock_user_repository.get_by_id_with_relations.return_value = None
+
+    # Act
+    with pytest.raises(HTTPException) as exc_info:
+        await user_service.unarchive_user(uuid4())
+
+    # Assert
+    assert exc_info.value.status_code == 404
+    mock_user_status_repository.unarchive_and_activate.assert_not_called()
+
+
+# ============================================================================
+# Test: change_email() - Uniqueness checked in the UPDATE
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_change_email_success(
+    user_service, mock_user_auth_repository, mock_db_session
+):
+    """
+    Test changing email issues only the guarded UPDATE.
+
+    Verifies:
+    - No separate existence check is made
+    - The change is committed
+    """
+    # Arrange
+    user_id = uuid4()
+    mock_user_auth_repository.update_email_if_unique.return_value = True
+
+    # Act
+    result = await user_service.change_email(user_id, "new@example.com")
+
+    # Assert
+    assert result is True
+    mock_user_auth_repository.update_email_if_unique.assert_awaited_once_with(
+        user_id, "new@example.com"
+    )
+    mock_user_auth_repository.email_exists.assert_not_called()
+    mock_db_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_change_email_already_in_use(
+    user_service, mock_user_auth_repository, mock_db_session
+):
+    """Test a rejected UPDATE for a taken email raises 400."""
+    # Arrange
+    mock_user_auth_repository.update_email_if_unique.return_value = False
+    mock_user_auth_repository.email_exists.return_value = True
+
+    # Act
+    with pytest.raises(HTTPException) as exc_info:
+        await user_service.change_email(uuid4(), "taken@example.com")
+
+    # Assert
+    assert exc_info.value.status_code == 400
+    mock_db_session.commit.assert_not_called()
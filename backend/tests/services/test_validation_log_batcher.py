@@ -0,0 +1,123 @@
+"""
+Validation log batcher unit tests.
+
+Tests verify that queued rows are grouped into batches and flushed on
+size, interval, and shutdown, with the database flush mocked out, and that
+validation logs keep their queue order within a batch.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.services.safety_service import SafetyService
+from app.services.validation_log_batcher import ValidationLogBatcher
+
+
+@pytest.mark.asyncio
+async def test_flushes_full_batch_immediately():
+    """Test that a full batch is flushed without waiting for the interval."""
+    batcher = ValidationLogBatcher(batch_size=2, flush_interval=10)
+    batcher._flush = AsyncMock()
+
+    await batcher.enqueue({"n": 1})
+    await batcher.enqueue({"n": 2})
+    await asyncio.sleep(0.01)
+
+    batcher._flush.assert_awaited_once_with([{"n": 1}, {"n": 2}])
+    await batcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_interval():
+    """Test that a partial batch is flushed once the interval elapses."""
+    batcher = ValidationLogBatcher(batch_size=100, flush_interval=0.01)
+    batcher._flush = AsyncMock()
+
+    await batcher.enqueue({"n": 1})
+    await asyncio.sleep(0.05)
+
+    batcher._flush.assert_awaited_once_with([{"n": 1}])
+    await batcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_flushes_pending_rows():
+    """Test that shutdown flushes rows still waiting in the queue."""
+    batcher = ValidationLogBatcher(batch_size=100, flush_interval=10)
+    batcher._flush = AsyncMock()
+
+    await batcher.enqueue({"n": 1})
+    await batcher.enqueue({"n": 2})
+    await batcher.shutdown()
+
+    batcher._flush.assert_awaited_once_with([{"n": 1}, {"n": 2}])
+
+
+@pytest.mark.asyncio
+async def test_shutdown_without_worker_is_noop():
+    """Test that shutdown before any enqueue does nothing."""
+    batcher = ValidationLogBatcher()
+    batcher._flush = AsyncMock()
+
+    await batcher.shutdown()
+
+    batcher._flush.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_writes_inline():
+    """Test that rows are written inline when the queue is full."""
+    batcher = ValidationLogBatcher(batch_size=100, flush_interval=10, max_queue_size=1)
+    batcher._flush = AsyncMock()
+
+    await batcher.enqueue({"n": 1})
+    await batcher.enqueue({"n": 2})
+
+    batcher._flush.assert_awaited_once_with([{"n": 2}])
+    await batcher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_logs_in_one_batch_keep_queue_order():
+    """Test that logs flushed in one batch still sort in the order queued."""
+    batcher = ValidationLogBatcher(batch_size=2, flush_interval=10)
+    batcher._flush = AsyncMock()
+    service = SafetyService(MagicMock())
+    started = datetime(2026, 1, 1, tzinfo=UTC)
+    ids = {
+        "session_id": uuid4(),
+        "agent_id": uuid4(),
+        "project_id": uuid4(),
+        "organization_id": uuid4(),
+    }
+
+    with (
+        patch("app.services.safety_service.validation_log_batcher", batcher),
+        patch("app.services.safety_service.datetime") as mock_datetime,
+    ):
+        mock_datetime.now.side_effect = [started, started + timedelta(microseconds=1)]
+        for timing in ("on_start", "on_end"):
+            await service._save_validation_log(
+                **ids,
+                trace_id=None,
+                process_name="search",
+                process_type="tool",
+                timing=timing,
+                context={},
+                should_proceed=True,
+                is_registered_tool=True,
+                triggered_guardrails=[],
+                metadata={},
+            )
+        await asyncio.sleep(0.01)
+
+    batcher._flush.assert_awaited_once()
+    (rows,) = batcher._flush.await_args.args
+    # History is read newest first, by created_at alone
+    newest_first = sorted(rows, key=lambda row: row["created_at"], reverse=True)
+    assert [row["log_data"]["timing"] for row in newest_first] == ["on_end", "on_start"]
+    await batcher.shutdown()
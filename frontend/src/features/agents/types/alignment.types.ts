@@ -421,6 +421,11 @@ export interface SessionData {
    */
   validation_history: ValidationHistoryEntry[];
 
+  /**
+   * Total number of validation history entries (across all pages)
+   */
+  validation_history_total: number;
+
   /**
    * History of user instructions in this session
    */
@@ -29,6 +29,7 @@ export const traceService = {
       status?: string;
       start_date?: string;
       end_date?: string;
+      cursor?: string;
     }
   ): Promise<TraceListResponse> {
     const queryParams = new URLSearchParams();
@@ -39,6 +40,7 @@ export const traceService = {
     if (params?.status) queryParams.append('status', params.status);
     if (params?.start_date) queryParams.append('start_date', params.start_date);
     if (params?.end_date) queryParams.append('end_date', params.end_date);
+    if (params?.cursor) queryParams.append('cursor', params.cursor);
 
     const query = queryParams.toString();
     const endpoint = query
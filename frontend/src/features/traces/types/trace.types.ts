@@ -35,9 +35,10 @@ export interface Trace {
  */
 export interface TraceListResponse {
   items: Trace[];
-  total: number;
+  total: number | null;
   page: number;
   page_size: number;
+  next_cursor: string | null;
 }
 
 /**